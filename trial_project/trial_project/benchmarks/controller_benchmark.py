@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite for InternshipController.
+
+Seeds a scratch database (trial_db_bench by default) with the synthetic
+data generator, then times every controller read/write method without opening any
+Tk window and prints JSON results that can be diffed across commits.
+
+Usage: python benchmarks/controller_benchmark.py [--backend mysql|sqlite] [--preset medium]
+           [--applications N ...] [--report-texts 2000] [--repeat 5] [--output results.json] [--skip-seed]
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.config.db_config import DB_CONFIG
+from trial_project.models.backend import BACKENDS
+from trial_project.models import minhash
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.query_metrics import metrics
+from trial_project.models.report_indexer import ReportIndexer
+from trial_project.models.report_store import ReportStore
+from trial_project.models.text_extraction import terms
+from trial_project.models.synthetic_data import SyntheticDataGenerator, PRESETS, SYNTHETIC_PASSWORD, EMAIL_DOMAIN
+from trial_project.controllers.internship_controller import InternshipController
+
+
+ID_COLUMNS = {'students': 'student_id', 'faculties': 'faculty_id', 'secretaries': 'secretary_id',
+              'companies': 'company_id', 'quotas': 'quota_id', 'applications': 'app_id', 'reports': 'report_id'}
+
+# Controller methods that only drive Tk windows or dialogs
+UI_METHODS = {'start_application', 'login', 'on_login_result', 'on_login_error', 'register',
+              'show_dashboard', 'logout', 'cleanup'}
+
+
+def bench_config(backend: str, db_name: str) -> dict:
+    """Connection config of the scratch database; SQLite uses db_name.db"""
+    if backend == 'sqlite':
+        return {'database': f"{db_name}.db"}
+    return {**DB_CONFIG, 'database': db_name}
+
+
+def create_bench_database(backend: str, db_name: str):
+    """Create an empty scratch database"""
+    if backend == 'sqlite':
+        for suffix in ('', '-wal', '-shm'):
+            Path(f"{db_name}.db{suffix}").unlink(missing_ok=True)
+        return
+
+    import mysql.connector
+    server_config = {k: v for k, v in DB_CONFIG.items() if k != 'database'}
+    connection = mysql.connector.connect(**server_config)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS {db_name}")
+    cursor.execute(f"CREATE DATABASE {db_name}")
+    connection.close()
+
+
+# Generated report texts; every NEAR_DUPLICATE_EVERY-th one is an earlier
+# report with one word in 50 changed, so similarity lookups have pairs to find
+REPORT_WORDS = 400
+NEAR_DUPLICATE_EVERY = 10
+
+
+def report_text(rng: random.Random, vocabulary, earlier) -> str:
+    if earlier and rng.randrange(NEAR_DUPLICATE_EVERY) == 0:
+        words = rng.choice(earlier).split()
+        for position in rng.sample(range(len(words)), len(words) // 50):
+            words[position] = rng.choice(vocabulary)
+        return ' '.join(words)
+    return ' '.join(rng.choice(vocabulary) for _ in range(REPORT_WORDS))
+
+
+def seed_report_texts(model: DatabaseModel, rng: random.Random, count: int):
+    """Give up to `count` generated reports an indexed, signed text, as if each had been uploaded"""
+    # The generator only writes report rows; there are no files behind them
+    reports = model._fetch_all("SELECT report_id, app_id FROM reports ORDER BY report_id LIMIT %s", (count,))
+    syllables = ['ka', 'lo', 'mi', 'ne', 'su', 'ta', 'ri', 'po', 'de', 'an', 'vel', 'tor', 'sim', 'gra']
+    vocabulary = sorted({''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(3000)})
+    texts = []
+    for _ in reports:
+        texts.append(report_text(rng, vocabulary, texts))
+    hashes = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+    with model.pool.cursor(commit=True) as cursor:
+        cursor.executemany("INSERT IGNORE INTO report_files (sha256, size_bytes, mime_type) VALUES (%s, %s, %s)",
+                           [(sha256, len(text.encode()), 'text/plain') for sha256, text in zip(hashes, texts)])
+        cursor.executemany("UPDATE applications SET report_sha256 = %s, report_filename = %s WHERE app_id = %s",
+                           [(sha256, f"report-{report['report_id']}.txt", report['app_id'])
+                            for sha256, report in zip(hashes, reports)])
+    for sha256, text in zip(hashes, texts):
+        model.save_report_text(sha256, text, terms(text), signature=minhash.signature(text))
+
+
+def id_ranges(cursor, tables):
+    """table -> (lowest id, highest id)"""
+    ranges = {}
+    for table in tables:
+        cursor.execute(f"SELECT MIN({ID_COLUMNS[table]}) AS first, MAX({ID_COLUMNS[table]}) AS last FROM {table}")
+        row = cursor.fetchone()
+        ranges[table] = (row['first'] or 0, row['last'] or 0)
+    return ranges
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def result_size(result):
+    """Row count of a method result (pages count their rows)"""
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[0], list):
+        return len(result[0])
+    if isinstance(result, list):
+        return len(result)
+    return 1 if result else 0
+
+
+def time_case(func, repeat: int):
+    """Run func(i) once to warm up, then `repeat` times; return timing stats in ms"""
+    func(-1)
+    samples, rows = [], 0
+    for i in range(repeat):
+        started = time.perf_counter()
+        result = func(i)
+        samples.append((time.perf_counter() - started) * 1000)
+        rows = result_size(result)
+    return {
+        'n': repeat,
+        'min_ms': round(min(samples), 3),
+        'median_ms': round(percentile(samples, 50), 3),
+        'p95_ms': round(percentile(samples, 95), 3),
+        'max_ms': round(max(samples), 3),
+        'rows': rows,
+    }
+
+
+def build_cases(controller: InternshipController, ids: dict, rng: random.Random, upload_dir: str):
+    """name -> func(iteration) for every data method on the controller"""
+    pick = lambda table: rng.randint(*ids[table])
+    department = controller.get_all_departments()[0]
+    since = datetime.now() - timedelta(minutes=1)
+    unique = lambda prefix, i: f"{prefix}-{time.time_ns()}-{i}@bench.local"
+
+    first_quota_page = controller.get_available_quotas_page(None)
+    first_browse_page = controller.browse_quotas()
+    first_pending_page = controller.get_pending_applications_page()
+
+    # Reports sharing an LSH bucket with another (so a lookup has candidates to
+    # compare), and the department whose students wrote most of the signed reports
+    model = controller.model
+    signed = model._fetch_all("""
+        SELECT r.report_id, s.department_id, EXISTS (
+            SELECT 1
+            FROM report_lsh_buckets mine
+            JOIN report_lsh_buckets other ON other.band = mine.band AND other.bucket = mine.bucket
+            WHERE mine.sha256 = a.report_sha256 AND other.sha256 <> mine.sha256
+        ) AS has_candidates
+        FROM reports r
+        JOIN applications a ON r.app_id = a.app_id
+        JOIN students s ON r.student_id = s.student_id
+        JOIN report_signatures sig ON sig.sha256 = a.report_sha256
+    """)
+    similar_ids = ([report['report_id'] for report in signed if report['has_candidates']]
+                   or [report['report_id'] for report in signed] or [0])
+    departments = [report['department_id'] for report in signed]
+    signed_department = max(set(departments), key=departments.count) if departments else department['department_id']
+    uploaders = [row['student_id'] for row in model._fetch_all(
+        "SELECT DISTINCT student_id FROM applications WHERE status IN ('approved', 'completed') LIMIT 1000")]
+
+    def upload(i):
+        # A new file every run, so each upload is hashed and stored rather than deduplicated
+        path = Path(upload_dir) / f"report-{i}.txt"
+        path.write_text(f"Internship report {time.time_ns()} {i}\n" + "weekly progress notes " * 2000,
+                        encoding='utf-8')
+        return controller.upload_report(rng.choice(uploaders), str(path))
+
+    def create_and_delete(create, find, delete):
+        def run(i):
+            email = unique('tmp', i)
+            create(email)
+            return delete(find(email))
+        return run
+
+    find_id = lambda table, column: (lambda email: model._fetch_one(
+        f"SELECT {column} FROM {table} WHERE email = %s", (email,))[column])
+
+    return {
+        # Reference data
+        'get_all_departments': lambda i: controller.get_all_departments(),
+        'get_department_names': lambda i: controller.get_department_names(),
+        'get_faculty_users': lambda i: controller.get_faculty_users(),
+        'get_all_companies': lambda i: controller.get_all_companies(),
+        'get_cache_stats': lambda i: controller.get_cache_stats(),
+        'invalidate_reference_data': lambda i: controller.invalidate_reference_data('company'),
+        # Admin tabs
+        'get_faculty_page': lambda i: controller.get_faculty_page(),
+        'get_total_students_for_faculty': lambda i: controller.get_total_students_for_faculty(pick('faculties')),
+        'get_faculties_by_department': lambda i: controller.get_faculties_by_department(department['department_id']),
+        'get_secretary_users': lambda i: controller.get_secretary_users(),
+        'get_secretaries_by_department': lambda i: controller.get_secretaries_by_department(department['department_id']),
+        'get_secretaries_page': lambda i: controller.get_secretaries_page(),
+        'get_companies_by_registration': lambda i: controller.get_companies_by_registration(True),
+        'get_companies_page': lambda i: controller.get_companies_page(),
+        'verify_faculty': lambda i: controller.verify_faculty(pick('faculties')),
+        'verify_company': lambda i: controller.verify_company(pick('companies')),
+        'create_company': lambda i: controller.create_company(f"Bench Co {i}", "Contact", unique('co', i), "", ""),
+        'delete_faculty_by_id': create_and_delete(
+            lambda email: model.create_faculty("Tmp", email, "x", department['name']),
+            find_id('faculties', 'faculty_id'), controller.delete_faculty_by_id),
+        'delete_secretary_by_id': create_and_delete(
+            lambda email: model.create_secretary("Tmp", email, "x", department['name']),
+            find_id('secretaries', 'secretary_id'), controller.delete_secretary_by_id),
+        'delete_company_by_id': create_and_delete(
+            lambda email: model.create_company("Tmp", email, "x"),
+            find_id('companies', 'company_id'), controller.delete_company_by_id),
+        # Student tabs
+        'get_student_applications': lambda i: controller.get_student_applications(pick('students')),
+        'get_student_applications_page': lambda i: controller.get_student_applications_page(pick('students')),
+        'get_student_application_changes': lambda i: controller.get_student_application_changes(pick('students'), since),
+        'get_available_quotas': lambda i: controller.get_available_quotas(),
+        'get_available_quotas[department]': lambda i: controller.get_available_quotas(department['name']),
+        'get_available_quotas_page': lambda i: controller.get_available_quotas_page(None),
+        'get_available_quotas_page[second]': lambda i: controller.get_available_quotas_page(None, first_quota_page[1]),
+        'browse_quotas': lambda i: controller.browse_quotas(),
+        'browse_quotas[filtered]': lambda i: controller.browse_quotas(
+            {'department': department['name'], 'deadline_within': 30, 'min_slots': 2}),
+        'browse_quotas[second]': lambda i: controller.browse_quotas(None, first_browse_page['next']),
+        'search_quotas': lambda i: controller.search_quotas("internship students"),
+        'search_quotas[prefix]': lambda i: controller.search_quotas("intern"),
+        'get_quota_changes': lambda i: controller.get_quota_changes(None, since),
+        'get_quota_details': lambda i: controller.get_quota_details(pick('quotas')),
+        'upload_report': upload,
+        'create_application[quota]': lambda i: controller.create_application(
+            pick('students'), pick('companies'), pick('quotas')),
+        'create_application[self_found]': lambda i: controller.create_application(
+            pick('students'), pick('companies'), None, True),
+        'create_quota': lambda i: controller.create_quota(
+            pick('companies'), department['name'], 5, str(date.today() + timedelta(days=30)), "Bench quota"),
+        # Faculty tabs
+        'get_students_under_faculty': lambda i: controller.get_students_under_faculty(pick('faculties')),
+        'get_students_under_faculty_page': lambda i: controller.get_students_under_faculty_page(pick('faculties')),
+        'get_faculty_assignment_changes': lambda i: controller.get_faculty_assignment_changes(pick('faculties'), since),
+        'get_reports_for_faculty': lambda i: controller.get_reports_for_faculty(pick('faculties')),
+        'get_reports_for_faculty_page': lambda i: controller.get_reports_for_faculty_page(pick('faculties')),
+        'submit_report_grade': lambda i: controller.submit_report_grade(pick('reports'), 'A', "Good"),
+        'find_similar_reports': lambda i: controller.find_similar_reports(rng.choice(similar_ids)),
+        'find_similar_reports_in_department': lambda i: controller.find_similar_reports_in_department(
+            signed_department),
+        # Secretary tabs
+        'get_pending_applications': lambda i: controller.get_pending_applications(),
+        'get_pending_applications_page': lambda i: controller.get_pending_applications_page(),
+        'get_pending_applications_page[second]': lambda i: controller.get_pending_applications_page(first_pending_page[1]),
+        'get_application_changes': lambda i: controller.get_application_changes(since),
+        'update_application_status': lambda i: controller.update_application_status(pick('applications'), 'approved'),
+        'get_approved_unassigned_students_by_secretary': lambda i: controller.get_approved_unassigned_students_by_secretary(pick('secretaries')),
+        'get_faculty_by_secretary': lambda i: controller.get_faculty_by_secretary(pick('secretaries')),
+        'assign_faculty': lambda i: controller.assign_faculty(pick('faculties'), pick('students')),
+        # Session
+        'open_session': lambda i: controller.open_session(f"student{pick('students')}@{EMAIL_DOMAIN}",
+                                                          SYNTHETIC_PASSWORD),
+        'refresh_session': lambda i: controller.refresh_session(),
+        'get_user_id': lambda i: controller.get_user_id(),
+        'get_user_name': lambda i: controller.get_user_name(),
+        'get_user_email': lambda i: controller.get_user_email(),
+        'get_user_department': lambda i: controller.get_user_department(),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every InternshipController method against a seeded database")
+    parser.add_argument('--preset', choices=list(PRESETS), default='medium')
+    for table in PRESETS['medium']:
+        parser.add_argument(f'--{table}', type=int, help=f"override the preset's {table} count")
+    parser.add_argument('--report-texts', type=int, default=2000,
+                        help="generated reports given an indexed text, for the similarity cases")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--database', default='trial_db_bench', help="database name, or file stem for sqlite")
+    parser.add_argument('--skip-seed', action='store_true', help="reuse an already seeded database")
+    parser.add_argument('--output', help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    volumes = {table: getattr(args, table) if getattr(args, table) is not None else count
+               for table, count in PRESETS[args.preset].items()}
+    rng = random.Random(args.seed)
+    if not args.skip_seed:
+        create_bench_database(args.backend, args.database)
+    model = DatabaseModel(db_config=bench_config(args.backend, args.database), backend_name=args.backend)
+    controller = InternshipController(model)
+    # Uploaded reports go to a scratch store, not the working directory's
+    upload_dir = tempfile.TemporaryDirectory(prefix='bench-reports-')
+    controller.report_store = ReportStore(str(Path(upload_dir.name) / 'store'))
+    controller.report_indexer = ReportIndexer(model, controller.report_store)
+    try:
+        seed_started = time.perf_counter()
+        if not args.skip_seed:
+            SyntheticDataGenerator(model, volumes, args.seed).generate()
+            # The generator writes quotas directly, bypassing the search index
+            last = 0
+            while last is not None:
+                last = model.index_quota_terms(last)
+            seed_report_texts(model, rng, args.report_texts)
+        seed_seconds = time.perf_counter() - seed_started
+        with model.pool.cursor() as cursor:
+            ids = id_ranges(cursor, ID_COLUMNS)
+
+        # A logged-in session for the get_user_* helpers
+        controller.current_user = controller.open_session(f"student{ids['students'][0]}@{EMAIL_DOMAIN}",
+                                                       SYNTHETIC_PASSWORD)
+        metrics.reset()
+
+        cases = build_cases(controller, ids, rng, upload_dir.name)
+        results = {}
+        for name, func in cases.items():
+            try:
+                results[name] = time_case(func, args.repeat)
+            except Exception as e:
+                results[name] = {'error': str(e)}
+            print(f"{name}: {results[name]}", file=sys.stderr)
+
+        covered = {name.split('[')[0] for name in cases}
+        public = {name for name in dir(InternshipController)
+                  if not name.startswith('_') and callable(getattr(InternshipController, name))}
+        output = {
+            'meta': {
+                'revision': git_revision(),
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'backend': args.backend,
+                'preset': args.preset,
+                'volumes': volumes,
+                'seeded': not args.skip_seed,
+                'seed_seconds': round(seed_seconds, 1),
+                'repeat': args.repeat,
+            },
+            'results': results,
+            'uncovered': sorted(public - covered - UI_METHODS),
+            'pool': model.get_pool_stats(),
+            'statements': model.get_statement_stats(),
+        }
+    finally:
+        # Waits for the upload cases' indexing before the scratch store goes away
+        controller.cleanup()
+        upload_dir.cleanup()
+
+    text = json.dumps(output, indent=2, default=str)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
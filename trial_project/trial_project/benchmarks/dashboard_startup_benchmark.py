@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Dashboard time-to-first-interactive, with every tab built up front (eager,
+how the dashboards used to start) and with tabs built on first selection (lazy).
+
+For each role it logs in against a seeded scratch database, opens the
+dashboard and records:
+  interactive_ms  constructor plus the first paint, i.e. until the window takes input
+  loaded_ms       until every background query the dashboard started has delivered
+  queries         SQL statements executed while opening
+  tabs_built      tabs whose contents exist once opened
+
+Needs a display (Tk windows are really created and painted).
+
+Usage: python benchmarks/dashboard_startup_benchmark.py [--backend mysql|sqlite] [--preset small]
+           [--repeat 5] [--skip-seed] [--output results.json]
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.benchmarks.controller_benchmark import bench_config, create_bench_database, git_revision, percentile
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.query_metrics import metrics
+from trial_project.models.synthetic_data import SyntheticDataGenerator, PRESETS, SYNTHETIC_PASSWORD, EMAIL_DOMAIN
+from trial_project.controllers.internship_controller import InternshipController
+from trial_project.views.dashboard_view.dashboard_view import DashboardView
+from trial_project.views.dashboard_view.Student_dashboard import StudentDashboard
+
+ROLES = ['student', 'faculty', 'secretary', 'company', 'admin']
+
+# Give up waiting for a dashboard's initial queries after this long
+LOAD_TIMEOUT = 60.0
+
+
+def first_users(model) -> dict:
+    """role -> lowest user id with that role"""
+    rows = model._fetch_all("SELECT role, MIN(user_id) AS user_id FROM user_identities GROUP BY role")
+    return {row['role']: row['user_id'] for row in rows}
+
+
+def open_dashboard(controller, view_class, lazy: bool) -> dict:
+    """Open one dashboard, wait for its initial data and close it again"""
+    view_class = type(view_class.__name__, (view_class,), {'lazy_tabs': lazy})
+    metrics.reset()
+
+    started = time.perf_counter()
+    view = view_class(controller, controller.current_user)
+    view.root.update()
+    interactive = time.perf_counter() - started
+
+    deadline = started + LOAD_TIMEOUT
+    while view.tasks.pending() and time.perf_counter() < deadline:
+        view.root.update()
+        time.sleep(0.002)
+    loaded = time.perf_counter() - started
+
+    tabs = [view.notebook.tab(tab, 'text') for tab in view.notebook.tabs()]
+    result = {
+        'interactive_ms': interactive * 1000,
+        'loaded_ms': loaded * 1000,
+        'queries': sum(h['count'] for h in metrics.report()['queries'].values()),
+        'tabs_built': sum(view.tabs.is_built(text) for text in tabs),
+        'tabs': len(tabs),
+    }
+    view.tasks.shutdown()
+    view.root.destroy()
+    return result
+
+
+def summarize(runs: list) -> dict:
+    summary = {key: runs[-1][key] for key in ('queries', 'tabs_built', 'tabs')}
+    for key in ('interactive_ms', 'loaded_ms'):
+        samples = [run[key] for run in runs]
+        summary[key] = round(percentile(samples, 50), 1)
+        summary[key.replace('_ms', '_p95_ms')] = round(percentile(samples, 95), 1)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time dashboard startup with eager and lazy tabs")
+    parser.add_argument('--preset', choices=list(PRESETS), default='small')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--database', default='trial_db_bench', help="database name, or file stem for sqlite")
+    parser.add_argument('--skip-seed', action='store_true', help="reuse an already seeded database")
+    parser.add_argument('--roles', nargs='+', choices=ROLES, default=ROLES)
+    parser.add_argument('--output', help="write JSON here as well as the table to stdout")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        create_bench_database(args.backend, args.database)
+    model = DatabaseModel(db_config=bench_config(args.backend, args.database), backend_name=args.backend)
+    controller = InternshipController(model)
+    results = {}
+    try:
+        if not args.skip_seed:
+            SyntheticDataGenerator(model, PRESETS[args.preset], args.seed).generate()
+        users = first_users(model)
+
+        for role in args.roles:
+            controller.current_user = controller.open_session(f"{role}{users[role]}@{EMAIL_DOMAIN}",
+                                                              SYNTHETIC_PASSWORD, role)
+            view_class = StudentDashboard if role == 'student' else DashboardView
+            # One unmeasured open fills the reference data caches for both modes
+            open_dashboard(controller, view_class, lazy=False)
+            for mode, lazy in (('eager', False), ('lazy', True)):
+                runs = [open_dashboard(controller, view_class, lazy) for _ in range(args.repeat)]
+                results.setdefault(role, {})[mode] = summarize(runs)
+    finally:
+        model.close_connection()
+
+    print(f"{'role':<11}{'mode':<7}{'interactive ms':>16}{'loaded ms':>11}{'queries':>9}{'tabs built':>12}")
+    for role, modes in results.items():
+        for mode, r in modes.items():
+            print(f"{role:<11}{mode:<7}{r['interactive_ms']:>16.1f}{r['loaded_ms']:>11.1f}"
+                  f"{r['queries']:>9}{r['tabs_built']:>9}/{r['tabs']}")
+
+    if args.output:
+        output = {
+            'meta': {
+                'revision': git_revision(),
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'backend': args.backend,
+                'preset': args.preset,
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
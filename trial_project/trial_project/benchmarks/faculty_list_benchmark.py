@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the admin 'View Faculty' tab: per-row student counts (N+1)
+versus the keyset-paged query the tab uses, which counts inside each page.
+
+Seeds a scratch database (trial_db_bench by default) and prints round-trips
+and wall-clock time for both code paths.
+
+Usage: python benchmarks/faculty_list_benchmark.py [--backend mysql|sqlite] [--faculty 10000]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.benchmarks.controller_benchmark import bench_config, create_bench_database
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+
+
+def seed(model: DatabaseModel, faculty_count: int, students_per_faculty: int):
+    """Insert faculty, students and faculty assignments"""
+    dept_ids = [d['department_id'] for d in model.get_all_departments()]
+    rng = random.Random(42)
+    with model.pool.cursor(commit=True) as cursor:
+        cursor.executemany(
+            "INSERT INTO faculties (name, email, password_hash, department_id) VALUES (%s, %s, %s, %s)",
+            [(f"Faculty {i}", f"faculty{i}@bench.local", "x", rng.choice(dept_ids))
+             for i in range(faculty_count)]
+        )
+        student_count = faculty_count * students_per_faculty
+        cursor.executemany(
+            "INSERT INTO students (name, email, password_hash, department_id, cgpa) VALUES (%s, %s, %s, %s, %s)",
+            [(f"Student {i}", f"student{i}@bench.local", "x", rng.choice(dept_ids), 3.0)
+             for i in range(student_count)]
+        )
+        cursor.execute("SELECT MIN(faculty_id) AS first FROM faculties")
+        first_faculty = cursor.fetchone()['first']
+        cursor.execute("SELECT MIN(student_id) AS first FROM students")
+        first_student = cursor.fetchone()['first']
+        cursor.executemany(
+            "INSERT INTO faculty_assignments (faculty_id, student_id) VALUES (%s, %s)",
+            [(first_faculty + rng.randrange(faculty_count), first_student + i)
+             for i in range(student_count)]
+        )
+
+
+def measure(model: DatabaseModel, load):
+    """Return (round_trips, seconds, rows) for one load of the faculty list"""
+    before = model.get_pool_stats()['checkouts']
+    started = time.perf_counter()
+    rows = load()
+    elapsed = time.perf_counter() - started
+    return model.get_pool_stats()['checkouts'] - before, elapsed, len(rows)
+
+
+def load_per_row(model: DatabaseModel):
+    """Old tab behaviour: one count query per faculty row"""
+    rows = model.get_all_faculty_with_department()
+    for faculty in rows:
+        faculty['total_students'] = model.get_total_students_for_faculty(faculty['faculty_id'])
+    return rows
+
+
+def load_paged(model: DatabaseModel):
+    """Current tab behaviour, read through to the last page"""
+    rows, after = model.get_faculty_with_student_counts_page()
+    while after is not None:
+        page, after = model.get_faculty_with_student_counts_page(after=after)
+        rows += page
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the View Faculty tab queries")
+    parser.add_argument('--faculty', type=int, default=10000)
+    parser.add_argument('--students-per-faculty', type=int, default=3)
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--database', default='trial_db_bench', help="database name, or file stem for sqlite")
+    args = parser.parse_args()
+
+    create_bench_database(args.backend, args.database)
+    model = DatabaseModel(db_config=bench_config(args.backend, args.database), backend_name=args.backend)
+    try:
+        seed(model, args.faculty, args.students_per_faculty)
+
+        results = {
+            'per-row counts (before)': measure(model, lambda: load_per_row(model)),
+            'paged query (after)': measure(model, lambda: load_paged(model)),
+        }
+
+        print(f"\nView Faculty tab, {args.faculty} faculty")
+        print(f"{'path':<28}{'round-trips':>12}{'seconds':>10}{'rows':>8}")
+        for name, (round_trips, seconds, rows) in results.items():
+            print(f"{name:<28}{round_trips:>12}{seconds:>10.3f}{rows:>8}")
+    finally:
+        model.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark login lookups: the old per-role-table SELECT * against the
+user_identities point query, plus end-to-end authenticate_user.
+
+Seeds a scratch database (trial_db_bench by default) with --users accounts
+per role and prints p50/p95/p99 latencies in milliseconds.
+
+Usage: python benchmarks/login_benchmark.py [--backend mysql|sqlite] [--users 20000] [--lookups 2000]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.benchmarks.controller_benchmark import bench_config, create_bench_database
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.schema import IDENTITY_SOURCES
+
+PASSWORD = "bench-password"
+
+
+def seed(model: DatabaseModel, users_per_role: int):
+    """Insert accounts for every role; triggers fill user_identities. Returns [(email, role)]"""
+    dept_id = model.get_all_departments()[0]['department_id']
+    # One hash shared by every account keeps seeding fast and avoids rehash-on-login
+    password_hash = model.hash_password(PASSWORD)
+    accounts = []
+    with model.pool.cursor(commit=True) as cursor:
+        for role, (table, _, dept_column) in IDENTITY_SOURCES.items():
+            rows = [(f"{role} {i}", f"{role}{i}@bench.local", password_hash) for i in range(users_per_role)]
+            if role == 'student':
+                cursor.executemany(
+                    "INSERT INTO students (name, email, password_hash, department_id, cgpa) VALUES (%s, %s, %s, %s, 3.0)",
+                    [row + (dept_id,) for row in rows])
+            elif dept_column:
+                cursor.executemany(
+                    f"INSERT INTO {table} (name, email, password_hash, department_id) VALUES (%s, %s, %s, %s)",
+                    [row + (dept_id,) for row in rows])
+            else:
+                cursor.executemany(
+                    f"INSERT INTO {table} (name, email, password_hash) VALUES (%s, %s, %s)", rows)
+            accounts += [(row[1], role) for row in rows]
+    return accounts
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    pick = lambda pct: ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))] * 1000
+    return pick(50), pick(95), pick(99)
+
+
+def timed(func, args_list):
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark login lookups")
+    parser.add_argument('--users', type=int, default=20000, help="accounts per role")
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--logins', type=int, default=50, help="end-to-end logins, including hashing")
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--database', default='trial_db_bench', help="database name, or file stem for sqlite")
+    args = parser.parse_args()
+
+    create_bench_database(args.backend, args.database)
+    model = DatabaseModel(db_config=bench_config(args.backend, args.database), backend_name=args.backend)
+    try:
+        accounts = seed(model, args.users)
+        rng = random.Random(7)
+        sample = [rng.choice(accounts) for _ in range(args.lookups)]
+
+        def old_lookup(email, role):
+            # Previous authenticate_user: role chosen up front, every column fetched
+            table = IDENTITY_SOURCES[role][0]
+            return model._fetch_one(f"SELECT * FROM {table} WHERE email = %s", (email,))
+
+        results = {
+            'role table SELECT * (before)': timed(old_lookup, sample),
+            'identities, role given': timed(model.get_identities, sample),
+            'identities, any role': timed(lambda email, role: model.get_identities(email), sample),
+            'authenticate_user (end to end)': timed(
+                lambda email, role: model.authenticate_user(email, PASSWORD), sample[:args.logins]),
+        }
+
+        print(f"\nLogin lookups, {args.users} accounts per role")
+        print(f"{'path':<34}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for name, samples in results.items():
+            p50, p95, p99 = percentiles(samples)
+            print(f"{name:<34}{len(samples):>6}{p50:>9.2f}{p95:>9.2f}{p99:>9.2f}")
+    finally:
+        model.close_connection()
+
+
+if __name__ == "__main__":
+    main()
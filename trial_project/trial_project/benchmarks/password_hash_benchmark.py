@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark password hasher cost parameters against a login burst.
+
+For each candidate setting, prints the time for one verify and the
+throughput and latency percentiles when --logins verifications arrive at
+once and are served by --workers threads (like the semester-start rush).
+No database is needed.
+
+Usage: python benchmarks/password_hash_benchmark.py [--logins 200] [--workers 4]
+           [--scrypt-n 16384 32768] [--pbkdf2-iterations 300000 600000]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.models.password_hasher import ScryptHasher, PBKDF2Hasher, LegacySHA256Hasher
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_burst(hasher, encoded: str, logins: int, workers: int):
+    """Verify `logins` passwords submitted at once; return (per-login latencies, total seconds)"""
+    started = time.perf_counter()
+
+    def login(_):
+        hasher.verify("correct horse battery staple", encoded)
+        # Latency as a user sees it: queueing behind the burst plus the hash
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        latencies = list(executor.map(login, range(logins)))
+    return latencies, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune password hashing cost for login bursts")
+    parser.add_argument('--logins', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--scrypt-n', type=int, nargs='*', default=[2 ** 14, 2 ** 15])
+    parser.add_argument('--scrypt-r', type=int, default=8)
+    parser.add_argument('--pbkdf2-iterations', type=int, nargs='*', default=[300000, 600000])
+    args = parser.parse_args()
+
+    candidates = [(f"scrypt n={n} r={args.scrypt_r}", ScryptHasher(n=n, r=args.scrypt_r))
+                  for n in args.scrypt_n]
+    candidates += [(f"pbkdf2_sha256 i={i}", PBKDF2Hasher(iterations=i)) for i in args.pbkdf2_iterations]
+
+    print(f"\n{args.logins} simultaneous logins, {args.workers} workers")
+    print(f"{'hasher':<26}{'one verify ms':>14}{'logins/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    legacy = LegacySHA256Hasher()
+    for name, hasher in [("legacy sha256 (unsalted)", legacy)] + candidates:
+        encoded = ("a" * 64 if hasher is legacy else hasher.hash("correct horse battery staple"))
+        single = statistics.median(_time_once(hasher, encoded) for _ in range(5))
+        latencies, total = run_burst(hasher, encoded, args.logins, args.workers)
+        print(f"{name:<26}{single * 1000:>14.1f}{args.logins / total:>10.0f}"
+              f"{percentile(latencies, 50) * 1000:>9.0f}{percentile(latencies, 95) * 1000:>9.0f}"
+              f"{percentile(latencies, 99) * 1000:>9.0f}")
+
+
+def _time_once(hasher, encoded: str) -> float:
+    started = time.perf_counter()
+    hasher.verify("correct horse battery staple", encoded)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
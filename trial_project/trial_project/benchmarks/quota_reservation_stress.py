@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for quota slot reservation in create_application.
+
+Seeds a scratch database (trial_db_bench by default) with one open quota and
+one expired quota, fires thousands of parallel applications at each, and
+checks that slots are never overbooked and expired quotas accept nothing.
+
+Usage: python benchmarks/quota_reservation_stress.py [--backend mysql|sqlite]
+           [--applications 5000] [--slots 50]
+"""
+
+import sys
+import time
+import argparse
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.benchmarks.controller_benchmark import bench_config, create_bench_database
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+
+
+def seed(model: DatabaseModel, student_count: int, slots: int):
+    """Insert one company, the applicants, an open quota and an expired quota"""
+    dept_id = model.get_all_departments()[0]['department_id']
+    with model.pool.cursor(commit=True) as cursor:
+        cursor.execute(
+            "INSERT INTO companies (name, email, password_hash) VALUES (%s, %s, %s)",
+            ("Stress Co", "stress@bench.local", "x")
+        )
+        company_id = cursor.lastrowid
+        cursor.executemany(
+            "INSERT INTO students (name, email, password_hash, department_id, cgpa) VALUES (%s, %s, %s, %s, %s)",
+            [(f"Student {i}", f"student{i}@bench.local", "x", dept_id, 3.0) for i in range(student_count)]
+        )
+        cursor.execute("SELECT student_id FROM students ORDER BY student_id")
+        student_ids = [row['student_id'] for row in cursor.fetchall()]
+
+        quota_sql = """
+            INSERT INTO quotas (company_id, department, total_slots, available_slots, deadline, description)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """
+        cursor.execute(quota_sql, (company_id, "Computer Science", slots, slots,
+                                   date.today() + timedelta(days=30), "open"))
+        open_quota = cursor.lastrowid
+        cursor.execute(quota_sql, (company_id, "Computer Science", slots, slots,
+                                   date.today() - timedelta(days=1), "expired"))
+        expired_quota = cursor.lastrowid
+    return company_id, student_ids, open_quota, expired_quota
+
+
+def storm(model: DatabaseModel, workers: int, company_id: int, student_ids, quota_id: int):
+    """Submit one application per student against quota_id in parallel; return (accepted, seconds)"""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda student_id: model.create_application(student_id, company_id, quota_id),
+            student_ids
+        ))
+    return sum(results), time.perf_counter() - started
+
+
+def quota_state(model: DatabaseModel, quota_id: int):
+    """Return (available_slots, applications recorded) for a quota"""
+    row = model._fetch_one("""
+        SELECT q.available_slots, COUNT(a.app_id) AS applications
+        FROM quotas q LEFT JOIN applications a ON a.quota_id = q.quota_id
+        WHERE q.quota_id = %s
+        GROUP BY q.quota_id, q.available_slots
+    """, (quota_id,))
+    return row['available_slots'], row['applications']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress concurrent quota reservations")
+    parser.add_argument('--applications', type=int, default=5000)
+    parser.add_argument('--slots', type=int, default=50)
+    parser.add_argument('--workers', type=int, default=64)
+    parser.add_argument('--pool-size', type=int, default=16)
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--database', default='trial_db_bench', help="database name, or file stem for sqlite")
+    args = parser.parse_args()
+
+    create_bench_database(args.backend, args.database)
+    model = DatabaseModel(pool_size=args.pool_size, db_config=bench_config(args.backend, args.database),
+                          backend_name=args.backend)
+    failures = []
+    try:
+        company_id, student_ids, open_quota, expired_quota = seed(model, args.applications, args.slots)
+
+        accepted, seconds = storm(model, args.workers, company_id, student_ids, open_quota)
+        available, recorded = quota_state(model, open_quota)
+        print(f"\nOpen quota: {args.applications} applications, {args.slots} slots, {seconds:.2f}s")
+        print(f"  accepted={accepted} recorded={recorded} available_slots={available}")
+        if accepted != args.slots or recorded != args.slots or available != 0:
+            failures.append("open quota was over- or under-booked")
+
+        accepted, seconds = storm(model, args.workers, company_id, student_ids, expired_quota)
+        available, recorded = quota_state(model, expired_quota)
+        print(f"Expired quota: {args.applications} applications, {seconds:.2f}s")
+        print(f"  accepted={accepted} recorded={recorded} available_slots={available}")
+        if accepted or recorded or available != args.slots:
+            failures.append("expired quota accepted applications")
+
+        print(f"Pool: {model.get_pool_stats()}")
+    finally:
+        model.close_connection()
+
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK: no overbooking")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Streams a large generated file into a scratch ReportStore and reports throughput
+and memory: Python allocation peak (tracemalloc) and growth of the process's
+maximum resident set size. A second upload of the same file is timed as well
+and should be deduplicated.
+
+Usage: python benchmarks/report_store_benchmark.py [--size-mb 100] [--chunk-kb 1024]
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.models.report_store import ReportStore
+
+
+def max_rss_mb() -> float:
+    """Peak resident set size so far, or 0 where the resource module is missing"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def write_source(path: str, size_mb: int):
+    """Incompressible test file written 1 MiB at a time"""
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(1024 * 1024))
+
+
+def timed_put(store: ReportStore, source: str) -> dict:
+    rss_before = max_rss_mb()
+    tracemalloc.start()
+    started = time.perf_counter()
+    report = store.put(source)
+    seconds = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds': round(seconds, 3),
+        'mb_per_s': round(report['size_bytes'] / (1024 * 1024) / seconds, 1),
+        'python_peak_kb': round(peak / 1024, 1),
+        'rss_growth_mb': round(max_rss_mb() - rss_before, 1),
+        'deduplicated': report['deduplicated'],
+        'sha256': report['sha256'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure streaming report uploads")
+    parser.add_argument('--size-mb', type=int, default=100)
+    parser.add_argument('--chunk-kb', type=int, default=1024)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='report-bench-')
+    try:
+        source = os.path.join(workdir, 'report.pdf')
+        write_source(source, args.size_mb)
+        store = ReportStore(os.path.join(workdir, 'store'), chunk_size=args.chunk_kb * 1024)
+        results = {
+            'size_mb': args.size_mb,
+            'chunk_kb': args.chunk_kb,
+            'first_upload': timed_put(store, source),
+            'repeat_upload': timed_put(store, source),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
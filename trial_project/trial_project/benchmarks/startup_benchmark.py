@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: time from interpreter start to a drawn login window,
+checked against a budget.
+
+Each run is a fresh interpreter (so nothing is already imported) that
+measures:
+  import_ms   importing main.py and everything it pulls in
+  window_ms   import_ms plus building and painting the login window (needs a display)
+  connect_ms  connecting and checking the schema, which runs behind the window
+and lists any heavy modules (dashboards, dialogs) that were imported early.
+
+Exits with status 1 when the median time to the login window (or to the end
+of imports, without a display) is over --budget-ms.
+
+Usage: python benchmarks/startup_benchmark.py [--backend mysql|sqlite] [--repeat 5] [--budget-ms 400]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+DEFAULT_BUDGET_MS = 400
+
+# Modules that should only load once a user has logged in
+DEFERRED_MODULES = [
+    'trial_project.views.dashboard_view.Student_dashboard',
+    'trial_project.views.dashboard_view.dashboard_view',
+    'trial_project.views.dialogs.application_dialog',
+    'trial_project.views.dialogs.self_found_dialog',
+]
+
+
+def probe(backend: str) -> dict:
+    """One cold start, measured inside the fresh interpreter"""
+    import time
+    started = time.perf_counter()
+    import trial_project.main  # noqa: F401  (everything the entry point imports)
+    from trial_project.controllers.internship_controller import InternshipController
+    from trial_project.models.database_model import DatabaseModel
+    from trial_project.views.login_view import LoginView
+    result = {'import_ms': (time.perf_counter() - started) * 1000, 'window_ms': None}
+
+    model = DatabaseModel(backend_name=backend, connect=False)
+    controller = InternshipController(model)
+    if os.environ.get('DISPLAY') or sys.platform in ('win32', 'darwin'):
+        view = LoginView(controller)
+        view.root.update()
+        result['window_ms'] = (time.perf_counter() - started) * 1000
+        view.tasks.shutdown()
+        view.root.destroy()
+
+    result['early_imports'] = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+    connect_started = time.perf_counter()
+    try:
+        model.start()
+        result['connect_ms'] = (time.perf_counter() - connect_started) * 1000
+    except Exception as e:
+        result['connect_ms'] = None
+        result['connect_error'] = str(e)
+    finally:
+        model.close_connection()
+    return result
+
+
+def median(samples):
+    ordered = sorted(samples)
+    return ordered[len(ordered) // 2]
+
+
+def main():
+    from trial_project.models.backend import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Measure cold start to the login window against a budget")
+    parser.add_argument('--backend', choices=BACKENDS, default='mysql')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--probe', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.probe:
+        print(json.dumps(probe(args.backend)))
+        return
+
+    runs = []
+    for _ in range(args.repeat):
+        output = subprocess.check_output([sys.executable, __file__, '--probe', '--backend', args.backend],
+                                         text=True)
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+
+    summary = {'backend': args.backend, 'repeat': args.repeat, 'budget_ms': args.budget_ms}
+    for key in ('import_ms', 'window_ms', 'connect_ms'):
+        samples = [run[key] for run in runs if run.get(key) is not None]
+        summary[key] = round(median(samples), 1) if samples else None
+    summary['early_imports'] = runs[-1]['early_imports']
+    if runs[-1].get('connect_error'):
+        summary['connect_error'] = runs[-1]['connect_error']
+    print(json.dumps(summary, indent=2))
+
+    measured = summary['window_ms'] if summary['window_ms'] is not None else summary['import_ms']
+    if measured > args.budget_ms or summary['early_imports']:
+        print(f"Startup over budget: {measured:.1f}ms (budget {args.budget_ms:.0f}ms)"
+              + (f", early imports: {', '.join(summary['early_imports'])}" if summary['early_imports'] else ""),
+              file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Database connection settings shared by the model layer and setup scripts
+
+DB_CONFIG = {
+    'host': 'localhost',
+    'database': 'trial_db',
+    'user': 'root',
+    'password': 'password'
+}
+
+# Connection pool settings
+POOL_NAME = 'internship_pool'
+POOL_SIZE = 5                 # MySQL connector allows at most 32 connections per pool
+POOL_CHECKOUT_TIMEOUT = 10.0  # Seconds to wait for a free connection before giving up
+
+# Change feed: each poll re-reads rows stamped this many seconds before the
+# previous version, so a transaction that commits late is not missed
+CHANGE_FEED_OVERLAP = 5.0
+
+# Transactions that hit a deadlock or lock wait timeout are retried this many
+# times, backing off a little longer after each attempt
+TRANSACTION_RETRIES = 3
+TRANSACTION_RETRY_DELAY = 0.05  # Seconds
+
+# Statements at least this slow (and failed ones) are appended, with their
+# bound parameters, to the slow query log; None disables the log file
+SLOW_QUERY_THRESHOLD_MS = 200
+SLOW_QUERY_LOG = 'slow_queries.log'
+
+# Storage backend: 'mysql' (DB_CONFIG) or 'sqlite', an embedded file database
+# that needs no server and suits local testing and single-department installs
+DB_BACKEND = 'mysql'
+SQLITE_CONFIG = {
+    'database': 'internship.db'
+}
+SQLITE_BUSY_TIMEOUT = 5.0  # Seconds a writer waits for another connection's write lock
+
+# The app checks for pending schema migrations while the login window is up.
+# Installs that run setup/setup_database.py on every upgrade can turn this off.
+CHECK_SCHEMA_ON_START = True
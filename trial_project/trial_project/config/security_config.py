@@ -0,0 +1,24 @@
+# Password hashing settings; tune with benchmarks/password_hash_benchmark.py
+
+import os
+
+PASSWORD_HASHER = 'scrypt'    # 'scrypt' or 'pbkdf2_sha256'
+
+# scrypt memory use is 128 * N * r bytes per hash (16 MiB with these values)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+PBKDF2_ITERATIONS = 600000
+
+# Bulk-imported accounts are hashed at a much lower cost: about 1 ms per hash
+# per core instead of about 50 ms, so 100k rows take about 25 s of hashing on
+# 4 cores rather than 20 minutes. These hashes are temporary: needs_rehash()
+# compares the stored parameters with the ones above, so each one is
+# upgraded on first login.
+IMPORT_SCRYPT_N = 2 ** 8
+IMPORT_PBKDF2_ITERATIONS = 3000
+
+# Threads used to hash many passwords at once (bulk import); hashlib releases
+# the GIL while hashing, so throughput scales with cores
+HASH_WORKERS = os.cpu_count() or 4
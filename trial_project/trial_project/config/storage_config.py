@@ -0,0 +1,13 @@
+# File storage settings for uploaded internship reports
+
+# Reports are stored once per distinct content, under REPORT_STORE_DIR/ab/cd/<sha256>
+REPORT_STORE_DIR = 'report_store'
+
+# Uploads are copied and hashed this many bytes at a time, so memory use stays
+# flat whatever the file size
+REPORT_CHUNK_SIZE = 1024 * 1024
+
+# Text extraction for report search runs in this many worker processes, and
+# keeps at most this many characters of each report
+REPORT_INDEX_WORKERS = 2
+REPORT_INDEX_MAX_CHARS = 1_000_000
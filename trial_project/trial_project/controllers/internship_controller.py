@@ -1,16 +1,28 @@
+import os
 from typing import Optional, List, Dict, Any
 from trial_project.models.database_model import DatabaseModel
-from views.dashboard_view.Student_dashboard import StudentDashboard
-from views.dashboard_view.dashboard_view import DashboardView
+from trial_project.models.report_indexer import ReportIndexer
+from trial_project.models.report_store import ReportStore
 from trial_project.views.login_view import LoginView
+from trial_project.controllers.reference_cache import ReferenceCache
+from trial_project.controllers.session import UserSession
 from tkinter import messagebox
 
 
 class InternshipController:
     """Main controller handling business logic"""
     
-    def __init__(self):
-        self.model = DatabaseModel()
+    def __init__(self, model: DatabaseModel = None, check_schema: bool = True):
+        self.model = model or DatabaseModel()
+        # Whether a model that is not connected yet checks the schema as it connects
+        self.check_schema = check_schema
+        # Departments, companies and faculty rarely change but are re-read for every dropdown.
+        # Writes made through this controller invalidate entries; writes from other
+        # processes (other clients, setup/bulk_import.py) show up only when the TTL expires.
+        self.reference_cache = ReferenceCache(ttl=300)
+        self.report_store = ReportStore()
+        # Uploaded reports are made searchable in worker processes
+        self.report_indexer = ReportIndexer(self.model, self.report_store)
         self.current_user = None
         self.login_view = None
         self.dashboard_view = None
@@ -18,22 +30,57 @@ class InternshipController:
     def start_application(self):
         """Start the application"""
         self.login_view = LoginView(self)
+        if not self.model.is_connected:
+            # The window draws first; connecting and the schema check happen behind it
+            self.login_view.set_connecting(True)
+            self.login_view.tasks.submit('startup', self.model.start, self.check_schema,
+                                         on_success=self.on_database_ready,
+                                         on_error=self.on_database_error)
         self.login_view.run()
     
+    def on_database_ready(self, _):
+        self.login_view.set_connecting(False)
+    
+    def on_database_error(self, error):
+        print(f"Error connecting to {self.model.backend}: {error}")
+        self.login_view.set_unavailable()
+        messagebox.showerror("Database Error", f"Failed to connect to database: {error}")
+    
     def login(self, email: str, password: str, role: str):
         """Handle user login"""
         if not email or not password or not role:
             messagebox.showerror("Error", "Please fill in all fields.")
             return
         
-        user = self.model.authenticate_user(email, password, role)
+        role = None if role.lower() == 'any' else role
+        self.login_view.tasks.submit('login', self.open_session, email, password, role,
+                                     on_success=self.on_login_result, on_error=self.on_login_error)
+    
+    def open_session(self, email: str, password: str, role: str = None) -> Optional[UserSession]:
+        """Authenticate and load the user's session profile (runs on a worker thread)"""
+        identity = self.model.authenticate_user(email, password, role)
+        return UserSession(self.model, identity) if identity else None
+    
+    def refresh_session(self):
+        """Reload the current user's profile after it has been edited"""
+        if self.current_user:
+            self.current_user.refresh()
+    
+    def on_login_result(self, user):
+        """Open the dashboard once the background login check succeeds"""
         if user:
             self.current_user = user
+            self.login_view.tasks.shutdown()
             self.login_view.root.destroy()
             self.show_dashboard()
         else:
+            self.login_view.login_finished()
             messagebox.showerror("Login Failed", "Invalid email, password, or role")
     
+    def on_login_error(self, error):
+        self.login_view.login_finished()
+        messagebox.showerror("Login Failed", f"Could not sign in: {error}")
+    
     def register(self, role: str, **kwargs):
         """Handle user registration"""
         # Validate required fields based on role
@@ -65,6 +112,7 @@ class InternshipController:
         
         # Attempt to create user
         if self.model.create_user_by_role(role, **kwargs):
+            self.invalidate_reference_data(role)
             messagebox.showinfo("Success", "Registration successful! Please login.")
             # Clear the registration form if available
             if hasattr(self.login_view, 'clear_forms'):
@@ -76,7 +124,9 @@ class InternshipController:
         """Show role-based dashboard"""
         role = self.current_user['role']
         
+        # Imported on first use so the login window does not wait for them
         if role == 'student':
+            from trial_project.views.dashboard_view.Student_dashboard import StudentDashboard
             self.dashboard_view = StudentDashboard(self, self.current_user)
         elif role == 'faculty':
             # dashboard = FacultyDashboard(self, self.current_user)
@@ -100,17 +150,21 @@ class InternshipController:
     # Admin Management
     # TAB-01: Related To 'View Faculty' Tab
     def get_faculty_users(self):
-        return self.model.get_all_faculty_with_department()
+        return list(self.reference_cache.get('faculty', self.model.get_all_faculty_with_department))
+    def get_faculty_page(self, department_id=None, after=None, limit=200):
+        return self.model.get_faculty_with_student_counts_page(department_id, after, limit)
     def get_total_students_for_faculty(self, faculty_id):
         return self.model.get_total_students_for_faculty(faculty_id)
     def get_faculties_by_department(self, department_id):
         return self.model.get_faculties_by_department(department_id)
-    def get_all_departments(self):
-        return self.model.get_all_departments()
     def delete_faculty_by_id(self, faculty_id):
-        return self.model.delete_faculty_by_id(faculty_id)
+        result = self.model.delete_faculty_by_id(faculty_id)
+        self.reference_cache.invalidate('faculty')
+        return result
     def verify_faculty(self, faculty_id):
-        return self.model.set_faculty_verified(int(faculty_id))
+        result = self.model.set_faculty_verified(int(faculty_id))
+        self.reference_cache.invalidate('faculty')
+        return result
 
 
     # TAB-02: Related To 'View Secretary' Tab
@@ -118,41 +172,83 @@ class InternshipController:
         return self.model.get_all_secretary_with_department()
     def get_secretaries_by_department(self, department_id):
         return self.model.get_secretaries_by_department(department_id)
+    def get_secretaries_page(self, department_id=None, after=None, limit=200):
+        return self.model.get_secretaries_page(department_id, after, limit)
     def delete_secretary_by_id(self, secretary_id):
         return self.model.delete_secretary_by_id(secretary_id)
     
     # TAB-03: Related To 'View Company' Tab
     def get_all_companies(self):
-        return self.model.get_all_companies()
+        return list(self.reference_cache.get('companies', self.model.get_all_companies))
     def get_companies_by_registration(self, is_registered):
         return self.model.get_companies_by_registration(is_registered)
+    def get_companies_page(self, is_registered=None, after=None, limit=200):
+        return self.model.get_companies_page(is_registered, after, limit)
     def delete_company_by_id(self, company_id):
-        return self.model.delete_company_by_id(company_id)
+        result = self.model.delete_company_by_id(company_id)
+        self.reference_cache.invalidate('companies')
+        return result
     def verify_company(self, company_id):
-        return self.model.set_company_verified(company_id)
+        result = self.model.set_company_verified(company_id)
+        self.reference_cache.invalidate('companies')
+        return result
 
     # Application management
     def get_student_applications(self, student_id: int) -> List[Dict]:
         """Get applications for a student"""
         return self.model.get_applications_by_student(student_id)
+    def get_student_applications_page(self, student_id: int, after: tuple = None, limit: int = 200):
+        """Get one page of a student's applications"""
+        return self.model.get_applications_by_student_page(student_id, after, limit)
+    def get_student_application_changes(self, student_id: int, since=None):
+        """Get a student's applications changed since a change-feed version, with the next version"""
+        return self.model.get_application_changes_by_student(student_id, since)
     def create_application(self, student_id: int, company_id: int, quota_id: int = None, self_found: bool = False) -> bool:
         """Create new application"""
         return self.model.create_application(student_id, company_id, quota_id, self_found)
     
+    # Report uploads
+    def upload_report(self, student_id: int, file_path: str) -> Optional[Dict]:
+        """Store a report and attach it to the student's approved application (runs on a worker thread)"""
+        application = self.model.get_reportable_application(student_id)
+        if not application:
+            raise ValueError("You need an approved application before uploading a report.")
+        report = self.report_store.put(file_path)
+        if not self.model.attach_report_file(application['app_id'], student_id, report,
+                                             os.path.basename(file_path)):
+            return None
+        self.report_indexer.submit(report['sha256'], report['mime_type'])
+        return report
+    
     # Quota management
     def get_available_quotas(self, department: str = None) -> List[Dict]:
         """Get available quotas"""
         return self.model.get_available_quotas(department)
     
+    def get_available_quotas_page(self, department: str = None, after: tuple = None, limit: int = 200):
+        """Get one page of available quotas"""
+        return self.model.get_available_quotas_page(department, after, limit)
+    
+    def browse_quotas(self, filters: Dict[str, Any] = None, after: tuple = None, limit: int = 200) -> Dict[str, Any]:
+        """Get one page of available quotas under facet filters, with every facet's counts on the first page"""
+        return self.model.browse_quotas(filters, after, limit)
+    
+    def search_quotas(self, keywords: str, filters: Dict[str, Any] = None, limit: int = 200) -> List[Dict]:
+        """Get open quotas matching keywords in their description or company, best matches first"""
+        return self.model.search_available_quotas(keywords, filters, limit)
+    
+    def has_search_terms(self, keywords: str) -> bool:
+        """Whether a search box holds any word the quota index can match ("c++" or one letter does not)"""
+        from trial_project.models.text_extraction import query_terms
+        return bool(query_terms(keywords))
+    
+    def get_quota_changes(self, department: str = None, since=None):
+        """Get quotas changed since a change-feed version, with the next version"""
+        return self.model.get_quota_changes(department, since)
+    
     def get_quota_details(self, quota_id: int) -> Optional[Dict]:
         """Get quota details by ID"""
-        try:
-            query = "SELECT * FROM quotas WHERE quota_id = %s"
-            self.model.cursor.execute(query, (quota_id,))
-            return self.model.cursor.fetchone()
-        except Exception as e:
-            print(f"Error getting quota details: {e}")
-            return None
+        return self.model.get_quota_by_id(quota_id)
     
     def create_quota(self, company_id: int, department: str, total_slots: int, deadline: str, description: str) -> bool:
         """Create new quota"""
@@ -166,17 +262,50 @@ class InternshipController:
     def create_company(self, name: str, contact_person: str, email: str, phone: str, address: str) -> bool:
         """Create new company"""
         # This method might need to be updated based on your new company table structure
-        return self.model.create_company_user(name, email, "default_password")
+        created = self.model.create_company(name, email, self.model.hash_password("default_password"))
+        if created:
+            self.reference_cache.invalidate('companies')
+        return created
     
     # Faculty management
     def get_students_under_faculty(self, faculty_id: int) -> List[Dict]:
         return self.model.get_students_assigned_to_faculty(faculty_id)
     
-    def get_reports_for_faculty(self, faculty_id: int) -> List[Dict]:
-        return self.model.get_reports_assigned_to_faculty(faculty_id)
+    def get_students_under_faculty_page(self, faculty_id: int, after: tuple = None, limit: int = 200):
+        return self.model.get_students_assigned_to_faculty_page(faculty_id, after, limit)
+    
+    def get_faculty_assignment_changes(self, faculty_id: int, since=None):
+        return self.model.get_faculty_assignment_changes(faculty_id, since)
+    
+    def get_reports_for_faculty(self, faculty_id: int, keywords: str = None) -> List[Dict]:
+        return self.model.get_reports_assigned_to_faculty(faculty_id, keywords)
+    
+    def get_reports_for_faculty_page(self, faculty_id: int, after: tuple = None, limit: int = 200,
+                                     keywords: str = None):
+        return self.model.get_reports_assigned_to_faculty_page(faculty_id, after, limit, keywords)
     
     def submit_report_grade(self, report_id: int, grade: str, comments: str) -> bool:
         return self.model.grade_student_report(report_id, grade, comments)
+
+    def find_similar_reports(self, report_id: int) -> List[Dict]:
+        """Reports whose text closely matches a report's, most similar first"""
+        return self.model.get_similar_reports(report_id)
+
+    def find_similar_reports_in_department(self, department_id: int, threshold: float = None) -> List[Dict]:
+        """Every pair of near-duplicate reports in a department (runs on a worker thread)"""
+        from trial_project.models import minhash
+        if threshold is None:
+            threshold = minhash.SIMILARITY_THRESHOLD
+        # Texts indexed before signatures existed are signed first, in the worker processes
+        self.report_indexer.sign_pending(department_id)
+        reports = {report['report_id']: report
+                   for report in self.model.get_department_report_signatures(department_id)
+                   if report['signature']}
+        signatures = {report_id: minhash.unpack(report['signature']) for report_id, report in reports.items()}
+        return [{'report_id': first, 'student_name': reports[first]['student_name'],
+                 'other_report_id': second, 'other_student_name': reports[second]['student_name'],
+                 'similarity': score}
+                for first, second, score in minhash.similar_pairs(signatures, threshold)]
     
     # Secretary Management
     #TAB-1: related to "Pending Applications" tab
@@ -184,6 +313,14 @@ class InternshipController:
         """Get pending applications for secretary"""
         return self.model.get_pending_applications()
     
+    def get_pending_applications_page(self, after: tuple = None, limit: int = 200):
+        """Get one page of pending applications for secretary"""
+        return self.model.get_pending_applications_page(after, limit)
+    
+    def get_application_changes(self, since=None):
+        """Get applications changed since a change-feed version, with the next version"""
+        return self.model.get_application_changes(since)
+    
     def update_application_status(self, app_id: int, status: str) -> bool:
         """Update application status"""
         return self.model.update_application_status(app_id, status)
@@ -203,7 +340,7 @@ class InternshipController:
     # Department management
     def get_all_departments(self) -> List[Dict]:
         """Get all departments"""
-        return self.model.get_all_departments()
+        return list(self.reference_cache.get('departments', self.model.get_all_departments))
     
     def get_department_names(self) -> List[str]:
         """Get department names for dropdowns"""
@@ -223,23 +360,32 @@ class InternshipController:
     #     return self.current_user['role'] if self.current_user else None
     def get_user_id(self) -> int:
         """Get current user ID"""
-        return self.current_user['user_id'] if self.current_user else None
+        return self.current_user.user_id if self.current_user else None
     def get_user_name(self) -> str:
         """Get current user name"""
-        return self.current_user['name'] if self.current_user else None
+        return self.current_user.name if self.current_user else None
     def get_user_email(self) -> str:
         """Get current user email"""
-        return self.current_user['email'] if self.current_user else None
+        return self.current_user.email if self.current_user else None
     def get_user_department(self) -> str:
         """Get current user department (for students, faculty, secretary)"""
-        if self.current_user and 'department_id' in self.current_user:
-            departments = self.get_all_departments()
-            for dept in departments:
-                if dept['department_id'] == self.current_user['department_id']:
-                    return dept['name']
-        return None
+        # Joined into the session at login, so no query here
+        return self.current_user.department_name if self.current_user else None
+    
+    def invalidate_reference_data(self, role: str):
+        """Drop cached reference data affected by a new or changed user of this role"""
+        role = role.lower()
+        if role == 'faculty':
+            self.reference_cache.invalidate('faculty')
+        elif role == 'company':
+            self.reference_cache.invalidate('companies')
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get reference cache hit/miss counters"""
+        return self.reference_cache.get_stats()
     
     def cleanup(self):
         """Cleanup resources"""
+        self.report_indexer.shutdown()
         if self.model:
             self.model.close_connection()
\ No newline at end of file
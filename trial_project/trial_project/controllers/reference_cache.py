@@ -0,0 +1,52 @@
+import threading
+import time
+from typing import Any, Callable, Dict
+
+
+class ReferenceCache:
+    """Read-through cache with a TTL for rarely changing reference tables"""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: Dict[str, tuple] = {}  # key -> (loaded_at, value)
+        self._generations: Dict[str, int] = {}  # bumped on invalidation
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader when missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and now - entry[0] < self.ttl:
+                self._stats['hits'] += 1
+                return entry[1]
+            self._stats['misses'] += 1
+            generation = self._generations.get(key, 0)
+
+        # Load outside the lock so a slow query does not block other keys
+        value = loader()
+        with self._lock:
+            # A write that invalidated the key mid-load makes this value stale
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = (now, value)
+        return value
+
+    def invalidate(self, *keys: str):
+        """Drop cached entries after a write to their table"""
+        with self._lock:
+            for key in keys:
+                self._generations[key] = self._generations.get(key, 0) + 1
+                if self._entries.pop(key, None) is not None:
+                    self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Hit/miss counters plus the number of cached entries"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        return stats
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Optional
+
+
+class UserSession:
+    """The logged-in user's profile and department, loaded once at login"""
+
+    # Also reads like the user dict dashboards were given before
+    # (session['role'], session.get('cgpa')), so views need no special casing.
+
+    def __init__(self, model, identity: Dict[str, Any]):
+        self.model = model
+        self.role = identity['role']
+        self.user_id = identity['user_id']
+        self._profile: Dict[str, Any] = dict(identity)
+        self.refresh()
+
+    def refresh(self):
+        """Reload the profile after it changes; keeps the login identity if the read fails"""
+        profile = self.model.get_user_profile(self.role, self.user_id)
+        if profile:
+            self._profile.update(profile)
+        self._profile['role'] = self.role
+        self._profile['user_id'] = self.user_id
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._profile.get('name')
+
+    @property
+    def email(self) -> Optional[str]:
+        return self._profile.get('email')
+
+    @property
+    def department_id(self) -> Optional[int]:
+        return self._profile.get('department_id')
+
+    @property
+    def department_name(self) -> Optional[str]:
+        return self._profile.get('department_name')
+
+    def get(self, key: str, default=None):
+        return self._profile.get(key, default)
+
+    def __getitem__(self, key: str):
+        return self._profile[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._profile
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._profile)
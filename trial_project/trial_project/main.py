@@ -8,19 +8,40 @@ Main application entry point for Student Internship Management System
 
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from trial_project.config.db_config import CHECK_SCHEMA_ON_START
 from trial_project.controllers.internship_controller import InternshipController
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.query_metrics import metrics
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Student Internship Management System")
+    parser.add_argument('--backend', choices=BACKENDS,
+                        help="storage backend, overriding DB_BACKEND in config/db_config.py")
+    parser.add_argument('--query-report', metavar='PATH',
+                        help="on exit, write query timings as JSON to PATH ('-' prints a summary)")
+    parser.add_argument('--slow-query-ms', type=float,
+                        help="log statements at least this slow to the slow query log")
+    parser.add_argument('--skip-schema-check', action='store_true',
+                        help="do not look for pending migrations at startup (see setup/setup_database.py)")
+    return parser.parse_args()
 
 def main():
     """Main application entry point"""
+    args = parse_args()
+    if args.slow_query_ms is not None:
+        metrics.slow_threshold_ms = args.slow_query_ms
     try:
-        # Create and start the application
-        app = InternshipController()
+        # Create and start the application; the database connects behind the login window
+        app = InternshipController(DatabaseModel(backend_name=args.backend, connect=False),
+                                   check_schema=CHECK_SCHEMA_ON_START and not args.skip_schema_check)
         app.start_application()
         
     except KeyboardInterrupt:
@@ -33,6 +54,8 @@ def main():
         # Cleanup resources
         if 'app' in locals():
             app.cleanup()
+        if args.query_report:
+            metrics.dump(args.query_report)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
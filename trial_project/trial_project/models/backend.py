@@ -0,0 +1,64 @@
+import sqlite3
+from typing import Any, Dict
+
+from trial_project.config.db_config import (DB_CONFIG, SQLITE_CONFIG, POOL_NAME, POOL_CHECKOUT_TIMEOUT,
+                                            SQLITE_BUSY_TIMEOUT)
+
+BACKENDS = ('mysql', 'sqlite')
+
+# Driver errors the model layer handles. mysql.connector is imported only
+# when a MySQL pool is created, which adds its error class here, so callers
+# catch backend.Error (looked up when an exception is raised) rather than a
+# copy taken at import time.
+Error = (sqlite3.Error,)
+
+
+def _register_mysql_errors():
+    global Error
+    from mysql.connector import Error as MySQLError
+    if MySQLError not in Error:
+        Error = (MySQLError,) + Error
+
+
+def is_transient(e: Exception) -> bool:
+    """Whether a failed transaction can be replayed: deadlock, lock wait timeout or a busy SQLite file"""
+    if type(e).__module__.startswith('mysql.'):
+        from mysql.connector import errorcode
+        return getattr(e, 'errno', None) in (errorcode.ER_LOCK_DEADLOCK, errorcode.ER_LOCK_WAIT_TIMEOUT)
+    return isinstance(e, sqlite3.OperationalError) and 'locked' in str(e)
+
+
+def error_message(e: Exception) -> str:
+    """Driver error text without MySQL's errno prefix"""
+    return getattr(e, 'msg', None) or str(e)
+
+
+def default_config(backend: str) -> Dict[str, Any]:
+    return SQLITE_CONFIG if backend == 'sqlite' else DB_CONFIG
+
+
+def create_pool(backend: str, db_config: Dict[str, Any], pool_size: int):
+    """Connection pool and prepared statement registry for a backend"""
+    # Drivers are imported here so a SQLite install never needs mysql.connector
+    if backend == 'sqlite':
+        from trial_project.models.sqlite_backend import SQLitePool, SQLiteStatementRegistry
+        pool = SQLitePool(db_config['database'], busy_timeout=SQLITE_BUSY_TIMEOUT)
+        return pool, SQLiteStatementRegistry(pool)
+    if backend == 'mysql':
+        _register_mysql_errors()
+        from trial_project.models.connection_pool import ConnectionPool
+        from trial_project.models.statement_registry import StatementRegistry
+        pool = ConnectionPool(pool_name=POOL_NAME, pool_size=pool_size,
+                              checkout_timeout=POOL_CHECKOUT_TIMEOUT, **db_config)
+        return pool, StatementRegistry(pool)
+    raise ValueError(f"Unknown database backend '{backend}'")
+
+
+def migration_runner(backend: str, pool):
+    """Schema migration runner for a backend's pool"""
+    if backend == 'sqlite':
+        from trial_project.models.sqlite_backend import SQLiteMigrationRunner
+        return SQLiteMigrationRunner(pool)
+    _register_mysql_errors()
+    from trial_project.models.migrations import MigrationRunner
+    return MigrationRunner(pool)
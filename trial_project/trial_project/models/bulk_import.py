@@ -0,0 +1,163 @@
+import csv
+import json
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from trial_project.models import backend
+from trial_project.models.backend import error_message
+from trial_project.models.password_hasher import get_import_hasher, hash_many
+
+# Chunk size for executemany; each chunk is one transaction
+BATCH_SIZE = 1000
+
+# role -> (table, insert columns)
+IMPORT_TABLES = {
+    'student': ('students', ('name', 'email', 'password_hash', 'department_id', 'cgpa')),
+    'faculty': ('faculties', ('name', 'email', 'password_hash', 'department_id')),
+    'company': ('companies', ('name', 'email', 'password_hash', 'contact_person', 'phone', 'address')),
+}
+
+
+def read_records(path: str) -> Iterator[Tuple[int, Dict]]:
+    """Stream (line number, record) pairs from a CSV file with a header row or a JSONL file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        if path.lower().endswith(('.jsonl', '.ndjson')):
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    record = {'_error': f"invalid JSON: {e}"}
+                if not isinstance(record, dict):
+                    record = {'_error': "expected a JSON object"}
+                yield line_no, record
+        else:
+            reader = csv.DictReader(f)
+            for record in reader:
+                # Header is line 1; line_num also counts quoted newlines
+                yield reader.line_num, record
+
+
+class BulkImporter:
+    """Imports students, faculty or companies in batched transactions, collecting per-row failures"""
+
+    def __init__(self, model, role: str, batch_size: int = BATCH_SIZE):
+        role = role.lower()
+        if role not in IMPORT_TABLES:
+            raise ValueError(f"Cannot bulk import role '{role}'")
+        self.model = model
+        self.role = role
+        self.table, self.columns = IMPORT_TABLES[role]
+        self.batch_size = batch_size
+        # Import-cost hashes; the model upgrades each one the first time its user logs in
+        self.hasher = get_import_hasher(model.hasher.algorithm)
+        self.insert_sql = (f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+                           f"VALUES ({', '.join(['%s'] * len(self.columns))})")
+        # One query up front instead of a department lookup per row
+        self.departments = {d['name'].strip().lower(): d['department_id']
+                            for d in model.get_all_departments()}
+        self.seen_emails = set()
+
+    def run(self, records: Iterable[Tuple[int, Dict]], on_progress=None) -> Dict:
+        """Import every record, returning inserted/failed counts and the failures as (line, email, reason)"""
+        started = time.perf_counter()
+        result = {'inserted': 0, 'failed': [], 'seconds': 0.0}
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, self.batch_size))
+            if not chunk:
+                break
+            rows = []
+            for line_no, record in chunk:
+                row, reason = self.prepare(record)
+                if reason:
+                    result['failed'].append((line_no, record.get('email', ''), reason))
+                else:
+                    rows.append((line_no, row))
+            # Salted hashing dominates the cost of a row, so each chunk is hashed in parallel
+            hashes = hash_many(self.hasher, [row[2] for _, row in rows])
+            rows = [(line_no, row[:2] + (password_hash,) + row[3:])
+                    for (line_no, row), password_hash in zip(rows, hashes)]
+            self._insert_chunk(rows, result)
+            if on_progress:
+                on_progress(result['inserted'], len(result['failed']))
+
+        result['seconds'] = time.perf_counter() - started
+        return result
+
+    def prepare(self, record: Dict) -> Tuple[Optional[tuple], Optional[str]]:
+        """Validate one record and build its insert row, or return the reason it was rejected"""
+        if '_error' in record:
+            return None, record['_error']
+        name = (record.get('name') or record.get('full_name') or '').strip()
+        email = (record.get('email') or '').strip().lower()
+        password = record.get('password') or ''
+        if not name or not email or not password:
+            return None, "name, email and password are required"
+        if '@' not in email:
+            return None, "invalid email"
+        if email in self.seen_emails:
+            return None, "duplicate email in input"
+
+        # The plain password holds the hash's place until run() hashes the chunk
+        password_hash = password
+        if self.role == 'company':
+            contact = (record.get('contact_person') or name).strip()
+            row = (name, email, password_hash, contact, record.get('phone') or None, record.get('address') or None)
+        else:
+            dept_id = self.departments.get((record.get('department') or '').strip().lower())
+            if dept_id is None:
+                return None, f"unknown department '{record.get('department', '')}'"
+            if self.role == 'student':
+                try:
+                    cgpa = float(record.get('cgpa'))
+                except (TypeError, ValueError):
+                    return None, "cgpa must be a number"
+                if not 2.0 <= cgpa <= 4.0:
+                    return None, "cgpa must be between 2.00 and 4.00"
+                row = (name, email, password_hash, dept_id, cgpa)
+            else:
+                row = (name, email, password_hash, dept_id)
+
+        self.seen_emails.add(email)
+        return row, None
+
+    def _existing_emails(self, cursor, emails: List[str]) -> set:
+        placeholders = ', '.join(['%s'] * len(emails))
+        cursor.execute(f"SELECT email FROM {self.table} WHERE email IN ({placeholders})", tuple(emails))
+        return {row['email'].lower() for row in cursor.fetchall()}
+
+    def _insert_chunk(self, rows: List[Tuple[int, tuple]], result: Dict):
+        """Insert one chunk in a single transaction, falling back to row-by-row to isolate failures"""
+        if not rows:
+            return
+        try:
+            with self.model.pool.cursor(commit=True) as cursor:
+                existing = self._existing_emails(cursor, [row[1] for _, row in rows])
+                fresh = []
+                rejected = []
+                for line_no, row in rows:
+                    if row[1] in existing:
+                        rejected.append((line_no, row[1], "email already registered"))
+                    else:
+                        fresh.append(row)
+                if fresh:
+                    # The connector rewrites this into one multi-row INSERT
+                    cursor.executemany(self.insert_sql, fresh)
+            # Only counted once the chunk has committed
+            result['inserted'] += len(fresh)
+            result['failed'].extend(rejected)
+            return
+        except backend.Error as e:
+            print(f"Batch insert into {self.table} failed ({e}); retrying rows individually")
+
+        # The batch was rolled back; find the offending rows one at a time
+        for line_no, row in rows:
+            try:
+                with self.model.pool.cursor(commit=True) as cursor:
+                    cursor.execute(self.insert_sql, row)
+                result['inserted'] += 1
+            except backend.Error as e:
+                result['failed'].append((line_no, row[1], error_message(e)))
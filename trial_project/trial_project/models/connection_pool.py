@@ -0,0 +1,133 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
+
+from trial_project.models.query_metrics import InstrumentedCursor
+
+
+class ConnectionPool:
+    """Pooled MySQL connections with per-operation checkout/return"""
+
+    def __init__(self, pool_name: str, pool_size: int, checkout_timeout: float, **db_config):
+        self.pool_size = pool_size
+        self.checkout_timeout = checkout_timeout
+        # Sessions are not reset on return so prepared statements survive across
+        # checkouts (see StatementRegistry); the app sets no session state
+        self._pool = MySQLConnectionPool(pool_name=pool_name, pool_size=pool_size,
+                                         pool_reset_session=False, **db_config)
+        # The connector raises PoolError as soon as the pool is empty, so callers
+        # queue on this semaphore instead of failing outright
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'checkouts': 0,
+            'returns': 0,
+            'waits': 0,
+            'wait_time': 0.0,
+            'exhausted': 0,
+            'timeouts': 0,
+            'health_check_failures': 0,
+        }
+
+    def _count(self, key: str, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def checkout(self):
+        """Take a healthy connection from the pool, waiting if all are in use"""
+        if not self._slots.acquire(blocking=False):
+            self._count('exhausted')
+            started = time.perf_counter()
+            acquired = self._slots.acquire(timeout=self.checkout_timeout)
+            self._count('wait_time', time.perf_counter() - started)
+            if not acquired:
+                self._count('timeouts')
+                raise PoolError(f"No connection available after {self.checkout_timeout}s; pool exhausted")
+            self._count('waits')
+
+        connection = None
+        try:
+            connection = self._pool.get_connection()
+            if not self._is_healthy(connection):
+                self._count('health_check_failures')
+                connection.reconnect(attempts=2, delay=0)
+        except Exception:
+            if connection is not None:
+                # Hand the dead connection back, or the pool shrinks by one per failed reconnect
+                try:
+                    connection.close()
+                except Error:
+                    pass
+            self._slots.release()
+            raise
+
+        self._count('checkouts')
+        return connection
+
+    def release(self, connection):
+        """Return a connection to the pool"""
+        try:
+            # Without a session reset, an open read transaction would pin the
+            # next user to a stale REPEATABLE READ snapshot
+            if connection.in_transaction:
+                connection.rollback()
+            connection.close()
+        except Error as e:
+            print(f"Error returning connection to pool: {e}")
+        finally:
+            self._slots.release()
+            self._count('returns')
+
+    def _is_healthy(self, connection) -> bool:
+        """Ping the server so stale connections are replaced before use"""
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for one operation and always return it"""
+        connection = self.checkout()
+        try:
+            yield connection
+        except Exception:
+            try:
+                connection.rollback()
+            except Error:
+                pass
+            raise
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def cursor(self, commit: bool = False):
+        """Dictionary cursor on a checked-out connection, committed on success if requested"""
+        with self.connection() as connection:
+            cursor = connection.cursor(dictionary=True, buffered=True)
+            try:
+                yield InstrumentedCursor(cursor)
+                if commit:
+                    connection.commit()
+            finally:
+                cursor.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of pool usage counters"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['pool_size'] = self.pool_size
+        stats['in_use'] = stats['checkouts'] - stats['returns']
+        return stats
+
+    def close(self):
+        """Close every idle connection held by the pool"""
+        # MySQLConnectionPool has no public way to close its connections; this
+        # relies on the connector-internal _remove_connections() (present in
+        # mysql-connector-python 8.x and 9.x)
+        self._pool._remove_connections()
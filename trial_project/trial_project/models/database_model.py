@@ -1,205 +1,172 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import hashlib
-from typing import Optional, List, Dict, Any
-import mysql.connector
-from mysql.connector import Error
+import time
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
 
+from trial_project.config.db_config import (DB_BACKEND, POOL_SIZE, CHANGE_FEED_OVERLAP,
+                                            TRANSACTION_RETRIES, TRANSACTION_RETRY_DELAY)
+from trial_project.models import backend
+from trial_project.models.backend import create_pool, default_config, is_transient, migration_runner
+from trial_project.models.schema import IDENTITY_SOURCES
+from trial_project.models.password_hasher import get_hasher, identify_hasher
+from trial_project.models.query_metrics import instrument_methods
+
+@instrument_methods
 class DatabaseModel:
     """Handles all database operations and connections"""
     
-    def __init__(self):
-        self.connection = None
-        self.cursor = None
-        self.connect_to_database()
-        self.create_tables()
+    def __init__(self, pool_size: int = POOL_SIZE, db_config: Optional[Dict[str, Any]] = None,
+                 backend_name: str = None, connect: bool = True):
+        self.pool = None
+        self.statements = None
+        self.pool_size = pool_size
+        self.backend = backend_name or DB_BACKEND
+        self.db_config = db_config or default_config(self.backend)
+        self.hasher = get_hasher()
+        # With connect=False nothing touches the database until start() runs,
+        # which the app does on a worker thread once the login window is up
+        if connect:
+            self.connect_to_database(pool_size)
+            self.apply_migrations()
     
-    def connect_to_database(self):
-        """Establish connection to MySQL database"""
+    def connect_to_database(self, pool_size: int = POOL_SIZE):
+        """Create the connection pool for the configured backend"""
         try:
-            self.connection = mysql.connector.connect(
-                host='localhost',
-                database='trial_db',
-                user='root',
-                password='password'
-            )
-            self.cursor = self.connection.cursor(dictionary=True)
-            print("Connected to MySQL database successfully")
-        except Error as e:
-            print(f"Error connecting to MySQL: {e}")
+            self.pool, self.statements = create_pool(self.backend, self.db_config, pool_size)
+            print(f"Connected to {self.backend} database successfully")
+        except backend.Error as e:
+            print(f"Error connecting to {self.backend}: {e}")
             messagebox.showerror("Database Error", f"Failed to connect to database: {e}")
     
-    def create_tables(self):
-        """Create all necessary tables"""
-        try:
-            tables = {
-                'department': """
-                    CREATE TABLE IF NOT EXISTS department (
-                        department_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL UNIQUE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """,
-                'students': """
-                    CREATE TABLE IF NOT EXISTS students (
-                        student_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        cgpa DECIMAL(3,2) CHECK (cgpa >= 2.00 AND cgpa <= 4.00),
-                        department_id INT,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (department_id) REFERENCES department(department_id)
-                    )
-                """,
-                'faculties': """
-                    CREATE TABLE IF NOT EXISTS faculties (
-                        faculty_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        department_id INT,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (department_id) REFERENCES department(department_id)
-                    )
-                """,
-                'secretaries': """
-                    CREATE TABLE IF NOT EXISTS secretaries (
-                        secretary_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        faculty_id INT,
-                        department_id INT,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
-                        FOREIGN KEY (department_id) REFERENCES department(department_id)
-                    )
-                """,
-                'admins': """
-                    CREATE TABLE IF NOT EXISTS admins (
-                        admin_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(100) NOT NULL,
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """,
-                'companies': """
-                    CREATE TABLE IF NOT EXISTS companies (
-                        company_id INT AUTO_INCREMENT PRIMARY KEY,
-                        name VARCHAR(200) NOT NULL,
-                        contact_person VARCHAR(100),
-                        email VARCHAR(100) UNIQUE NOT NULL,
-                        password_hash VARCHAR(255) NOT NULL,
-                        phone VARCHAR(20),
-                        address TEXT,
-                        registered BOOLEAN DEFAULT FALSE,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """,
-                'quotas': """
-                    CREATE TABLE IF NOT EXISTS quotas (
-                        quota_id INT AUTO_INCREMENT PRIMARY KEY,
-                        company_id INT,
-                        department VARCHAR(100),
-                        total_slots INT NOT NULL,
-                        available_slots INT NOT NULL,
-                        deadline DATE,
-                        description TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (company_id) REFERENCES companies(company_id)
-                    )
-                """,
-                'applications': """
-                    CREATE TABLE IF NOT EXISTS applications (
-                        app_id INT AUTO_INCREMENT PRIMARY KEY,
-                        student_id INT,
-                        company_id INT,
-                        quota_id INT,
-                        status ENUM('pending', 'approved', 'rejected', 'completed') DEFAULT 'pending',
-                        application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        report_path VARCHAR(255),
-                        self_found BOOLEAN DEFAULT FALSE,
-                        FOREIGN KEY (student_id) REFERENCES students(student_id),
-                        FOREIGN KEY (company_id) REFERENCES companies(company_id),
-                        FOREIGN KEY (quota_id) REFERENCES quotas(quota_id)
-                    )
-                """,
-                'reports': """
-                    CREATE TABLE IF NOT EXISTS reports (
-                        report_id INT AUTO_INCREMENT PRIMARY KEY,
-                        student_id INT,
-                        faculty_id INT,
-                        app_id INT,
-                        grade VARCHAR(10),
-                        comments TEXT,
-                        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (student_id) REFERENCES students(student_id),
-                        FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
-                        FOREIGN KEY (app_id) REFERENCES applications(app_id)
-                    )
-                """,
-                'feedback': """
-                    CREATE TABLE IF NOT EXISTS feedback (
-                        feedback_id INT AUTO_INCREMENT PRIMARY KEY,
-                        company_id INT,
-                        student_id INT,
-                        app_id INT,
-                        rating INT CHECK (rating >= 1 AND rating <= 5),
-                        remarks TEXT,
-                        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (company_id) REFERENCES companies(company_id),
-                        FOREIGN KEY (student_id) REFERENCES students(student_id),
-                        FOREIGN KEY (app_id) REFERENCES applications(app_id)
-                    )
-                """,
-                'faculty_assignments': """
-                    CREATE TABLE IF NOT EXISTS faculty_assignments (
-                        assignment_id INT AUTO_INCREMENT PRIMARY KEY,
-                        faculty_id INT,
-                        student_id INT,
-                        assigned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
-                        FOREIGN KEY (student_id) REFERENCES students(student_id)
-                    )
-                """
-            }
-            
-            for table_name, query in tables.items():
-                self.cursor.execute(query)
-                self.connection.commit()
-            
-            # Insert default departments if they don't exist
-            self.insert_default_departments()
-            
-            print("All tables created successfully")
-            
-        except Error as e:
-            print(f"Error creating tables: {e}")
+    def start(self, check_schema: bool = True):
+        """Connect and, unless told not to, apply pending migrations; raises instead of showing dialogs"""
+        pool, statements = create_pool(self.backend, self.db_config, self.pool_size)
+        if check_schema:
+            try:
+                migration_runner(self.backend, pool).migrate()
+            except backend.Error:
+                pool.close()
+                raise
+        self.pool, self.statements = pool, statements
+        print(f"Connected to {self.backend} database successfully")
+    
+    @property
+    def is_connected(self) -> bool:
+        return self.pool is not None
+    
+    # Each call checks out its own pooled connection, so no cursor state is
+    # shared between operations or threads
+    def _fetch_all(self, query: str, params: tuple = (), statement: str = None) -> List[Dict]:
+        """Run a SELECT and return all rows, as a named prepared statement when one is given"""
+        if statement:
+            return self._run_prepared(statement, query, params)[0]
+        with self.pool.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+    
+    def _fetch_one(self, query: str, params: tuple = (), statement: str = None) -> Optional[Dict]:
+        """Run a SELECT and return the first row"""
+        if statement:
+            rows = self._run_prepared(statement, query, params)[0]
+            return rows[0] if rows else None
+        with self.pool.cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchone()
+    
+    def _run_prepared(self, statement: str, query: str, params: tuple) -> Tuple[List[Dict], int]:
+        """Execute query through the statement registry, registering it under its name on first use"""
+        if not self.statements.is_registered(statement):
+            self.statements.register(statement, query)
+        return self.statements.run(statement, params)
+    
+    def _execute(self, query: str, params: tuple = ()) -> int:
+        """Run a single write statement and commit it, returning the affected row count"""
+        with self.pool.cursor(commit=True) as cursor:
+            cursor.execute(query, params)
+            return cursor.rowcount
+    
+    def _fetch_page(self, query: str, params: tuple, order_by: List[Tuple[str, str]],
+                    after: Optional[tuple], limit: int, descending: bool = False,
+                    statement: str = None) -> Tuple[List[Dict], Optional[tuple]]:
+        """Fetch one keyset page, returning the rows and the next page's cursor (None at the end)"""
+        # query must end with its WHERE clause ("WHERE 1 = 1" when unfiltered) and
+        # order_by must list (sql column, result key) pairs that order rows uniquely
+        params = list(params)
+        if after is not None:
+            # (c1, c2) > (v1, v2) expanded so MySQL can range-scan the index
+            op = '<' if descending else '>'
+            terms = []
+            for i, (column, _) in enumerate(order_by):
+                equal = [f"{prev} = %s" for prev, _ in order_by[:i]]
+                terms.append("(" + " AND ".join(equal + [f"{column} {op} %s"]) + ")")
+                params.extend(after[:i + 1])
+            query += " AND (" + " OR ".join(terms) + ")"
+
+        direction = 'DESC' if descending else 'ASC'
+        query += " ORDER BY " + ", ".join(f"{column} {direction}" for column, _ in order_by)
+        query += " LIMIT %s"
+        params.append(limit + 1)
+
+        # First and later pages differ in SQL, so each gets its own prepared statement
+        if statement:
+            statement += ':after' if after is not None else ':first'
+        rows = self._fetch_all(query, tuple(params), statement)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, tuple(rows[-1][key] for _, key in order_by)
+    
+    def _fetch_changes(self, query: str, params: tuple, column: str,
+                       since: Optional[datetime]) -> Tuple[List[Dict], datetime]:
+        """Fetch rows whose updated_at column is newer than since, returning the rows and the next version"""
+        # query must end with its WHERE clause. The version is the server clock
+        # read before the query, so the next poll starts where this one looked.
+        with self.pool.cursor() as cursor:
+            cursor.execute("SELECT CURRENT_TIMESTAMP(6) AS version")
+            version = cursor.fetchone()['version']
+            if since is None:
+                return [], version
+            cursor.execute(f"{query} AND {column} > %s ORDER BY {column}",
+                           tuple(params) + (since - timedelta(seconds=CHANGE_FEED_OVERLAP),))
+            return cursor.fetchall(), version
+    
+    def _run_transaction(self, work):
+        """Run work(cursor) in one committed transaction, retrying it on deadlock or lock wait timeout"""
+        for attempt in range(TRANSACTION_RETRIES + 1):
+            try:
+                with self.pool.cursor(commit=True) as cursor:
+                    return work(cursor)
+            except backend.Error as e:
+                # The transaction has been rolled back; the whole unit is safe to replay
+                if not is_transient(e) or attempt == TRANSACTION_RETRIES:
+                    raise
+                time.sleep(TRANSACTION_RETRY_DELAY * (attempt + 1))
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage counters"""
+        return self.pool.get_stats() if self.pool else {}
     
-    def insert_default_departments(self):
-        """Insert default departments"""
+    def get_statement_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-statement execution counts and latency for prepared statements"""
+        return self.statements.get_stats() if self.statements else {}
+    
+    def apply_migrations(self):
+        """Bring the schema up to date; no DDL runs when it is already current"""
+        if not self.pool:
+            return
         try:
-            departments = ['Computer Science', 'Electrical Engineering', 'Mechanical Engineering', 
-                          'Civil Engineering', 'Business Administration']
-            
-            for dept in departments:
-                query = "INSERT IGNORE INTO department (name) VALUES (%s)"
-                self.cursor.execute(query, (dept,))
-            
-            self.connection.commit()
-        except Error as e:
-            print(f"Error inserting departments: {e}")
+            migration_runner(self.backend, self.pool).migrate()
+        except backend.Error as e:
+            print(f"Error applying schema migrations: {e}")
     
     def get_department_id(self, department_name: str) -> Optional[int]:
         """Get department ID by name"""
         try:
             query = "SELECT department_id FROM department WHERE name = %s"
-            self.cursor.execute(query, (department_name,))
-            result = self.cursor.fetchone()
+            result = self._fetch_one(query, (department_name,), statement='department_id_by_name')
             return result['department_id'] if result else None
-        except Error as e:
+        except backend.Error as e:
             print(f"Error getting department ID: {e}")
             return None
     
@@ -207,19 +174,32 @@ class DatabaseModel:
         """Get all departments"""
         try:
             query = "SELECT * FROM department ORDER BY name"
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query)
+        except backend.Error as e:
             print(f"Error getting departments: {e}")
             return []
     
     def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password with a per-user salt using the configured hasher"""
+        return self.hasher.hash(password)
     
     def verify_password(self, password: str, hashed: str) -> bool:
-        """Verify password against hash"""
-        return self.hash_password(password) == hashed
+        """Verify password against a stored hash of any supported format"""
+        hasher = identify_hasher(hashed or '')
+        return bool(hasher and hasher.verify(password, hashed))
+    
+    def rehash_password_if_needed(self, table: str, id_field: str, user_id: int, password: str, hashed: str):
+        """Upgrade a legacy or weaker stored hash after a successful login"""
+        if not self.hasher.needs_rehash(hashed):
+            return
+        try:
+            self._execute(
+                f"UPDATE {table} SET password_hash = %s WHERE {id_field} = %s AND password_hash = %s",
+                (self.hash_password(password), user_id, hashed)
+            )
+        except backend.Error as e:
+            # The old hash still works, so the login goes ahead
+            print(f"Error upgrading password hash: {e}")
     
     # User Management based on roles
     def create_user_by_role(self, role: str, **kwargs) -> bool:
@@ -272,10 +252,9 @@ class DatabaseModel:
                 INSERT INTO students (name, email, password_hash, department_id, cgpa)
                 VALUES (%s, %s, %s, %s, %s)
             """
-            self.cursor.execute(query, (name, email, password_hash, dept_id, cgpa))
-            self.connection.commit()
+            self._execute(query, (name, email, password_hash, dept_id, cgpa))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error creating student: {e}")
             return False
     
@@ -290,10 +269,9 @@ class DatabaseModel:
                 INSERT INTO faculties (name, email, password_hash, department_id)
                 VALUES (%s, %s, %s, %s)
             """
-            self.cursor.execute(query, (name, email, password_hash, dept_id))
-            self.connection.commit()
+            self._execute(query, (name, email, password_hash, dept_id))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error creating faculty: {e}")
             return False
     
@@ -308,10 +286,9 @@ class DatabaseModel:
                 INSERT INTO secretaries (name, email, password_hash, department_id, faculty_id)
                 VALUES (%s, %s, %s, %s, %s)
             """
-            self.cursor.execute(query, (name, email, password_hash, dept_id, faculty_id))
-            self.connection.commit()
+            self._execute(query, (name, email, password_hash, dept_id, faculty_id))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error creating secretary: {e}")
             return False
     
@@ -322,44 +299,67 @@ class DatabaseModel:
                 INSERT INTO companies (name, email, password_hash, contact_person)
                 VALUES (%s, %s, %s, %s)
             """
-            self.cursor.execute(query, (name, email, password_hash, name))
-            self.connection.commit()
+            self._execute(query, (name, email, password_hash, name))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error creating company: {e}")
             return False
     
-    def authenticate_user(self, email: str, password: str, role: str) -> Optional[Dict]:
-        """Authenticate user login based on role"""
+    def get_identities(self, email: str, role: str = None) -> List[Dict]:
+        """Look up login identities for an email, optionally for one role"""
+        # Primary key (email, role) makes this a single index lookup
+        query = """
+            SELECT role, user_id, name, email, department_id, password_hash
+            FROM user_identities
+            WHERE email = %s
+        """
+        params = (email,)
+        if role:
+            query += " AND role = %s"
+            params = (email, role.lower())
+        return self._fetch_all(query, params, statement='identities_by_email' + ('_and_role' if role else ''))
+    
+    def authenticate_user(self, email: str, password: str, role: str = None) -> Optional[Dict]:
+        """Authenticate user login, trying every role the email is registered under unless one is given"""
         try:
-            table_map = {
-                'student': 'students',
-                'faculty': 'faculties', 
-                'secretary': 'secretaries',
-                'company': 'companies',
-                'admin': 'admins'
-            }
-            
-            table = table_map.get(role.lower())
-            if not table:
-                return None
-            
-            # Get ID field name based on table
-            id_field = f"{role.lower()}_id"
-            
-            query = f"SELECT * FROM {table} WHERE email = %s"
-            self.cursor.execute(query, (email,))
-            user = self.cursor.fetchone()
-            
-            if user and self.verify_password(password, user['password_hash']):
-                user['role'] = role.lower()
-                user['user_id'] = user[id_field] 
+            # Rows come back in no particular order; try roles in IDENTITY_SOURCES
+            # precedence so the same email always logs in as the same role
+            precedence = list(IDENTITY_SOURCES)
+            identities = sorted(self.get_identities(email, role), key=lambda user: precedence.index(user['role']))
+            for user in identities:
+                if not self.verify_password(password, user['password_hash']):
+                    continue
+                table, id_field, _ = IDENTITY_SOURCES[user['role']]
+                self.rehash_password_if_needed(table, id_field, user['user_id'], password, user['password_hash'])
+                del user['password_hash']
+                user[id_field] = user['user_id']
                 return user
             return None
-        except Error as e:
+        except backend.Error as e:
             print(f"Error authenticating user: {e}")
             return None
     
+    def get_user_profile(self, role: str, user_id: int) -> Optional[Dict]:
+        """Get a user's profile row with the department name, without the password hash"""
+        try:
+            table, id_field, dept_column = IDENTITY_SOURCES[role.lower()]
+            if dept_column:
+                query = f"""
+                    SELECT u.*, d.name AS department_name
+                    FROM {table} u
+                    LEFT JOIN department d ON u.{dept_column} = d.department_id
+                    WHERE u.{id_field} = %s
+                """
+            else:
+                query = f"SELECT * FROM {table} WHERE {id_field} = %s"
+            profile = self._fetch_one(query, (user_id,))
+            if profile:
+                profile.pop('password_hash', None)
+            return profile
+        except backend.Error as e:
+            print(f"Error getting user profile: {e}")
+            return None
+    
     # Admin Management
     
     def get_all_faculty_with_department(self):
@@ -369,17 +369,33 @@ class DatabaseModel:
             LEFT JOIN department d ON f.department_id = d.department_id
             ORDER BY f.name
         """
-        self.cursor.execute(query)
-        return self.cursor.fetchall()
+        return self._fetch_all(query)
     def get_total_students_for_faculty(self, faculty_id):
         query = """
             SELECT COUNT(*) AS total
             FROM faculty_assignments
             WHERE faculty_id = %s
         """
-        self.cursor.execute(query, (faculty_id,))
-        result = self.cursor.fetchone()
+        result = self._fetch_one(query, (faculty_id,))
         return result["total"] if result else 0
+    def get_faculty_with_student_counts_page(self, department_id: int = None, after: tuple = None,
+                                             limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of faculty with assigned student counts, ordered by name"""
+        # Counting per row uses idx_faculty_assignments_faculty and stays cheap for one page
+        query = """
+            SELECT f.faculty_id, f.name, f.email, f.created_at, d.name AS department,
+                   (SELECT COUNT(*) FROM faculty_assignments fa
+                    WHERE fa.faculty_id = f.faculty_id) AS total_students
+            FROM faculties f
+            LEFT JOIN department d ON f.department_id = d.department_id
+            WHERE 1 = 1
+        """
+        params = ()
+        if department_id is not None:
+            query += " AND f.department_id = %s"
+            params = (department_id,)
+        return self._fetch_page(query, params, [('f.name', 'name'), ('f.faculty_id', 'faculty_id')],
+                                after, limit)
     def get_faculties_by_department(self, department_id):
         query = """
             SELECT f.faculty_id, f.name, f.email, d.name AS department, f.created_at
@@ -387,31 +403,21 @@ class DatabaseModel:
             JOIN department d ON f.department_id = d.department_id
             WHERE f.department_id = %s
         """
-        self.cursor.execute(query, (department_id,))
-        return self.cursor.fetchall()
+        return self._fetch_all(query, (department_id,))
     def get_all_departments(self):
-        self.cursor.execute("SELECT department_id, name FROM department ORDER BY name")
-        return self.cursor.fetchall()
+        return self._fetch_all("SELECT department_id, name FROM department ORDER BY name")
     def delete_faculty_by_id(self, faculty_id):
-        try:
+        # All deletes share one transaction; the pool rolls it back on failure
+        with self.pool.cursor(commit=True) as cursor:
             # Remove dependencies first
-            self.cursor.execute("DELETE FROM faculty_assignments WHERE faculty_id = %s", (faculty_id,))
-            self.cursor.execute("DELETE FROM secretaries WHERE faculty_id = %s", (faculty_id,))
-            self.cursor.execute("DELETE FROM reports WHERE faculty_id = %s", (faculty_id,))
+            cursor.execute("DELETE FROM faculty_assignments WHERE faculty_id = %s", (faculty_id,))
+            cursor.execute("DELETE FROM secretaries WHERE faculty_id = %s", (faculty_id,))
+            cursor.execute("DELETE FROM reports WHERE faculty_id = %s", (faculty_id,))
 
             # Delete from faculties
-            self.cursor.execute("DELETE FROM faculties WHERE faculty_id = %s", (faculty_id,))
-            self.connection.commit()
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+            cursor.execute("DELETE FROM faculties WHERE faculty_id = %s", (faculty_id,))
     def set_faculty_verified(self, faculty_id):
-        try:
-            self.cursor.execute("UPDATE faculties SET verified = TRUE WHERE faculty_id = %s", (faculty_id,))
-            self.connection.commit()
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        self._execute("UPDATE faculties SET verified = TRUE WHERE faculty_id = %s", (faculty_id,))
         
     # TAB-02: Related To 'View Secretary' Tab
     def get_all_secretary_with_department(self):
@@ -422,8 +428,7 @@ class DatabaseModel:
         ORDER BY s.name
         """
         try:
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
+            return self._fetch_all(query)
         except Exception as e:
             raise e
     def get_secretaries_by_department(self, department_id):
@@ -434,15 +439,24 @@ class DatabaseModel:
             WHERE s.department_id = %s
             ORDER BY s.name
         """
-        self.cursor.execute(query, (department_id,))
-        return self.cursor.fetchall()
+        return self._fetch_all(query, (department_id,))
+    def get_secretaries_page(self, department_id: int = None, after: tuple = None,
+                             limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of secretaries with department, ordered by name"""
+        query = """
+            SELECT s.secretary_id, s.name, s.email, d.name AS department, s.created_at
+            FROM secretaries s
+            LEFT JOIN department d ON s.department_id = d.department_id
+            WHERE 1 = 1
+        """
+        params = ()
+        if department_id is not None:
+            query += " AND s.department_id = %s"
+            params = (department_id,)
+        return self._fetch_page(query, params, [('s.name', 'name'), ('s.secretary_id', 'secretary_id')],
+                                after, limit)
     def delete_secretary_by_id(self, secretary_id):
-        try:
-            self.cursor.execute("DELETE FROM secretaries WHERE secretary_id = %s", (secretary_id,))
-            self.connection.commit()
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        self._execute("DELETE FROM secretaries WHERE secretary_id = %s", (secretary_id,))
 
     # TAB-03: Related To 'View Company' Tab
     def get_all_companies(self):
@@ -451,8 +465,7 @@ class DatabaseModel:
             FROM companies
             ORDER BY name
         """
-        self.cursor.execute(query)
-        return [dict(row) for row in self.cursor.fetchall()]
+        return [dict(row) for row in self._fetch_all(query)]
     
     
 
@@ -463,33 +476,36 @@ class DatabaseModel:
             WHERE registered = %s
             ORDER BY name
         """
-        self.cursor.execute(query, (is_registered,))
-        return [dict(row) for row in self.cursor.fetchall()]
+        return [dict(row) for row in self._fetch_all(query, (is_registered,))]
+
+    def get_companies_page(self, is_registered: bool = None, after: tuple = None,
+                           limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of companies, optionally filtered by registration, ordered by name"""
+        query = """
+            SELECT company_id, name, contact_person, email, phone, address, registered
+            FROM companies
+            WHERE 1 = 1
+        """
+        params = ()
+        if is_registered is not None:
+            query += " AND registered = %s"
+            params = (is_registered,)
+        return self._fetch_page(query, params, [('name', 'name'), ('company_id', 'company_id')],
+                                after, limit)
 
     def delete_company_by_id(self, company_id):
-        try:
-            self.cursor.execute("DELETE FROM companies WHERE company_id = %s", (company_id,))
-            self.connection.commit()
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        self._execute("DELETE FROM companies WHERE company_id = %s", (company_id,))
 
     def set_company_verified(self, company_id):
-        try:
-            self.cursor.execute("UPDATE companies SET registered = TRUE WHERE company_id = %s", (company_id,))
-            self.connection.commit()
-        except Exception as e:
-            self.connection.rollback()
-            raise e
+        self._execute("UPDATE companies SET registered = TRUE WHERE company_id = %s", (company_id,))
 
     # Company Management
     def get_all_companies(self) -> List[Dict]:
         """Get all companies"""
         try:
             query = "SELECT * FROM companies ORDER BY name"
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query)
+        except backend.Error as e:
             print(f"Error getting companies: {e}")
             return []
     
@@ -504,35 +520,241 @@ class DatabaseModel:
                 JOIN applications a ON s.student_id = a.student_id
                 WHERE fa.faculty_id = %s AND a.status = 'approved'
             """
-            self.cursor.execute(query, (faculty_id,))
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query, (faculty_id,))
+        except backend.Error as e:
             print(f"Error retrieving assigned students: {e}")
             return []
 
-    def get_reports_assigned_to_faculty(self, faculty_id: int) -> List[Dict]:
+    def _report_keyword_filter(self, keywords: Optional[str]) -> Tuple[str, tuple]:
+        """SQL condition on reports r matching reports whose text contains every keyword"""
+        from trial_project.models.text_extraction import query_terms
+        terms = query_terms(keywords or '')
+        if not terms:
+            return "", ()
+        # One primary key lookup in report_terms per keyword; no file is read
+        placeholders = ", ".join(["%s"] * len(terms))
+        condition = f"""
+            AND r.app_id IN (
+                SELECT a.app_id
+                FROM applications a
+                JOIN report_terms t ON t.sha256 = a.report_sha256
+                WHERE t.term IN ({placeholders})
+                GROUP BY a.app_id
+                HAVING COUNT(*) = %s
+            )
+        """
+        return condition, tuple(terms) + (len(terms),)
+    
+    def get_reports_assigned_to_faculty(self, faculty_id: int, keywords: str = None) -> List[Dict]:
         try:
+            condition, params = self._report_keyword_filter(keywords)
             query = """
                 SELECT r.report_id, s.name as student_name, r.grade, r.comments, r.submitted_at
                 FROM reports r
                 JOIN students s ON r.student_id = s.student_id
                 WHERE r.faculty_id = %s
-            """
-            self.cursor.execute(query, (faculty_id,))
-            return self.cursor.fetchall()
-        except Error as e:
+            """ + condition
+            return self._fetch_all(query, (faculty_id,) + params)
+        except backend.Error as e:
             print(f"Error retrieving reports: {e}")
             return []
         
+    def get_students_assigned_to_faculty_page(self, faculty_id: int, after: tuple = None,
+                                              limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of approved students assigned to a faculty, ordered by name"""
+        query = """
+            SELECT DISTINCT s.student_id, s.name, s.email, s.cgpa, d.name AS department
+            FROM faculty_assignments fa
+            JOIN students s ON fa.student_id = s.student_id
+            JOIN department d ON s.department_id = d.department_id
+            JOIN applications a ON s.student_id = a.student_id
+            WHERE fa.faculty_id = %s AND a.status = 'approved'
+        """
+        return self._fetch_page(query, (faculty_id,), [('s.name', 'name'), ('s.student_id', 'student_id')],
+                                after, limit)
+
+    def get_faculty_assignment_changes(self, faculty_id: int,
+                                       since: Optional[datetime]) -> Tuple[List[Dict], datetime]:
+        """Get a faculty's approved students whose assignment was created or moved since a change-feed version"""
+        # Same rows as get_students_assigned_to_faculty_page; updated_at is selected
+        # because DISTINCT needs the ORDER BY column in the select list
+        query = """
+            SELECT DISTINCT s.student_id, s.name, s.email, s.cgpa, d.name AS department, fa.updated_at
+            FROM faculty_assignments fa
+            JOIN students s ON fa.student_id = s.student_id
+            JOIN department d ON s.department_id = d.department_id
+            JOIN applications a ON s.student_id = a.student_id
+            WHERE fa.faculty_id = %s AND a.status = 'approved'
+        """
+        return self._fetch_changes(query, (faculty_id,), 'fa.updated_at', since)
+
+    def get_reports_assigned_to_faculty_page(self, faculty_id: int, after: tuple = None,
+                                             limit: int = 200, keywords: str = None) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of reports for a faculty, newest first, optionally only those mentioning keywords"""
+        condition, params = self._report_keyword_filter(keywords)
+        query = """
+            SELECT r.report_id, s.name as student_name, r.grade, r.comments, r.submitted_at
+            FROM reports r
+            JOIN students s ON r.student_id = s.student_id
+            WHERE r.faculty_id = %s
+        """ + condition
+        return self._fetch_page(query, (faculty_id,) + params,
+                                [('r.submitted_at', 'submitted_at'), ('r.report_id', 'report_id')],
+                                after, limit, descending=True)
+        
     def grade_student_report(self, report_id: int, grade: str, comments: str) -> bool:
         try:
             query = "UPDATE reports SET grade = %s, comments = %s WHERE report_id = %s"
-            self.cursor.execute(query, (grade, comments, report_id))
-            self.connection.commit()
+            self._execute(query, (grade, comments, report_id))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error grading report: {e}")
             return False
+    
+    # Report text index, filled by ReportIndexer
+    def get_unindexed_report_files(self, limit: int = 100) -> List[Dict]:
+        """Get stored report files whose text has not been extracted yet, oldest first"""
+        try:
+            query = """
+                SELECT f.sha256, f.mime_type
+                FROM report_files f
+                LEFT JOIN report_texts t ON t.sha256 = f.sha256
+                WHERE t.sha256 IS NULL
+                ORDER BY f.created_at
+                LIMIT %s
+            """
+            return self._fetch_all(query, (limit,))
+        except backend.Error as e:
+            print(f"Error getting unindexed reports: {e}")
+            return []
+    
+    def save_report_text(self, sha256: str, content: str, terms, error: Optional[str] = None,
+                         signature: Optional[List[int]] = None) -> bool:
+        """Store a report's extracted text, index terms and MinHash signature; a file already indexed is left as it is"""
+        def save(cursor):
+            cursor.execute("""
+                INSERT IGNORE INTO report_texts (sha256, content, term_count, error)
+                VALUES (%s, %s, %s, %s)
+            """, (sha256, content, len(terms), error))
+            if cursor.rowcount and terms:
+                cursor.executemany("INSERT IGNORE INTO report_terms (term, sha256) VALUES (%s, %s)",
+                                   [(term, sha256) for term in terms])
+            if signature is not None:
+                self._save_signature(cursor, sha256, signature)
+            return True
+        
+        try:
+            return self._run_transaction(save)
+        except backend.Error as e:
+            print(f"Error saving report text: {e}")
+            return False
+
+    def _save_signature(self, cursor, sha256: str, signature: List[int]):
+        from trial_project.models import minhash
+        cursor.execute("INSERT IGNORE INTO report_signatures (sha256, signature) VALUES (%s, %s)",
+                       (sha256, minhash.pack(signature)))
+        # A text without words gets an empty signature and no buckets, so it is never a candidate
+        if cursor.rowcount and signature:
+            cursor.executemany("INSERT IGNORE INTO report_lsh_buckets (band, bucket, sha256) VALUES (%s, %s, %s)",
+                               [(band, bucket, sha256) for band, bucket in enumerate(minhash.band_buckets(signature))])
+
+    def save_report_signatures(self, signatures: List[Tuple[str, List[int]]]) -> bool:
+        """Store MinHash signatures computed for already extracted report texts"""
+        def save(cursor):
+            for sha256, signature in signatures:
+                self._save_signature(cursor, sha256, signature)
+            return True
+
+        try:
+            return self._run_transaction(save)
+        except backend.Error as e:
+            print(f"Error saving report signatures: {e}")
+            return False
+
+    def get_unsigned_report_texts(self, department_id: int = None, limit: int = 50) -> List[Dict]:
+        """Get extracted report texts that have no MinHash signature yet, optionally for one department"""
+        try:
+            query = """
+                SELECT t.sha256, t.content
+                FROM report_texts t
+                LEFT JOIN report_signatures sig ON sig.sha256 = t.sha256
+                WHERE sig.sha256 IS NULL
+            """
+            params = ()
+            if department_id is not None:
+                query += """
+                    AND t.sha256 IN (
+                        SELECT a.report_sha256
+                        FROM applications a
+                        JOIN students s ON a.student_id = s.student_id
+                        WHERE s.department_id = %s
+                    )
+                """
+                params = (department_id,)
+            return self._fetch_all(query + " LIMIT %s", params + (limit,))
+        except backend.Error as e:
+            print(f"Error getting unsigned report texts: {e}")
+            return []
+
+    def get_similar_reports(self, report_id: int, threshold: float = None) -> List[Dict]:
+        """Get other reports whose text is estimated at least threshold similar to a report's, most similar first"""
+        from trial_project.models import minhash
+        if threshold is None:
+            threshold = minhash.SIMILARITY_THRESHOLD
+        try:
+            own = self._fetch_one("""
+                SELECT a.report_sha256 AS sha256, sig.signature
+                FROM reports r
+                JOIN applications a ON r.app_id = a.app_id
+                JOIN report_signatures sig ON sig.sha256 = a.report_sha256
+                WHERE r.report_id = %s
+            """, (report_id,))
+            if not own or not own['signature']:
+                return []
+            # Candidates share at least one LSH bucket; only their signatures are compared
+            candidates = self._fetch_all("""
+                SELECT r.report_id, s.name AS student_name, sig.signature
+                FROM reports r
+                JOIN applications a ON r.app_id = a.app_id
+                JOIN students s ON r.student_id = s.student_id
+                JOIN report_signatures sig ON sig.sha256 = a.report_sha256
+                WHERE r.report_id <> %s AND a.report_sha256 IN (
+                    SELECT other.sha256
+                    FROM report_lsh_buckets mine
+                    JOIN report_lsh_buckets other ON other.band = mine.band AND other.bucket = mine.bucket
+                    WHERE mine.sha256 = %s
+                )
+            """, (report_id, own['sha256']))
+        except backend.Error as e:
+            print(f"Error finding similar reports: {e}")
+            return []
+
+        signature = minhash.unpack(own['signature'])
+        similar = []
+        for candidate in candidates:
+            score = minhash.similarity(signature, minhash.unpack(candidate['signature']))
+            if score >= threshold:
+                similar.append({'report_id': candidate['report_id'],
+                                'student_name': candidate['student_name'],
+                                'similarity': score})
+        similar.sort(key=lambda report: report['similarity'], reverse=True)
+        return similar
+
+    def get_department_report_signatures(self, department_id: int) -> List[Dict]:
+        """Get the MinHash signature of every signed report submitted by a department's students"""
+        try:
+            query = """
+                SELECT r.report_id, s.name AS student_name, sig.signature
+                FROM reports r
+                JOIN applications a ON r.app_id = a.app_id
+                JOIN students s ON r.student_id = s.student_id
+                JOIN report_signatures sig ON sig.sha256 = a.report_sha256
+                WHERE s.department_id = %s
+            """
+            return self._fetch_all(query, (department_id,))
+        except backend.Error as e:
+            print(f"Error getting report signatures: {e}")
+            return []
 
     # Secretary Management
     #TAB-2: related to "Assign Faculty" tab
@@ -546,9 +768,8 @@ class DatabaseModel:
                 WHERE s.secretary_id = %s
                 ORDER BY f.faculty_id
             """
-            self.cursor.execute(query, (secretary_id,))
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query, (secretary_id,))
+        except backend.Error as e:
             print(f"Error getting faculty by secretary: {e}")
             return []
 
@@ -565,9 +786,8 @@ class DatabaseModel:
                 AND sec.secretary_id = %s
                 ORDER BY s.name
             """
-            self.cursor.execute(query, (secretary_id,))
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query, (secretary_id,))
+        except backend.Error as e:
             print(f"Error getting approved students by secretary: {e}")
             return []
 
@@ -578,12 +798,10 @@ class DatabaseModel:
             query = """
                 INSERT INTO faculty_assignments (faculty_id, student_id)
                 VALUES (%s, %s)
-                ON DUPLICATE KEY UPDATE faculty_id = %s
             """
-            self.cursor.execute(query, (faculty_id, student_id, faculty_id))
-            self.connection.commit()
+            self._execute(query, (faculty_id, student_id))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error assigning faculty: {e}")
             return False
 
@@ -591,13 +809,22 @@ class DatabaseModel:
         """Get all student users"""
         try:
             query = "SELECT * FROM students ORDER BY name"
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query)
+        except backend.Error as e:
             print(f"Error getting students: {e}")
             return []
 
 
+    def get_student_users_page(self, after: tuple = None, limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of students ordered by name, without password hashes"""
+        query = """
+            SELECT student_id, name, email, cgpa, department_id, created_at
+            FROM students
+            WHERE 1 = 1
+        """
+        return self._fetch_page(query, (), [('name', 'name'), ('student_id', 'student_id')], after, limit)
+
+
     #TAB-1: related to "Pending Applications" tab
     def get_pending_applications(self) -> List[Dict]:
         """Get all pending applications for admin review"""
@@ -614,37 +841,139 @@ class DatabaseModel:
                 WHERE a.status = 'pending'
                 ORDER BY a.application_date DESC
             """
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query)
+        except backend.Error as e:
             print(f"Error getting pending applications: {e}")
             return []
     
+    def get_pending_applications_page(self, after: tuple = None, limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of pending applications, newest first"""
+        # Walks idx_applications_status_date (status, application_date, app_id)
+        query = """
+            SELECT a.app_id, a.self_found, a.application_date,
+               s.student_id, s.name AS student_name, s.email AS student_email,
+               c.name AS company_name,
+               q.department
+            FROM applications a
+            JOIN students s ON a.student_id = s.student_id
+            JOIN companies c ON a.company_id = c.company_id
+            LEFT JOIN quotas q ON a.quota_id = q.quota_id
+            WHERE a.status = 'pending'
+        """
+        return self._fetch_page(query, (), [('a.application_date', 'application_date'), ('a.app_id', 'app_id')],
+                                after, limit, descending=True, statement='pending_applications_page')
+    
+    def get_application_changes(self, since: Optional[datetime]) -> Tuple[List[Dict], datetime]:
+        """Get applications of any status changed since a change-feed version, shaped like the pending list"""
+        query = """
+            SELECT a.app_id, a.status, a.self_found, a.application_date,
+               s.student_id, s.name AS student_name, s.email AS student_email,
+               c.name AS company_name,
+               q.department
+            FROM applications a
+            JOIN students s ON a.student_id = s.student_id
+            JOIN companies c ON a.company_id = c.company_id
+            LEFT JOIN quotas q ON a.quota_id = q.quota_id
+            WHERE 1 = 1
+        """
+        return self._fetch_changes(query, (), 'a.updated_at', since)
+    
     def update_application_status(self, app_id: int, status: str) -> bool:
         """Update application status"""
         try:
             query = "UPDATE applications SET status = %s WHERE app_id = %s"
-            self.cursor.execute(query, (status, app_id))
-            self.connection.commit()
+            self._execute(query, (status, app_id))
             return True
-        except Error as e:
+        except backend.Error as e:
             print(f"Error updating application status: {e}")
             return False
 
     # Quota Management
     def create_quota(self, company_id: int, department: str, total_slots: int, deadline: str, description: str) -> bool:
-        """Create a new quota"""
-        try:
-            query = """
+        """Create a new quota and add it to the quota search index"""
+        def insert(cursor):
+            cursor.execute("""
                 INSERT INTO quotas (company_id, department, total_slots, available_slots, deadline, description)
                 VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            self.cursor.execute(query, (company_id, department, total_slots, total_slots, deadline, description))
-            self.connection.commit()
+            """, (company_id, department, total_slots, total_slots, deadline, description))
+            self._save_quota_terms(cursor, cursor.lastrowid, description, company)
             return True
-        except Error as e:
+
+        try:
+            company = self._fetch_one("SELECT name, address FROM companies WHERE company_id = %s", (company_id,))
+            return self._run_transaction(insert)
+        except backend.Error as e:
             print(f"Error creating quota: {e}")
             return False
+
+    def _save_quota_terms(self, cursor, quota_id: int, description: Optional[str], company: Optional[Dict]):
+        from trial_project.models import quota_search
+        company = company or {}
+        weighted = quota_search.quota_terms(description, company.get('name'), company.get('address'))
+        if weighted:
+            cursor.executemany("INSERT INTO quota_terms (term, quota_id, weight) VALUES (%s, %s, %s)",
+                               [(term, quota_id, weight) for term, weight in weighted.items()])
+
+    def index_quota_terms(self, after: int = 0, limit: int = 1000) -> Optional[int]:
+        """Rebuild the search index for up to limit quotas after a quota_id; returns the last one, None when done"""
+        try:
+            quotas = self._fetch_all("""
+                SELECT q.quota_id, q.description, c.name, c.address
+                FROM quotas q
+                JOIN companies c ON q.company_id = c.company_id
+                WHERE q.quota_id > %s
+                ORDER BY q.quota_id
+                LIMIT %s
+            """, (after, limit))
+            if not quotas:
+                return None
+            last = quotas[-1]['quota_id']
+
+            def reindex(cursor):
+                cursor.execute("DELETE FROM quota_terms WHERE quota_id > %s AND quota_id <= %s", (after, last))
+                for quota in quotas:
+                    self._save_quota_terms(cursor, quota['quota_id'], quota['description'], quota)
+                return last
+
+            return self._run_transaction(reindex)
+        except backend.Error as e:
+            print(f"Error indexing quotas: {e}")
+            return None
+
+    def search_available_quotas(self, keywords: str, filters: Dict[str, Any] = None, limit: int = 200) -> List[Dict]:
+        """Get open quotas matching every keyword and facet filter, best matches first; the last word may be partly typed"""
+        from trial_project.models import quota_search
+        whole, prefix = quota_search.search_terms(keywords or '')
+        if not whole and not prefix:
+            return []
+        # One row per (quota, search term) with the term's weight, then only
+        # quotas that matched every term, ranked by total weight
+        matches = ["SELECT quota_id, MAX(weight) AS weight FROM quota_terms WHERE term = %s GROUP BY quota_id"] * len(whole)
+        params = tuple(whole)
+        if prefix:
+            matches.append("SELECT quota_id, MAX(weight) AS weight FROM quota_terms"
+                           " WHERE term >= %s AND term < %s GROUP BY quota_id")
+            params += quota_search.prefix_range(prefix)
+        query = f"""
+            SELECT q.*, c.name AS company_name, m.score
+            FROM (
+                SELECT matched.quota_id, SUM(matched.weight) AS score
+                FROM ({" UNION ALL ".join(matches)}) matched
+                GROUP BY matched.quota_id
+                HAVING COUNT(*) = %s
+            ) m
+            JOIN quotas q ON q.quota_id = m.quota_id
+            JOIN companies c ON q.company_id = c.company_id
+            WHERE q.available_slots > 0 AND q.deadline >= CURDATE()
+        """
+        conditions, filter_params = quota_search.filter_conditions(filters or {}, date.today())
+        query += conditions + " ORDER BY m.score DESC, q.deadline, q.quota_id LIMIT %s"
+        params += (len(matches),) + filter_params
+        try:
+            return self._fetch_all(query, params + (limit,))
+        except backend.Error as e:
+            print(f"Error searching quotas: {e}")
+            return []
     
     def get_available_quotas(self, department: str = None) -> List[Dict]:
         """Get available quotas"""
@@ -657,7 +986,7 @@ class DatabaseModel:
                     WHERE q.available_slots > 0 AND q.department = %s AND q.deadline >= CURDATE()
                     ORDER BY q.deadline
                 """
-                self.cursor.execute(query, (department,))
+                return self._fetch_all(query, (department,), statement='available_quotas_by_department')
             else:
                 query = """
                     SELECT q.*, c.name as company_name 
@@ -666,30 +995,189 @@ class DatabaseModel:
                     WHERE q.available_slots > 0 AND q.deadline >= CURDATE()
                     ORDER BY q.deadline
                 """
-                self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except Error as e:
+                return self._fetch_all(query, statement='available_quotas')
+        except backend.Error as e:
             print(f"Error getting quotas: {e}")
             return []
     
+    def get_available_quotas_page(self, department: str = None, after: tuple = None,
+                                  limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of open quotas ordered by deadline"""
+        query = """
+            SELECT q.*, c.name as company_name 
+            FROM quotas q 
+            JOIN companies c ON q.company_id = c.company_id 
+            WHERE q.available_slots > 0 AND q.deadline >= CURDATE()
+        """
+        params = ()
+        if department:
+            query += " AND q.department = %s"
+            params = (department,)
+        return self._fetch_page(query, params, [('q.deadline', 'deadline'), ('q.quota_id', 'quota_id')],
+                                after, limit,
+                                statement='available_quotas_page' + ('_by_department' if department else ''))
+    
+    def browse_quotas(self, filters: Dict[str, Any] = None, after: tuple = None, limit: int = 200) -> Dict[str, Any]:
+        """Get one page of open quotas under the facet filters; the first page also carries every facet's counts"""
+        from trial_project.models import quota_search
+        filters = filters or {}
+        conditions, params = quota_search.filter_conditions(filters, date.today())
+        query = """
+            SELECT q.*, c.name as company_name
+            FROM quotas q
+            JOIN companies c ON q.company_id = c.company_id
+            WHERE q.available_slots > 0 AND q.deadline >= CURDATE()
+        """ + conditions
+        rows, next_cursor = self._fetch_page(query, params, [('q.deadline', 'deadline'), ('q.quota_id', 'quota_id')],
+                                             after, limit)
+        page = {'rows': rows, 'next': next_cursor}
+        if after is None:
+            page['facets'] = self.get_quota_facets(filters)
+        return page
+
+    def get_quota_facets(self, filters: Dict[str, Any] = None) -> Dict[str, Dict[str, Any]]:
+        """Open-quota counts per option of every facet, each under the other facets' filters"""
+        from trial_project.models import quota_search
+        # One UNION ALL statement for all facets; each arm is an index-only
+        # range scan over the open deadlines (migration 9's covering indexes)
+        filters = filters or {}
+        today = date.today()
+        open_quotas = "FROM quotas q WHERE q.available_slots > 0 AND q.deadline >= CURDATE()"
+        arms, params = [], ()
+
+        conditions, condition_params = quota_search.filter_conditions(filters, today, exclude='department')
+        arms.append(f"""
+            SELECT 'department' AS facet, q.department AS facet_value, q.department AS facet_label, COUNT(*) AS quotas
+            {open_quotas}{conditions}
+            GROUP BY q.department
+        """)
+        params += condition_params
+
+        # The company facet lists the busiest companies plus a row (NULL value) counting all of them
+        conditions, condition_params = quota_search.filter_conditions(filters, today, exclude='company_id')
+        arms.append(f"""
+            SELECT 'company_id' AS facet, c.company_id AS facet_value, c.name AS facet_label, top.quotas
+            FROM (
+                SELECT q.company_id, COUNT(*) AS quotas
+                {open_quotas}{conditions}
+                GROUP BY q.company_id
+                ORDER BY quotas DESC, q.company_id
+                LIMIT %s
+            ) top
+            JOIN companies c ON top.company_id = c.company_id
+        """)
+        params += condition_params + (quota_search.COMPANY_FACET_LIMIT,)
+        arms.append(f"""
+            SELECT 'company_id' AS facet, NULL AS facet_value, NULL AS facet_label, COUNT(*) AS quotas
+            {open_quotas}{conditions}
+        """)
+        params += condition_params
+
+        # Deadline and slot rows count disjoint buckets; the options are cumulative
+        conditions, condition_params = quota_search.filter_conditions(filters, today, exclude='deadline_within')
+        windows = quota_search.DEADLINE_WINDOWS
+        arms.append(f"""
+            SELECT 'deadline_within' AS facet,
+                   CASE {" ".join(["WHEN q.deadline <= %s THEN %s"] * len(windows))} ELSE 0 END AS facet_value,
+                   NULL AS facet_label, COUNT(*) AS quotas
+            {open_quotas}{conditions}
+            GROUP BY facet_value
+        """)
+        for days in windows:
+            params += (today + timedelta(days=days), days)
+        params += condition_params
+
+        conditions, condition_params = quota_search.filter_conditions(filters, today, exclude='min_slots')
+        thresholds = sorted(quota_search.SLOT_THRESHOLDS, reverse=True)
+        arms.append(f"""
+            SELECT 'min_slots' AS facet,
+                   CASE {" ".join(["WHEN q.available_slots >= %s THEN %s"] * len(thresholds))} ELSE 0 END AS facet_value,
+                   NULL AS facet_label, COUNT(*) AS quotas
+            {open_quotas}{conditions}
+            GROUP BY facet_value
+        """)
+        for slots in thresholds:
+            params += (slots, slots)
+        params += condition_params
+
+        rows = self._fetch_all(" UNION ALL ".join(arms), params)
+
+        facets = {facet: {'all': 0, 'options': []} for facet in quota_search.FACETS}
+        buckets = {'deadline_within': {}, 'min_slots': {}}
+        for row in rows:
+            facet, value, count = row['facet'], row['facet_value'], int(row['quotas'])
+            if facet in buckets:
+                # UNION ALL may hand back every value as text
+                buckets[facet][int(value)] = count
+                continue
+            if facet == 'department':
+                facets[facet]['all'] += count
+            elif value is None:
+                facets[facet]['all'] = count
+                continue
+            if value is not None:
+                value = int(value) if facet == 'company_id' else value
+                facets[facet]['options'].append({'value': value, 'label': row['facet_label'], 'count': count})
+
+        facets['department']['options'].sort(key=lambda option: option['value'])
+        deadlines, slots = buckets['deadline_within'], buckets['min_slots']
+        facets['deadline_within'] = {
+            'all': sum(deadlines.values()),
+            'options': [{'value': days, 'label': f"Within {days} days",
+                         'count': sum(count for bucket, count in deadlines.items() if 0 < bucket <= days)}
+                        for days in windows],
+        }
+        facets['min_slots'] = {
+            'all': sum(slots.values()),
+            'options': [{'value': minimum, 'label': f"{minimum}+ free",
+                         'count': sum(count for bucket, count in slots.items() if bucket >= minimum)}
+                        for minimum in quota_search.SLOT_THRESHOLDS],
+        }
+        return facets
+
+    def get_quota_changes(self, department: str = None,
+                          since: Optional[datetime] = None) -> Tuple[List[Dict], datetime]:
+        """Get quotas changed since a change-feed version, including ones that closed"""
+        query = """
+            SELECT q.*, c.name as company_name
+            FROM quotas q
+            JOIN companies c ON q.company_id = c.company_id
+            WHERE 1 = 1
+        """
+        params = ()
+        if department:
+            query += " AND q.department = %s"
+            params = (department,)
+        return self._fetch_changes(query, params, 'q.updated_at', since)
+    
     # Application Management
     def create_application(self, student_id: int, company_id: int, quota_id: int = None, self_found: bool = False) -> bool:
-        """Create a new application"""
-        try:
-            query = """
-                INSERT INTO applications (student_id, company_id, quota_id, self_found)
-                VALUES (%s, %s, %s, %s)
-            """
-            self.cursor.execute(query, (student_id, company_id, quota_id, self_found))
-            
-            # Update available slots if quota-based
+        """Create a new application, reserving a quota slot when quota-based"""
+        query = """
+            INSERT INTO applications (student_id, company_id, quota_id, self_found)
+            VALUES (%s, %s, %s, %s)
+        """
+        
+        def reserve_and_insert(cursor):
             if quota_id and not self_found:
-                update_query = "UPDATE quotas SET available_slots = available_slots - 1 WHERE quota_id = %s"
-                self.cursor.execute(update_query, (quota_id,))
-            
-            self.connection.commit()
+                # Reserve first: the conditional UPDATE takes the quota row's
+                # exclusive lock and re-checks slots and deadline under it, so
+                # concurrent applicants queue here and can never overbook
+                cursor.execute("""
+                    UPDATE quotas SET available_slots = available_slots - 1
+                    WHERE quota_id = %s AND available_slots > 0 AND deadline >= CURDATE()
+                """, (quota_id,))
+                if cursor.rowcount == 0:
+                    return False
+            cursor.execute(query, (student_id, company_id, quota_id, self_found))
             return True
-        except Error as e:
+        
+        try:
+            if self._run_transaction(reserve_and_insert):
+                return True
+            print(f"Quota {quota_id} is full, expired or does not exist")
+            return False
+        except backend.Error as e:
             print(f"Error creating application: {e}")
             return False
     
@@ -704,19 +1192,100 @@ class DatabaseModel:
                 WHERE a.student_id = %s
                 ORDER BY a.application_date DESC
             """
-            self.cursor.execute(query, (student_id,))
-            return self.cursor.fetchall()
-        except Error as e:
+            return self._fetch_all(query, (student_id,), statement='applications_by_student')
+        except backend.Error as e:
             print(f"Error getting applications: {e}")
             return []
     
+    def get_reportable_application(self, student_id: int) -> Optional[Dict]:
+        """Get the student's latest approved or completed application, which reports attach to"""
+        try:
+            query = """
+                SELECT app_id, report_sha256, report_filename
+                FROM applications
+                WHERE student_id = %s AND status IN ('approved', 'completed')
+                ORDER BY application_date DESC, app_id DESC
+                LIMIT 1
+            """
+            return self._fetch_one(query, (student_id,))
+        except backend.Error as e:
+            print(f"Error getting reportable application: {e}")
+            return None
+    
+    def attach_report_file(self, app_id: int, student_id: int, report: Dict[str, Any], filename: str) -> bool:
+        """Record a stored report file (once per content hash) and link it to the application"""
+        def record(cursor):
+            # Identical uploads share one report_files row
+            cursor.execute("""
+                INSERT IGNORE INTO report_files (sha256, size_bytes, mime_type)
+                VALUES (%s, %s, %s)
+            """, (report['sha256'], report['size_bytes'], report['mime_type']))
+            cursor.execute("""
+                UPDATE applications
+                SET report_sha256 = %s, report_filename = %s, report_path = %s
+                WHERE app_id = %s AND student_id = %s
+            """, (report['sha256'], filename[:255], report['path'], app_id, student_id))
+            if cursor.rowcount == 0:
+                return False
+            # The first upload puts the report in the assigned faculty's evaluation list
+            cursor.execute("""
+                INSERT INTO reports (student_id, faculty_id, app_id)
+                SELECT fa.student_id, fa.faculty_id, %s
+                FROM faculty_assignments fa
+                WHERE fa.student_id = %s
+                  AND NOT EXISTS (SELECT 1 FROM reports r WHERE r.app_id = %s)
+                ORDER BY fa.assigned_at DESC
+                LIMIT 1
+            """, (app_id, student_id, app_id))
+            return True
+        
+        try:
+            return self._run_transaction(record)
+        except backend.Error as e:
+            print(f"Error attaching report: {e}")
+            return False
+    
+    
+    
+    
     
     
     
+    def get_applications_by_student_page(self, student_id: int, after: tuple = None,
+                                         limit: int = 200) -> Tuple[List[Dict], Optional[tuple]]:
+        """Get one page of a student's applications, newest first"""
+        query = """
+            SELECT a.*, c.name as company_name, q.department
+            FROM applications a
+            JOIN companies c ON a.company_id = c.company_id
+            LEFT JOIN quotas q ON a.quota_id = q.quota_id
+            WHERE a.student_id = %s
+        """
+        return self._fetch_page(query, (student_id,),
+                                [('a.application_date', 'application_date'), ('a.app_id', 'app_id')],
+                                after, limit, descending=True, statement='applications_by_student_page')
     
+    def get_application_changes_by_student(self, student_id: int,
+                                           since: Optional[datetime]) -> Tuple[List[Dict], datetime]:
+        """Get a student's applications changed since a change-feed version"""
+        query = """
+            SELECT a.*, c.name as company_name, q.department
+            FROM applications a
+            JOIN companies c ON a.company_id = c.company_id
+            LEFT JOIN quotas q ON a.quota_id = q.quota_id
+            WHERE a.student_id = %s
+        """
+        return self._fetch_changes(query, (student_id,), 'a.updated_at', since)
     
+    def get_quota_by_id(self, quota_id: int) -> Optional[Dict]:
+        """Get quota details by ID"""
+        try:
+            return self._fetch_one("SELECT * FROM quotas WHERE quota_id = %s", (quota_id,), statement='quota_by_id')
+        except backend.Error as e:
+            print(f"Error getting quota details: {e}")
+            return None
     
     def close_connection(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
\ No newline at end of file
+        """Close all pooled database connections"""
+        if self.pool:
+            self.pool.close()
\ No newline at end of file
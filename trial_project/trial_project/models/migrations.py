@@ -0,0 +1,384 @@
+from typing import List, Tuple
+from mysql.connector import Error, errorcode
+
+from trial_project.models.schema import IDENTITY_SOURCES, DEFAULT_DEPARTMENTS
+
+# Ordered schema migrations: (version, description, statements).
+# Append new migrations at the end; never edit one that has shipped.
+
+INITIAL_TABLES = {
+    'department': """
+        CREATE TABLE IF NOT EXISTS department (
+            department_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    'students': """
+        CREATE TABLE IF NOT EXISTS students (
+            student_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            cgpa DECIMAL(3,2) CHECK (cgpa >= 2.00 AND cgpa <= 4.00),
+            department_id INT,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (department_id) REFERENCES department(department_id)
+        )
+    """,
+    'faculties': """
+        CREATE TABLE IF NOT EXISTS faculties (
+            faculty_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            department_id INT,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (department_id) REFERENCES department(department_id)
+        )
+    """,
+    'secretaries': """
+        CREATE TABLE IF NOT EXISTS secretaries (
+            secretary_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            faculty_id INT,
+            department_id INT,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
+            FOREIGN KEY (department_id) REFERENCES department(department_id)
+        )
+    """,
+    'admins': """
+        CREATE TABLE IF NOT EXISTS admins (
+            admin_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    'companies': """
+        CREATE TABLE IF NOT EXISTS companies (
+            company_id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            contact_person VARCHAR(100),
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            phone VARCHAR(20),
+            address TEXT,
+            registered BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    'quotas': """
+        CREATE TABLE IF NOT EXISTS quotas (
+            quota_id INT AUTO_INCREMENT PRIMARY KEY,
+            company_id INT,
+            department VARCHAR(100),
+            total_slots INT NOT NULL,
+            available_slots INT NOT NULL,
+            deadline DATE,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (company_id) REFERENCES companies(company_id)
+        )
+    """,
+    'applications': """
+        CREATE TABLE IF NOT EXISTS applications (
+            app_id INT AUTO_INCREMENT PRIMARY KEY,
+            student_id INT,
+            company_id INT,
+            quota_id INT,
+            status ENUM('pending', 'approved', 'rejected', 'completed') DEFAULT 'pending',
+            application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            report_path VARCHAR(255),
+            self_found BOOLEAN DEFAULT FALSE,
+            FOREIGN KEY (student_id) REFERENCES students(student_id),
+            FOREIGN KEY (company_id) REFERENCES companies(company_id),
+            FOREIGN KEY (quota_id) REFERENCES quotas(quota_id)
+        )
+    """,
+    'reports': """
+        CREATE TABLE IF NOT EXISTS reports (
+            report_id INT AUTO_INCREMENT PRIMARY KEY,
+            student_id INT,
+            faculty_id INT,
+            app_id INT,
+            grade VARCHAR(10),
+            comments TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students(student_id),
+            FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
+            FOREIGN KEY (app_id) REFERENCES applications(app_id)
+        )
+    """,
+    'feedback': """
+        CREATE TABLE IF NOT EXISTS feedback (
+            feedback_id INT AUTO_INCREMENT PRIMARY KEY,
+            company_id INT,
+            student_id INT,
+            app_id INT,
+            rating INT CHECK (rating >= 1 AND rating <= 5),
+            remarks TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (company_id) REFERENCES companies(company_id),
+            FOREIGN KEY (student_id) REFERENCES students(student_id),
+            FOREIGN KEY (app_id) REFERENCES applications(app_id)
+        )
+    """,
+    'faculty_assignments': """
+        CREATE TABLE IF NOT EXISTS faculty_assignments (
+            assignment_id INT AUTO_INCREMENT PRIMARY KEY,
+            faculty_id INT,
+            student_id INT,
+            assigned_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (faculty_id) REFERENCES faculties(faculty_id),
+            FOREIGN KEY (student_id) REFERENCES students(student_id)
+        )
+    """
+}
+
+def identity_statements() -> List[str]:
+    """DDL for user_identities: one row per account, kept in sync with the role tables by triggers"""
+    statements = ["""
+        CREATE TABLE IF NOT EXISTS user_identities (
+            email VARCHAR(100) NOT NULL,
+            role ENUM('student', 'faculty', 'secretary', 'company', 'admin') NOT NULL,
+            user_id INT NOT NULL,
+            name VARCHAR(200) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            department_id INT NULL,
+            PRIMARY KEY (email, role),
+            UNIQUE KEY uq_user_identities_user (role, user_id)
+        )
+    """]
+    for role, (table, id_column, dept_column) in IDENTITY_SOURCES.items():
+        new_dept = f"NEW.{dept_column}" if dept_column else 'NULL'
+        statements += [
+            f"""
+            CREATE TRIGGER trg_{table}_identity_insert AFTER INSERT ON {table} FOR EACH ROW
+                INSERT INTO user_identities (email, role, user_id, name, password_hash, department_id)
+                VALUES (NEW.email, '{role}', NEW.{id_column}, NEW.name, NEW.password_hash, {new_dept})
+            """,
+            f"""
+            CREATE TRIGGER trg_{table}_identity_update AFTER UPDATE ON {table} FOR EACH ROW
+                UPDATE user_identities
+                SET email = NEW.email, name = NEW.name, password_hash = NEW.password_hash,
+                    department_id = {new_dept}
+                WHERE role = '{role}' AND user_id = NEW.{id_column}
+            """,
+            f"""
+            CREATE TRIGGER trg_{table}_identity_delete AFTER DELETE ON {table} FOR EACH ROW
+                DELETE FROM user_identities WHERE role = '{role}' AND user_id = OLD.{id_column}
+            """,
+            # Backfill after the triggers exist so rows written meanwhile are not missed
+            f"""
+            INSERT IGNORE INTO user_identities (email, role, user_id, name, password_hash, department_id)
+            SELECT email, '{role}', {id_column}, name, password_hash, {dept_column or 'NULL'} FROM {table}
+            """,
+        ]
+    return statements
+
+
+MIGRATIONS: List[Tuple[int, str, List]] = [
+    (1, "Initial schema and default departments", list(INITIAL_TABLES.values()) + [
+        ("INSERT IGNORE INTO department (name) VALUES (%s)", (dept,)) for dept in DEFAULT_DEPARTMENTS
+    ]),
+    (2, "Indexes on hot lookup columns", [
+        # get_pending_applications: status filter ordered by date
+        "CREATE INDEX idx_applications_status_date ON applications (status, application_date)",
+        # get_applications_by_student and the approved/unassigned lookup
+        "CREATE INDEX idx_applications_student_status ON applications (student_id, status)",
+        # get_available_quotas with and without a department filter
+        "CREATE INDEX idx_quotas_department_deadline ON quotas (department, deadline)",
+        "CREATE INDEX idx_quotas_deadline ON quotas (deadline)",
+        # Per-faculty counts and the unassigned-student anti-join
+        "CREATE INDEX idx_faculty_assignments_faculty ON faculty_assignments (faculty_id, student_id)",
+        "CREATE INDEX idx_faculty_assignments_student ON faculty_assignments (student_id, faculty_id)",
+        # get_reports_assigned_to_faculty
+        "CREATE INDEX idx_reports_faculty ON reports (faculty_id, submitted_at)",
+    ]),
+    (3, "updated_at change-feed columns", [
+        # Stamped by MySQL on every insert and update; dashboards poll for rows
+        # newer than the last version they saw
+        """ALTER TABLE applications ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+               DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)""",
+        "CREATE INDEX idx_applications_updated ON applications (updated_at)",
+        """ALTER TABLE quotas ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+               DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)""",
+        "CREATE INDEX idx_quotas_updated ON quotas (updated_at)",
+        """ALTER TABLE faculty_assignments ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+               DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)""",
+        "CREATE INDEX idx_faculty_assignments_updated ON faculty_assignments (updated_at)",
+    ]),
+    (4, "user_identities login lookup across role tables", identity_statements()),
+    (5, "Content-addressed report files", [
+        # One row per distinct file content; uploads of identical files share it
+        """
+        CREATE TABLE IF NOT EXISTS report_files (
+            sha256 CHAR(64) PRIMARY KEY,
+            size_bytes BIGINT NOT NULL,
+            mime_type VARCHAR(100) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # One statement, so a rerun after a failure stops at ER_DUP_FIELDNAME
+        """
+        ALTER TABLE applications
+            ADD COLUMN report_sha256 CHAR(64) NULL,
+            ADD COLUMN report_filename VARCHAR(255) NULL,
+            ADD CONSTRAINT fk_applications_report FOREIGN KEY (report_sha256) REFERENCES report_files(sha256)
+        """,
+    ]),
+    (6, "Extracted report text and keyword index", [
+        # Filled by ReportIndexer; error is set when a file yields no text
+        """
+        CREATE TABLE IF NOT EXISTS report_texts (
+            sha256 CHAR(64) PRIMARY KEY,
+            content MEDIUMTEXT NOT NULL,
+            term_count INT NOT NULL,
+            error VARCHAR(255) NULL,
+            extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (sha256) REFERENCES report_files(sha256)
+        )
+        """,
+        # Inverted index: keyword filters are primary key lookups per term
+        """
+        CREATE TABLE IF NOT EXISTS report_terms (
+            term VARCHAR(64) NOT NULL,
+            sha256 CHAR(64) NOT NULL,
+            PRIMARY KEY (term, sha256),
+            FOREIGN KEY (sha256) REFERENCES report_files(sha256)
+        )
+        """,
+    ]),
+    (7, "MinHash signatures and LSH buckets for near-duplicate reports", [
+        # Empty signature: the text has no words to compare
+        """
+        CREATE TABLE IF NOT EXISTS report_signatures (
+            sha256 CHAR(64) PRIMARY KEY,
+            signature VARBINARY(512) NOT NULL,
+            FOREIGN KEY (sha256) REFERENCES report_files(sha256)
+        )
+        """,
+        # A file's candidates are the files sharing any (band, bucket) with it
+        """
+        CREATE TABLE IF NOT EXISTS report_lsh_buckets (
+            band SMALLINT NOT NULL,
+            bucket BIGINT NOT NULL,
+            sha256 CHAR(64) NOT NULL,
+            PRIMARY KEY (band, bucket, sha256),
+            FOREIGN KEY (sha256) REFERENCES report_files(sha256)
+        )
+        """,
+    ]),
+    (8, "Ranked search index over quotas and their companies", [
+        # Filled by create_quota, or by setup/index_quotas.py for existing quotas
+        """
+        CREATE TABLE IF NOT EXISTS quota_terms (
+            term VARCHAR(64) NOT NULL,
+            quota_id INT NOT NULL,
+            weight SMALLINT NOT NULL,
+            PRIMARY KEY (term, quota_id),
+            FOREIGN KEY (quota_id) REFERENCES quotas(quota_id) ON DELETE CASCADE
+        )
+        """,
+    ]),
+    (9, "Composite indexes for faceted quota browsing", [
+        # Each facet count is a range scan over open deadlines, under no filter,
+        # a department or a company, that reads only the index
+        "CREATE INDEX idx_quotas_open_facets ON quotas (deadline, available_slots, department, company_id)",
+        "CREATE INDEX idx_quotas_department_open ON quotas (department, deadline, available_slots, company_id)",
+        "CREATE INDEX idx_quotas_company_open ON quotas (company_id, deadline, available_slots, department)",
+        # Superseded by idx_quotas_department_open, which starts with the same columns
+        "DROP INDEX idx_quotas_department_deadline ON quotas",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+# Errors meaning a statement's effect is already in place, so re-running a
+# partially applied migration is safe
+ALREADY_APPLIED_ERRORS = (
+    errorcode.ER_TABLE_EXISTS_ERROR,
+    errorcode.ER_DUP_FIELDNAME,
+    errorcode.ER_DUP_KEYNAME,
+    errorcode.ER_TRG_ALREADY_EXISTS,
+    errorcode.ER_CANT_DROP_FIELD_OR_KEY,
+)
+
+
+class MigrationRunner:
+    """Applies pending schema migrations and records them in schema_version"""
+
+    LOCK_NAME = 'internship_schema_migrations'
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def current_version(self) -> int:
+        """Highest applied migration version, 0 for a fresh database"""
+        try:
+            with self.pool.cursor() as cursor:
+                cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+                row = cursor.fetchone()
+                return row['version'] or 0
+        except Error as e:
+            if e.errno == errorcode.ER_NO_SUCH_TABLE:
+                return 0
+            raise
+
+    def is_current(self) -> bool:
+        return self.current_version() >= LATEST_VERSION
+
+    def migrate(self) -> List[int]:
+        """Apply every pending migration in order, returning the versions applied"""
+        # One read when the schema is current; no DDL is sent at all
+        if self.is_current():
+            return []
+
+        applied = []
+        with self.pool.connection() as connection:
+            cursor = connection.cursor(dictionary=True, buffered=True)
+            # Serialise concurrent app starts against the same database
+            cursor.execute("SELECT GET_LOCK(%s, 30) AS locked", (self.LOCK_NAME,))
+            if not cursor.fetchone()['locked']:
+                raise Error(msg="Timed out waiting for the schema migration lock")
+            try:
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_version (
+                        version INT PRIMARY KEY,
+                        description VARCHAR(255) NOT NULL,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+                current = cursor.fetchone()['version'] or 0
+
+                for version, description, statements in MIGRATIONS:
+                    if version <= current:
+                        continue
+                    for statement in statements:
+                        self._run(cursor, statement)
+                    cursor.execute(
+                        "INSERT IGNORE INTO schema_version (version, description) VALUES (%s, %s)",
+                        (version, description)
+                    )
+                    connection.commit()
+                    applied.append(version)
+                    print(f"Applied schema migration {version}: {description}")
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (self.LOCK_NAME,))
+                cursor.close()
+        return applied
+
+    def _run(self, cursor, statement):
+        """Execute one migration statement, tolerating already-applied DDL"""
+        query, params = statement if isinstance(statement, tuple) else (statement, ())
+        try:
+            cursor.execute(query, params)
+        except Error as e:
+            if e.errno not in ALREADY_APPLIED_ERRORS:
+                raise
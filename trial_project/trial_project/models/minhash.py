@@ -0,0 +1,101 @@
+import hashlib
+import random
+import re
+import struct
+from collections import defaultdict
+from itertools import combinations
+from typing import Dict, Hashable, Iterable, List, Sequence, Tuple
+
+# MinHash signatures over word shingles, and LSH banding to find reports whose
+# shingle sets overlap without comparing every pair.
+#
+# Two reports agree on any one signature value with probability equal to
+# the Jaccard similarity of their shingle sets. With BANDS bands of ROWS
+# values, a pair shares at least one band bucket with probability
+# 1 - (1 - s**ROWS)**BANDS: about 5% at s = 0.2, 50% at s = 0.38 and 99% at
+# s = 0.6, so pairs at the threshold are almost never missed and the extra
+# candidates are weeded out by comparing full signatures.
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 5           # words per shingle
+SIMILARITY_THRESHOLD = 0.6
+
+_MERSENNE = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"[^\W_]+")
+_SIGNATURE_FORMAT = struct.Struct(f'<{NUM_PERM}I')
+
+# Fixed seed: signatures must be comparable across processes and releases
+_rng = random.Random(20240501)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """Stable 64-bit hashes of the distinct size-word shingles in text"""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        shingles = {' '.join(words)} if words else set()
+    else:
+        shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), 'little') for s in shingles]
+
+
+def signature(text: str) -> List[int]:
+    """MinHash signature of text, or [] when it has no words"""
+    hashes = shingle_hashes(text)
+    if not hashes:
+        return []
+    return [min([(a * x + b) % _MERSENNE for x in hashes]) & _MAX_HASH for a, b in _PERMUTATIONS]
+
+
+def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(first, second) if a == b) / NUM_PERM
+
+
+def band_buckets(sig: Sequence[int]) -> List[int]:
+    """Signed 64-bit bucket of each band, one per band in order"""
+    return [int.from_bytes(hashlib.blake2b(_band_bytes(sig, band), digest_size=8).digest(), 'little', signed=True)
+            for band in range(BANDS)]
+
+
+def _band_bytes(sig: Sequence[int], band: int) -> bytes:
+    return struct.pack(f'<{ROWS}I', *sig[band * ROWS:(band + 1) * ROWS])
+
+
+def pack(sig: Sequence[int]) -> bytes:
+    """Stored form of a signature; empty for text without words"""
+    return _SIGNATURE_FORMAT.pack(*sig) if sig else b''
+
+
+def unpack(data: bytes) -> Tuple[int, ...]:
+    return _SIGNATURE_FORMAT.unpack(bytes(data)) if data else ()
+
+
+def similar_pairs(signatures: Dict[Hashable, Sequence[int]],
+                  threshold: float = SIMILARITY_THRESHOLD) -> List[Tuple[Hashable, Hashable, float]]:
+    """(key, key, similarity) for every pair sharing an LSH bucket and meeting threshold, most similar first"""
+    buckets = defaultdict(list)
+    for key, sig in signatures.items():
+        for band, bucket in enumerate(band_buckets(sig)):
+            buckets[band, bucket].append(key)
+
+    candidates = set()
+    for keys in buckets.values():
+        if len(keys) > 1:
+            candidates.update(combinations(sorted(keys, key=repr), 2))
+
+    pairs = []
+    for first, second in candidates:
+        score = similarity(signatures[first], signatures[second])
+        if score >= threshold:
+            pairs.append((first, second, score))
+    pairs.sort(key=lambda pair: pair[2], reverse=True)
+    return pairs
+
+
+def signatures_for(texts: Iterable[Tuple[Hashable, str]]) -> List[Tuple[Hashable, List[int]]]:
+    """(key, signature) for each (key, text); the unit of work batch mode hands to a worker"""
+    return [(key, signature(text)) for key, text in texts]
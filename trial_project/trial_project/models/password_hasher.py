@@ -0,0 +1,151 @@
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional
+
+from trial_project.config.security_config import (PASSWORD_HASHER, SCRYPT_N, SCRYPT_R, SCRYPT_P,
+                                                  PBKDF2_ITERATIONS, IMPORT_SCRYPT_N,
+                                                  IMPORT_PBKDF2_ITERATIONS, HASH_WORKERS)
+
+# Encoded hashes are "algorithm$param$...$salt$hash" so the parameters travel
+# with each stored password and can be raised later without breaking logins.
+
+SALT_BYTES = 16
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii')
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text.encode('ascii'))
+
+
+class PasswordHasher:
+    """Base class for encoded, salted password hashers"""
+
+    algorithm = ''
+
+    def hash(self, password: str) -> str:
+        raise NotImplementedError
+
+    def verify(self, password: str, encoded: str) -> bool:
+        raise NotImplementedError
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """Whether a stored hash was made with other parameters than this hasher's"""
+        return True
+
+
+class ScryptHasher(PasswordHasher):
+    """Memory-hard scrypt from hashlib"""
+
+    algorithm = 'scrypt'
+
+    def __init__(self, n: int = SCRYPT_N, r: int = SCRYPT_R, p: int = SCRYPT_P):
+        self.n, self.r, self.p = n, r, p
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        # hashlib's default maxmem (32 MiB) is too small for larger N
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * n * r * p + 1024 * 1024, dklen=32)
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(SALT_BYTES)
+        digest = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.algorithm}${self.n}${self.r}${self.p}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, n, r, p, salt, digest = encoded.split('$')
+            expected = _unb64(digest)
+            actual = self._derive(password, _unb64(salt), int(n), int(r), int(p))
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return not encoded.startswith(f"{self.algorithm}${self.n}${self.r}${self.p}$")
+
+
+class PBKDF2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256 from hashlib"""
+
+    algorithm = 'pbkdf2_sha256'
+
+    def __init__(self, iterations: int = PBKDF2_ITERATIONS):
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(SALT_BYTES)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self.iterations)
+        return f"{self.algorithm}${self.iterations}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        try:
+            _, iterations, salt, digest = encoded.split('$')
+            expected = _unb64(digest)
+            actual = hashlib.pbkdf2_hmac('sha256', password.encode(), _unb64(salt), int(iterations))
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, encoded: str) -> bool:
+        return not encoded.startswith(f"{self.algorithm}${self.iterations}$")
+
+
+class LegacySHA256Hasher(PasswordHasher):
+    """Unsalted SHA-256 hex digests written before salted hashing; verify only"""
+
+    algorithm = 'sha256'
+
+    def hash(self, password: str) -> str:
+        raise ValueError("Legacy SHA-256 hashes must not be created")
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), encoded)
+
+
+HASHERS = {
+    ScryptHasher.algorithm: ScryptHasher,
+    PBKDF2Hasher.algorithm: PBKDF2Hasher,
+}
+
+
+def get_hasher(algorithm: str = PASSWORD_HASHER) -> PasswordHasher:
+    """Hasher for new passwords, using the configured cost parameters"""
+    if algorithm not in HASHERS:
+        raise ValueError(f"Unknown password hasher '{algorithm}'")
+    return HASHERS[algorithm]()
+
+
+def get_import_hasher(algorithm: str = PASSWORD_HASHER) -> PasswordHasher:
+    """Cheaper hasher for bulk-imported passwords; get_hasher() flags its hashes for rehash on login"""
+    if algorithm == ScryptHasher.algorithm:
+        return ScryptHasher(n=IMPORT_SCRYPT_N)
+    if algorithm == PBKDF2Hasher.algorithm:
+        return PBKDF2Hasher(iterations=IMPORT_PBKDF2_ITERATIONS)
+    raise ValueError(f"Unknown password hasher '{algorithm}'")
+
+
+def identify_hasher(encoded: str) -> Optional[PasswordHasher]:
+    """Hasher able to verify a stored hash, or None if the format is unknown"""
+    algorithm = encoded.split('$', 1)[0]
+    if algorithm in HASHERS:
+        return HASHERS[algorithm]()
+    if len(encoded) == 64 and '$' not in encoded:
+        return LegacySHA256Hasher()
+    return None
+
+
+_executor = None
+
+
+def hash_many(hasher: PasswordHasher, passwords: Iterable[str]) -> List[str]:
+    """Hash a batch of passwords in parallel on a shared worker pool"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="hash-worker")
+    return list(_executor.map(hasher.hash, passwords))
@@ -0,0 +1,260 @@
+import functools
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from trial_project.config.db_config import SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_LOG
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def _normalize(query: str) -> str:
+    return re.sub(r'\s+', ' ', query).strip()
+
+
+def row_bytes(row) -> int:
+    """Rough wire size of one fetched row"""
+    values = row.values() if isinstance(row, dict) else row
+    size = 0
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, str):
+            size += len(value.encode('utf-8', 'replace'))
+        else:
+            size += 8
+    return size
+
+
+class LatencyHistogram:
+    """Call count, total, max and bucketed latencies for one method or query"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def add(self, seconds: float, rows: int = 0):
+        ms = seconds * 1000
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.rows += rows
+        for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def percentile(self, pct: float) -> float:
+        """Upper bound (ms) of the bucket holding the given percentile"""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return float(HISTOGRAM_BUCKETS_MS[i]) if i < len(HISTOGRAM_BUCKETS_MS) else self.max * 1000
+        return self.max * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': round(self.total * 1000, 3),
+            'avg_ms': round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max * 1000, 3),
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'rows': self.rows,
+            'bytes': self.bytes,
+            'histogram': dict(zip([f"<={b}ms" for b in HISTOGRAM_BUCKETS_MS] + ['slower'], self.buckets)),
+        }
+
+
+class QueryMetrics:
+    """Process-wide latency histograms per model method and per SQL statement, plus the slow-query log"""
+
+    def __init__(self, slow_threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, slow_log_path: Optional[str] = SLOW_QUERY_LOG):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_log_path = slow_log_path
+        self._lock = threading.Lock()
+        self._methods: Dict[str, LatencyHistogram] = {}
+        self._queries: Dict[str, LatencyHistogram] = {}
+        self.slow_queries = 0
+
+    def record_method(self, name: str, seconds: float, failed: bool = False):
+        with self._lock:
+            histogram = self._methods.setdefault(name, LatencyHistogram())
+            histogram.add(seconds)
+            if failed:
+                histogram.errors += 1
+
+    def record_query(self, query: str, seconds: float, rows: int = 0, bound_sql: str = None,
+                     error: Exception = None):
+        """Record one statement execution; slow or failed ones also go to the slow-query log"""
+        key = _normalize(query)
+        with self._lock:
+            histogram = self._queries.setdefault(key, LatencyHistogram())
+            histogram.add(seconds, max(rows, 0))
+            if error is not None:
+                histogram.errors += 1
+        ms = seconds * 1000
+        if error is not None or ms >= self.slow_threshold_ms:
+            if error is None:
+                self.slow_queries += 1
+            self._log_slow(ms, rows, bound_sql or key, error)
+
+    def record_bytes(self, query: str, size: int):
+        with self._lock:
+            histogram = self._queries.get(_normalize(query))
+            if histogram:
+                histogram.bytes += size
+
+    def _log_slow(self, ms: float, rows: int, sql: str, error: Exception = None):
+        if not self.slow_log_path:
+            return
+        status = f"ERROR {error}" if error is not None else f"rows={rows}"
+        line = f"{datetime.now().isoformat(timespec='milliseconds')} {ms:.1f}ms {status} {_normalize(sql)}\n"
+        try:
+            with self._lock, open(self.slow_log_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except OSError as e:
+            print(f"Error writing slow query log: {e}")
+
+    def report(self) -> Dict[str, Any]:
+        """Snapshot of every method and query histogram, slowest total time first"""
+        with self._lock:
+            methods = {name: h.to_dict() for name, h in self._methods.items()}
+            queries = {sql: h.to_dict() for sql, h in self._queries.items()}
+        by_total = lambda items: dict(sorted(items.items(), key=lambda kv: kv[1]['total_ms'], reverse=True))
+        return {
+            'slow_threshold_ms': self.slow_threshold_ms,
+            'slow_queries': self.slow_queries,
+            'methods': by_total(methods),
+            'queries': by_total(queries),
+        }
+
+    def format_report(self, top: int = 20) -> str:
+        """Human-readable summary of the slowest methods and queries"""
+        report = self.report()
+        lines = [f"Slow queries (>= {report['slow_threshold_ms']}ms): {report['slow_queries']}", "",
+                 f"{'method':<48}{'calls':>7}{'errors':>7}{'avg ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+        for name, h in list(report['methods'].items())[:top]:
+            lines.append(f"{name[:47]:<48}{h['count']:>7}{h['errors']:>7}{h['avg_ms']:>9.2f}"
+                         f"{h['p95_ms']:>9.0f}{h['max_ms']:>9.2f}")
+        lines += ["", f"{'query':<72}{'calls':>7}{'avg ms':>9}{'rows':>9}{'bytes':>11}"]
+        for sql, h in list(report['queries'].items())[:top]:
+            lines.append(f"{sql[:71]:<72}{h['count']:>7}{h['avg_ms']:>9.2f}{h['rows']:>9}{h['bytes']:>11}")
+        return "\n".join(lines)
+
+    def dump(self, path: str):
+        """Write the report as JSON to path, or the text summary to stdout for '-'"""
+        if path == '-':
+            print(self.format_report())
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, default=str)
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+            self._queries.clear()
+            self.slow_queries = 0
+
+
+metrics = QueryMetrics()
+
+
+class InstrumentedCursor:
+    """Cursor proxy that times execute calls and counts fetched rows and bytes"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._last_query = None
+
+    def execute(self, query, params=()):
+        started = time.perf_counter()
+        try:
+            result = self._cursor.execute(query, params)
+        except Exception as e:
+            metrics.record_query(query, time.perf_counter() - started, bound_sql=self._bound(query, params), error=e)
+            raise
+        # Buffered cursors read the whole result inside execute, so this covers the transfer
+        metrics.record_query(query, time.perf_counter() - started, self._cursor.rowcount,
+                             bound_sql=self._bound(query, params))
+        self._last_query = query
+        return result
+
+    def executemany(self, query, seq_params):
+        started = time.perf_counter()
+        try:
+            result = self._cursor.executemany(query, seq_params)
+        except Exception as e:
+            metrics.record_query(query, time.perf_counter() - started, bound_sql=query, error=e)
+            raise
+        metrics.record_query(query, time.perf_counter() - started, self._cursor.rowcount, bound_sql=query)
+        return result
+
+    def _bound(self, query, params) -> str:
+        if 'password' in query.lower():
+            return query  # Never write hashes to the log
+        # The connector keeps the interpolated statement for plain cursors
+        statement = getattr(self._cursor, 'statement', None)
+        if statement:
+            return statement.decode('utf-8', 'replace') if isinstance(statement, bytes) else statement
+        return f"{query} -- params: {params!r}" if params else query
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None and self._last_query:
+            metrics.record_bytes(self._last_query, row_bytes(row))
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if rows and self._last_query:
+            metrics.record_bytes(self._last_query, sum(row_bytes(row) for row in rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+def instrument_methods(cls):
+    """Class decorator timing every public method into the shared metrics"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith('_') or not callable(attr):
+            continue
+        setattr(cls, name, _timed(f"{cls.__name__}.{name}", attr))
+    return cls
+
+
+def _timed(label: str, method):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except Exception:
+            metrics.record_method(label, time.perf_counter() - started, failed=True)
+            raise
+        metrics.record_method(label, time.perf_counter() - started)
+        return result
+    return wrapper
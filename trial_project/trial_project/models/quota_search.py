@@ -0,0 +1,66 @@
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from trial_project.models.text_extraction import query_terms, terms
+
+# Ranking for quota search. A quota's index holds each term once, weighted by
+# the most telling field it appears in; a search scores a quota by summing
+# the weights of the terms it matched.
+
+COMPANY_NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+COMPANY_ADDRESS_WEIGHT = 1
+
+
+def quota_terms(description: Optional[str], company_name: Optional[str],
+                company_address: Optional[str]) -> Dict[str, int]:
+    """Index terms of one quota with their weights"""
+    weighted = {}
+    for text, weight in ((company_address, COMPANY_ADDRESS_WEIGHT),
+                         (description, DESCRIPTION_WEIGHT),
+                         (company_name, COMPANY_NAME_WEIGHT)):
+        for term in terms(text or ''):
+            weighted[term] = max(weight, weighted.get(term, 0))
+    return weighted
+
+
+def search_terms(keywords: str) -> Tuple[List[str], Optional[str]]:
+    """(whole terms, prefix) of a search box; the word still being typed is matched as a prefix"""
+    words = query_terms(keywords)
+    if words and keywords.lower().endswith(words[-1]):
+        return words[:-1], words[-1]
+    return words, None
+
+
+def prefix_range(prefix: str) -> Tuple[str, str]:
+    """[low, high) bounds of the terms starting with prefix, so the match is an index range scan"""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+# Facets of the quota browser. Each facet's counts apply every selected
+# filter except its own, so an option shows how many quotas picking it leaves.
+DEADLINE_WINDOWS = (7, 30, 90)    # days from today
+SLOT_THRESHOLDS = (1, 3, 5, 10)   # minimum free slots
+COMPANY_FACET_LIMIT = 20          # companies listed, most quotas first
+
+FACETS = ('department', 'company_id', 'deadline_within', 'min_slots')
+
+
+def filter_conditions(filters: Dict, today: date, exclude: str = None) -> Tuple[str, tuple]:
+    """SQL conditions on quotas q for the selected facet values, leaving out one facet"""
+    conditions, params = "", ()
+    selected = {facet: value for facet, value in filters.items() if value is not None and facet != exclude}
+    if 'department' in selected:
+        conditions += " AND q.department = %s"
+        params += (selected['department'],)
+    if 'company_id' in selected:
+        conditions += " AND q.company_id = %s"
+        params += (selected['company_id'],)
+    if 'deadline_within' in selected:
+        conditions += " AND q.deadline <= %s"
+        params += (today + timedelta(days=selected['deadline_within']),)
+    if 'min_slots' in selected:
+        conditions += " AND q.available_slots >= %s"
+        params += (selected['min_slots'],)
+    return conditions, params
+
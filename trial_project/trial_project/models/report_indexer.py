@@ -0,0 +1,105 @@
+import threading
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Set, Tuple
+
+from trial_project.config.storage_config import REPORT_INDEX_WORKERS, REPORT_INDEX_MAX_CHARS
+
+
+def index_report(path: str, mime_type: str, max_chars: int) -> Tuple[str, Set[str], Optional[str], List[int]]:
+    """(text, index terms, error, MinHash signature) for one report; runs in a worker process"""
+    # Imported here: the app creates a ReportIndexer before its login window
+    # appears, and only the workers need the parsers
+    from trial_project.models import minhash
+    from trial_project.models.text_extraction import extract_report
+    content, terms, error = extract_report(path, mime_type, max_chars)
+    return content, terms, error, minhash.signature(content)
+
+
+class ReportIndexer:
+    """Extracts report text in worker processes and writes it to the keyword index"""
+
+    # Parsing PDFs and DOCX is CPU-bound pure Python, so it runs in a process
+    # pool rather than on the UI's threads. Workers only read the stored file
+    # and return (text, terms, error, signature); the database write happens
+    # back in this process, on the executor's result thread. The pool starts
+    # on first use.
+
+    def __init__(self, model, store, workers: int = REPORT_INDEX_WORKERS,
+                 max_chars: int = REPORT_INDEX_MAX_CHARS):
+        self.model = model
+        self.store = store
+        self.workers = workers
+        self.max_chars = max_chars
+        self._executor = None
+        self._done = threading.Condition()
+        self._in_flight: Dict[str, Future] = {}
+
+    def _pool(self):
+        if self._executor is None:
+            # Imported on first use: concurrent.futures.process pulls in multiprocessing
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            # spawn: forking a process that runs Tk and database threads is unsafe
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+        return self._executor
+
+    def submit(self, sha256: str, mime_type: str) -> Future:
+        """Queue one stored file for extraction; a file already queued is not queued twice"""
+        with self._done:
+            future = self._in_flight.get(sha256)
+            if future is not None:
+                return future
+            future = self._pool().submit(index_report, str(self.store.path_for(sha256)),
+                                         mime_type, self.max_chars)
+            self._in_flight[sha256] = future
+        # Outside the lock: a future that is already done runs the callback right here
+        future.add_done_callback(lambda done: self._save(sha256, done))
+        return future
+
+    def _save(self, sha256: str, future: Future):
+        try:
+            if future.cancelled():
+                return
+            try:
+                content, terms, error, signature = future.result()
+            except Exception as e:
+                # The worker process died; leave the file unindexed so it is retried
+                print(f"Error extracting report {sha256[:12]}: {e}")
+                return
+            if error:
+                print(f"Could not extract text from report {sha256[:12]}: {error}")
+            self.model.save_report_text(sha256, content, terms, error, signature)
+        finally:
+            with self._done:
+                self._in_flight.pop(sha256, None)
+                self._done.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far has been written; False on timeout"""
+        with self._done:
+            return self._done.wait_for(lambda: not self._in_flight, timeout)
+
+    def sign_pending(self, department_id: int = None, batch: int = 50, chunk: int = 5) -> int:
+        """Compute missing signatures for already extracted texts across the workers; returns how many were signed"""
+        # For texts indexed before signatures existed. Each round loads one batch
+        # of texts and saves a signature for every one of them, empty or not,
+        # so rounds always make progress.
+        from trial_project.models import minhash
+        total = 0
+        while True:
+            texts = self.model.get_unsigned_report_texts(department_id, batch)
+            if not texts:
+                return total
+            chunks = [[(text['sha256'], text['content']) for text in texts[i:i + chunk]]
+                      for i in range(0, len(texts), chunk)]
+            for signatures in self._pool().map(minhash.signatures_for, chunks):
+                if not self.model.save_report_signatures(signatures):
+                    return total
+                total += len(signatures)
+
+    def shutdown(self):
+        """Stop the worker processes: files being extracted are finished and saved, queued ones dropped"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
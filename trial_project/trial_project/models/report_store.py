@@ -0,0 +1,103 @@
+import hashlib
+import mimetypes
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+from trial_project.config.storage_config import REPORT_STORE_DIR, REPORT_CHUNK_SIZE
+
+# Leading bytes of common report formats, for files without a useful extension
+_SIGNATURES = [
+    (b'%PDF-', 'application/pdf'),
+    (b'PK\x03\x04', 'application/zip'),
+    (b'\xd0\xcf\x11\xe0', 'application/msword'),
+]
+
+
+def guess_mime_type(filename: str, head: bytes) -> str:
+    """MIME type from the file name, falling back to the leading bytes"""
+    mime_type, _ = mimetypes.guess_type(filename)
+    if mime_type:
+        return mime_type
+    for signature, signature_type in _SIGNATURES:
+        if head.startswith(signature):
+            return signature_type
+    return 'application/octet-stream'
+
+
+class ReportStore:
+    """Content-addressed directory of uploaded reports"""
+
+    # A file is copied in fixed-size chunks into a temporary file inside the
+    # store, hashing each chunk on the way, then renamed to <root>/ab/cd/<sha256>.
+    # Memory use is one chunk buffer whatever the file size. The rename is
+    # atomic, so concurrent uploads of the same content both end up pointing at
+    # one complete file.
+
+    def __init__(self, root: str = REPORT_STORE_DIR, chunk_size: int = REPORT_CHUNK_SIZE):
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self._incoming = self.root / 'incoming'
+
+    def relative_path(self, sha256: str) -> str:
+        return f"{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+    def path_for(self, sha256: str) -> Path:
+        """Absolute location of a stored report"""
+        return self.root / self.relative_path(sha256)
+
+    def exists(self, sha256: str) -> bool:
+        return self.path_for(sha256).is_file()
+
+    def put(self, source: str) -> Dict[str, Any]:
+        """Stream source into the store, returning its sha256, size_bytes, mime_type and path"""
+        self._incoming.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        size = 0
+        head = b''
+
+        fd, temp_path = tempfile.mkstemp(dir=self._incoming, prefix='upload-')
+        try:
+            # The file object owns fd before anything else can fail
+            dst = os.fdopen(fd, 'wb')
+            with dst, open(source, 'rb') as src:
+                while True:
+                    read = src.readinto(buffer)
+                    if not read:
+                        break
+                    chunk = view[:read]
+                    if not size:
+                        head = bytes(chunk[:16])
+                    digest.update(chunk)
+                    dst.write(chunk)
+                    size += read
+                dst.flush()
+                os.fsync(dst.fileno())
+
+            sha256 = digest.hexdigest()
+            target = self.path_for(sha256)
+            deduplicated = target.is_file()
+            if deduplicated:
+                os.remove(temp_path)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_path, target)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return {
+            'sha256': sha256,
+            'size_bytes': size,
+            'mime_type': guess_mime_type(os.path.basename(source), head),
+            'path': self.relative_path(sha256),  # relative to the store root
+            'deduplicated': deduplicated,        # identical content was already stored
+        }
+
+    def open(self, sha256: str):
+        """Open a stored report for reading"""
+        return open(self.path_for(sha256), 'rb')
@@ -0,0 +1,15 @@
+# Schema facts shared by the MySQL migrations and the SQLite schema
+
+# role -> (table, primary key, department column or None). The order is also
+# the login precedence when one email is registered under several roles and
+# no role is chosen: the least privileged role whose password matches wins.
+IDENTITY_SOURCES = {
+    'student': ('students', 'student_id', 'department_id'),
+    'faculty': ('faculties', 'faculty_id', 'department_id'),
+    'secretary': ('secretaries', 'secretary_id', 'department_id'),
+    'company': ('companies', 'company_id', None),
+    'admin': ('admins', 'admin_id', None),
+}
+
+DEFAULT_DEPARTMENTS = ['Computer Science', 'Electrical Engineering', 'Mechanical Engineering',
+                       'Civil Engineering', 'Business Administration']
@@ -0,0 +1,288 @@
+import functools
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+from trial_project.models.query_metrics import InstrumentedCursor
+from trial_project.models.sqlite_schema import SQLITE_MIGRATIONS, NOW
+
+# Dates travel as ISO text and come back typed through the declared column
+# types, so rows look like the MySQL connector's (date, datetime, Decimal)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter('TIMESTAMP', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DECIMAL', lambda value: Decimal(value.decode()))
+
+# MySQL spellings used by the model's queries -> SQLite
+_DIALECT = [
+    # PARSE_COLNAMES types the column from its "name [type]" alias
+    (re.compile(r'\bCURRENT_TIMESTAMP\(6\) AS (\w+)', re.I), NOW + r' AS "\1 [timestamp]"'),
+    (re.compile(r'\bCURDATE\(\)', re.I), "DATE('now', 'localtime')"),
+    (re.compile(r'\bINSERT IGNORE\b', re.I), 'INSERT OR IGNORE'),
+]
+
+
+@functools.lru_cache(maxsize=1024)
+def translate(query: str) -> str:
+    """Rewrite a MySQL-dialect query (%s placeholders) for SQLite"""
+    query = query.replace('%s', '?').replace('%%', '%')
+    for pattern, replacement in _DIALECT:
+        query = pattern.sub(replacement, query)
+    return query
+
+
+class SQLiteCursor:
+    """sqlite3 cursor with the connector's interface: %s placeholders, dict rows, column_names"""
+
+    def __init__(self, connection: sqlite3.Connection, dictionary: bool = False):
+        self._cursor = connection.cursor()
+        self._dictionary = dictionary
+
+    def execute(self, query, params=()):
+        self._cursor.execute(translate(query), tuple(params))
+
+    def executemany(self, query, seq_params):
+        self._cursor.executemany(translate(query), seq_params)
+
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        return tuple(column[0] for column in self._cursor.description or ())
+
+    @property
+    def with_rows(self) -> bool:
+        return self._cursor.description is not None
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self.column_names, row))
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if not self._dictionary:
+            return rows
+        columns = self.column_names
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """Connection handed out by SQLitePool, mirroring the connector's connection methods"""
+
+    def __init__(self, raw: sqlite3.Connection):
+        self.raw = raw
+
+    def cursor(self, dictionary: bool = False, buffered: bool = False):
+        # sqlite3 reads rows from the local file on demand, so buffering has no meaning
+        return SQLiteCursor(self.raw, dictionary)
+
+    @property
+    def in_transaction(self) -> bool:
+        return self.raw.in_transaction
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+
+class SQLitePool:
+    """One SQLite connection per thread in WAL mode, behind ConnectionPool's interface"""
+
+    # WAL lets the UI thread read while a worker writes. A thread re-uses its
+    # connection for nested checkouts, so only the outermost release rolls back.
+
+    def __init__(self, database: str, busy_timeout: float):
+        self.database = database
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._stats = {'connections': 0, 'checkouts': 0, 'returns': 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread is off only so close() can run on the main thread at shutdown
+        raw = sqlite3.connect(self.database, timeout=self.busy_timeout, check_same_thread=False,
+                              detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                              cached_statements=256)
+        raw.execute("PRAGMA journal_mode = WAL")
+        # In WAL mode NORMAL never corrupts the file; a power cut may lose the last commits
+        raw.execute("PRAGMA synchronous = NORMAL")
+        raw.execute("PRAGMA foreign_keys = ON")
+        with self._lock:
+            self._connections.append(raw)
+            self._stats['connections'] += 1
+        return raw
+
+    def checkout(self) -> SQLiteConnection:
+        """This thread's connection, opened on first use"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = SQLiteConnection(self._connect())
+            self._local.depth = 0
+        self._local.depth += 1
+        self._count('checkouts')
+        return connection
+
+    def release(self, connection: SQLiteConnection):
+        """Hand the connection back, rolling back anything left uncommitted"""
+        self._local.depth -= 1
+        try:
+            if self._local.depth == 0 and connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error as e:
+            print(f"Error returning connection to pool: {e}")
+        finally:
+            self._count('returns')
+
+    @contextmanager
+    def connection(self):
+        """Check out this thread's connection for one operation"""
+        connection = self.checkout()
+        try:
+            yield connection
+        except Exception:
+            try:
+                connection.rollback()
+            except sqlite3.Error:
+                pass
+            raise
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def cursor(self, commit: bool = False):
+        """Dictionary cursor on this thread's connection, committed on success if requested"""
+        with self.connection() as connection:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                yield InstrumentedCursor(cursor)
+                if commit:
+                    connection.commit()
+            finally:
+                cursor.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Snapshot of connection usage counters"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['in_use'] = stats['checkouts'] - stats['returns']
+        return stats
+
+    def close(self):
+        """Close every thread's connection"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for raw in connections:
+            try:
+                raw.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+
+class SQLiteStatementRegistry:
+    """StatementRegistry's interface for SQLite, where sqlite3 caches compiled statements per connection"""
+
+    def __init__(self, pool: SQLitePool):
+        self.pool = pool
+        self._sql: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, name: str, query: str):
+        """Register (or confirm) the SQL behind a statement name"""
+        with self._lock:
+            registered = self._sql.get(name)
+            if registered is None:
+                self._sql[name] = query
+                self._stats[name] = {'executions': 0, 'prepares': 0, 'total_time': 0.0}
+            elif registered != query:
+                raise ValueError(f"Statement '{name}' is already registered with different SQL")
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._sql
+
+    def run(self, name: str, params: tuple = (), commit: bool = False) -> Tuple[List[Dict], int]:
+        """Execute a registered statement, returning (rows as dicts, affected row count)"""
+        started = time.perf_counter()
+        with self.pool.cursor(commit=commit) as cursor:
+            cursor.execute(self._sql[name], tuple(params))
+            rows = cursor.fetchall() if cursor.with_rows else []
+            rowcount = cursor.rowcount
+        with self._lock:
+            stats = self._stats[name]
+            stats['executions'] += 1
+            stats['total_time'] += time.perf_counter() - started
+        return rows, rowcount
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-statement execution counts and cumulative latency"""
+        with self._lock:
+            report = {}
+            for name, stats in self._stats.items():
+                entry = dict(stats)
+                entry['avg_ms'] = (stats['total_time'] / stats['executions'] * 1000
+                                   if stats['executions'] else 0.0)
+                report[name] = entry
+        return report
+
+
+class SQLiteMigrationRunner:
+    """Applies pending SQLite schema versions, recorded in PRAGMA user_version"""
+
+    def __init__(self, pool: SQLitePool):
+        self.pool = pool
+
+    def current_version(self) -> int:
+        with self.pool.connection() as connection:
+            return connection.raw.execute("PRAGMA user_version").fetchone()[0]
+
+    def is_current(self) -> bool:
+        return self.current_version() >= SQLITE_MIGRATIONS[-1][0]
+
+    def migrate(self) -> List[int]:
+        """Apply every pending version in order, returning the versions applied"""
+        if self.is_current():
+            return []
+
+        applied = []
+        with self.pool.connection() as connection:
+            raw = connection.raw
+            # Takes the write lock up front, serialising concurrent app starts
+            raw.execute("BEGIN IMMEDIATE")
+            current = raw.execute("PRAGMA user_version").fetchone()[0]
+            for version, description, statements in SQLITE_MIGRATIONS:
+                if version <= current:
+                    continue
+                for statement in statements:
+                    query, params = statement if isinstance(statement, tuple) else (statement, ())
+                    raw.execute(query, params)
+                raw.execute(f"PRAGMA user_version = {int(version)}")
+                applied.append(version)
+                print(f"Applied SQLite schema version {version}: {description}")
+            raw.commit()
+        return applied
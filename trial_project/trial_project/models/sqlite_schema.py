@@ -0,0 +1,279 @@
+from typing import List, Tuple
+
+from trial_project.models.schema import IDENTITY_SOURCES, DEFAULT_DEPARTMENTS
+
+# SQLite equivalent of the MySQL migrations: same tables, columns, indexes and
+# identity triggers. SQLite databases start at the schema of MySQL migration 4,
+# so later migrations are appended to both lists under the same version.
+# The applied version is kept in PRAGMA user_version.
+
+# Local time with milliseconds, sorting like MySQL's TIMESTAMP(6) text
+NOW = "(STRFTIME('%Y-%m-%d %H:%M:%f', 'now', 'localtime'))"
+
+TABLES = {
+    'department': f"""
+        CREATE TABLE IF NOT EXISTS department (
+            department_id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL UNIQUE,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'students': f"""
+        CREATE TABLE IF NOT EXISTS students (
+            student_id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            cgpa DECIMAL(3,2) CHECK (cgpa >= 2.00 AND cgpa <= 4.00),
+            department_id INT REFERENCES department(department_id),
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'faculties': f"""
+        CREATE TABLE IF NOT EXISTS faculties (
+            faculty_id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            department_id INT REFERENCES department(department_id),
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'secretaries': f"""
+        CREATE TABLE IF NOT EXISTS secretaries (
+            secretary_id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            faculty_id INT REFERENCES faculties(faculty_id),
+            department_id INT REFERENCES department(department_id),
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'admins': f"""
+        CREATE TABLE IF NOT EXISTS admins (
+            admin_id INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'companies': f"""
+        CREATE TABLE IF NOT EXISTS companies (
+            company_id INTEGER PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            contact_person VARCHAR(100),
+            email VARCHAR(100) UNIQUE NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            phone VARCHAR(20),
+            address TEXT,
+            registered BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'quotas': f"""
+        CREATE TABLE IF NOT EXISTS quotas (
+            quota_id INTEGER PRIMARY KEY,
+            company_id INT REFERENCES companies(company_id),
+            department VARCHAR(100),
+            total_slots INT NOT NULL,
+            available_slots INT NOT NULL,
+            deadline DATE,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT {NOW},
+            updated_at TIMESTAMP NOT NULL DEFAULT {NOW}
+        )
+    """,
+    'applications': f"""
+        CREATE TABLE IF NOT EXISTS applications (
+            app_id INTEGER PRIMARY KEY,
+            student_id INT REFERENCES students(student_id),
+            company_id INT REFERENCES companies(company_id),
+            quota_id INT REFERENCES quotas(quota_id),
+            status VARCHAR(10) DEFAULT 'pending'
+                CHECK (status IN ('pending', 'approved', 'rejected', 'completed')),
+            application_date TIMESTAMP DEFAULT {NOW},
+            report_path VARCHAR(255),
+            self_found BOOLEAN DEFAULT FALSE,
+            updated_at TIMESTAMP NOT NULL DEFAULT {NOW}
+        )
+    """,
+    'reports': f"""
+        CREATE TABLE IF NOT EXISTS reports (
+            report_id INTEGER PRIMARY KEY,
+            student_id INT REFERENCES students(student_id),
+            faculty_id INT REFERENCES faculties(faculty_id),
+            app_id INT REFERENCES applications(app_id),
+            grade VARCHAR(10),
+            comments TEXT,
+            submitted_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'feedback': f"""
+        CREATE TABLE IF NOT EXISTS feedback (
+            feedback_id INTEGER PRIMARY KEY,
+            company_id INT REFERENCES companies(company_id),
+            student_id INT REFERENCES students(student_id),
+            app_id INT REFERENCES applications(app_id),
+            rating INT CHECK (rating >= 1 AND rating <= 5),
+            remarks TEXT,
+            submitted_at TIMESTAMP DEFAULT {NOW}
+        )
+    """,
+    'faculty_assignments': f"""
+        CREATE TABLE IF NOT EXISTS faculty_assignments (
+            assignment_id INTEGER PRIMARY KEY,
+            faculty_id INT REFERENCES faculties(faculty_id),
+            student_id INT REFERENCES students(student_id),
+            assigned_at TIMESTAMP DEFAULT {NOW},
+            updated_at TIMESTAMP NOT NULL DEFAULT {NOW}
+        )
+    """,
+}
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_applications_status_date ON applications (status, application_date)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_student_status ON applications (student_id, status)",
+    "CREATE INDEX IF NOT EXISTS idx_quotas_department_deadline ON quotas (department, deadline)",
+    "CREATE INDEX IF NOT EXISTS idx_quotas_deadline ON quotas (deadline)",
+    "CREATE INDEX IF NOT EXISTS idx_faculty_assignments_faculty ON faculty_assignments (faculty_id, student_id)",
+    "CREATE INDEX IF NOT EXISTS idx_faculty_assignments_student ON faculty_assignments (student_id, faculty_id)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_faculty ON reports (faculty_id, submitted_at)",
+    "CREATE INDEX IF NOT EXISTS idx_applications_updated ON applications (updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_quotas_updated ON quotas (updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_faculty_assignments_updated ON faculty_assignments (updated_at)",
+]
+
+# table -> primary key of the tables carrying an updated_at change-feed column
+CHANGE_FEED_TABLES = {'applications': 'app_id', 'quotas': 'quota_id', 'faculty_assignments': 'assignment_id'}
+
+
+def change_feed_triggers() -> List[str]:
+    """Stamp updated_at on every update, as MySQL's ON UPDATE CURRENT_TIMESTAMP(6) does"""
+    # recursive_triggers is off, so the inner UPDATE does not fire the trigger again
+    return [f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_touch AFTER UPDATE ON {table} FOR EACH ROW
+        WHEN NEW.updated_at = OLD.updated_at
+        BEGIN
+            UPDATE {table} SET updated_at = {NOW} WHERE {key} = NEW.{key};
+        END
+    """ for table, key in CHANGE_FEED_TABLES.items()]
+
+
+def identity_statements() -> List[str]:
+    """user_identities and the triggers keeping it in sync with the role tables"""
+    statements = ["""
+        CREATE TABLE IF NOT EXISTS user_identities (
+            email VARCHAR(100) NOT NULL,
+            role VARCHAR(10) NOT NULL CHECK (role IN ('student', 'faculty', 'secretary', 'company', 'admin')),
+            user_id INT NOT NULL,
+            name VARCHAR(200) NOT NULL,
+            password_hash VARCHAR(255) NOT NULL,
+            department_id INT NULL,
+            PRIMARY KEY (email, role),
+            UNIQUE (role, user_id)
+        ) WITHOUT ROWID
+    """]
+    for role, (table, id_column, dept_column) in IDENTITY_SOURCES.items():
+        new_dept = f"NEW.{dept_column}" if dept_column else 'NULL'
+        statements += [
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_identity_insert AFTER INSERT ON {table} FOR EACH ROW
+            BEGIN
+                INSERT INTO user_identities (email, role, user_id, name, password_hash, department_id)
+                VALUES (NEW.email, '{role}', NEW.{id_column}, NEW.name, NEW.password_hash, {new_dept});
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_identity_update AFTER UPDATE ON {table} FOR EACH ROW
+            BEGIN
+                UPDATE user_identities
+                SET email = NEW.email, name = NEW.name, password_hash = NEW.password_hash,
+                    department_id = {new_dept}
+                WHERE role = '{role}' AND user_id = NEW.{id_column};
+            END
+            """,
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_identity_delete AFTER DELETE ON {table} FOR EACH ROW
+            BEGIN
+                DELETE FROM user_identities WHERE role = '{role}' AND user_id = OLD.{id_column};
+            END
+            """,
+        ]
+    return statements
+
+
+SQLITE_MIGRATIONS: List[Tuple[int, str, List]] = [
+    (4, "Initial SQLite schema", list(TABLES.values()) + INDEXES + change_feed_triggers()
+        + identity_statements() + [
+        ("INSERT OR IGNORE INTO department (name) VALUES (?)", (dept,)) for dept in DEFAULT_DEPARTMENTS
+    ]),
+    (5, "Content-addressed report files", [
+        f"""
+        CREATE TABLE IF NOT EXISTS report_files (
+            sha256 CHAR(64) PRIMARY KEY,
+            size_bytes INTEGER NOT NULL,
+            mime_type VARCHAR(100) NOT NULL,
+            created_at TIMESTAMP DEFAULT {NOW}
+        ) WITHOUT ROWID
+        """,
+        "ALTER TABLE applications ADD COLUMN report_sha256 CHAR(64) REFERENCES report_files(sha256)",
+        "ALTER TABLE applications ADD COLUMN report_filename VARCHAR(255)",
+    ]),
+    (6, "Extracted report text and keyword index", [
+        f"""
+        CREATE TABLE IF NOT EXISTS report_texts (
+            sha256 CHAR(64) PRIMARY KEY REFERENCES report_files(sha256),
+            content TEXT NOT NULL,
+            term_count INTEGER NOT NULL,
+            error VARCHAR(255),
+            extracted_at TIMESTAMP DEFAULT {NOW}
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS report_terms (
+            term VARCHAR(64) NOT NULL,
+            sha256 CHAR(64) NOT NULL REFERENCES report_files(sha256),
+            PRIMARY KEY (term, sha256)
+        ) WITHOUT ROWID
+        """,
+        # MySQL indexes foreign key columns itself; SQLite does not
+        "CREATE INDEX IF NOT EXISTS idx_reports_app ON reports (app_id)",
+        "CREATE INDEX IF NOT EXISTS idx_applications_report ON applications (report_sha256)",
+    ]),
+    (7, "MinHash signatures and LSH buckets for near-duplicate reports", [
+        """
+        CREATE TABLE IF NOT EXISTS report_signatures (
+            sha256 CHAR(64) PRIMARY KEY REFERENCES report_files(sha256),
+            signature BLOB NOT NULL
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS report_lsh_buckets (
+            band SMALLINT NOT NULL,
+            bucket BIGINT NOT NULL,
+            sha256 CHAR(64) NOT NULL REFERENCES report_files(sha256),
+            PRIMARY KEY (band, bucket, sha256)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_report_lsh_buckets_file ON report_lsh_buckets (sha256)",
+    ]),
+    (8, "Ranked search index over quotas and their companies", [
+        """
+        CREATE TABLE IF NOT EXISTS quota_terms (
+            term VARCHAR(64) NOT NULL,
+            quota_id INT NOT NULL REFERENCES quotas(quota_id) ON DELETE CASCADE,
+            weight SMALLINT NOT NULL,
+            PRIMARY KEY (term, quota_id)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_quota_terms_quota ON quota_terms (quota_id)",
+    ]),
+    (9, "Composite indexes for faceted quota browsing", [
+        "CREATE INDEX IF NOT EXISTS idx_quotas_open_facets ON quotas (deadline, available_slots, department, company_id)",
+        "CREATE INDEX IF NOT EXISTS idx_quotas_department_open ON quotas (department, deadline, available_slots, company_id)",
+        "CREATE INDEX IF NOT EXISTS idx_quotas_company_open ON quotas (company_id, deadline, available_slots, department)",
+        "DROP INDEX IF EXISTS idx_quotas_department_deadline",
+    ]),
+]
@@ -0,0 +1,103 @@
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Tuple
+from mysql.connector import Error, errorcode
+
+from trial_project.models.query_metrics import metrics, row_bytes
+
+
+class StatementRegistry:
+    """Named server-side prepared statements, prepared once per pooled connection"""
+
+    # The connector's prepared cursor re-uses its statement handle as long as it
+    # is executed with the same SQL, so each connection keeps one cursor per name.
+    # This relies on the pool not resetting sessions on return, which would
+    # deallocate every prepared statement.
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._sql: Dict[str, str] = {}
+        # Underlying connection -> {name: prepared cursor}; entries vanish with the connection
+        self._cursors = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, name: str, query: str):
+        """Register (or confirm) the SQL behind a statement name"""
+        with self._lock:
+            registered = self._sql.get(name)
+            if registered is None:
+                self._sql[name] = query
+                self._stats[name] = {'executions': 0, 'prepares': 0, 'total_time': 0.0}
+            elif registered != query:
+                raise ValueError(f"Statement '{name}' is already registered with different SQL")
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._sql
+
+    def _cursor(self, connection, name: str):
+        raw = getattr(connection, '_cnx', connection)  # Pooled wrapper -> real connection
+        with self._lock:
+            cursors = self._cursors.setdefault(raw, {})
+            cursor = cursors.get(name)
+            if cursor is None:
+                cursor = raw.cursor(prepared=True)
+                cursors[name] = cursor
+                self._stats[name]['prepares'] += 1
+        return cursor
+
+    def _forget(self, connection, name: str):
+        raw = getattr(connection, '_cnx', connection)
+        with self._lock:
+            cursor = self._cursors.get(raw, {}).pop(name, None)
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Error:
+                pass
+
+    def run(self, name: str, params: tuple = (), commit: bool = False) -> Tuple[List[Dict], int]:
+        """Execute a registered statement, returning (rows as dicts, affected row count)"""
+        query = self._sql[name]
+        with self.pool.connection() as connection:
+            for attempt in range(2):
+                cursor = self._cursor(connection, name)
+                started = time.perf_counter()
+                try:
+                    cursor.execute(query, tuple(params))
+                    rows = []
+                    if cursor.with_rows:
+                        columns = cursor.column_names
+                        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                    rowcount = cursor.rowcount
+                    if commit:
+                        connection.commit()
+                except Error as e:
+                    metrics.record_query(query, time.perf_counter() - started,
+                                         bound_sql=f"{query} -- params: {params!r}", error=e)
+                    self._forget(connection, name)
+                    # A reconnect drops the server's statement handles; prepare again once
+                    if attempt == 0 and e.errno == errorcode.ER_UNKNOWN_STMT_HANDLER:
+                        continue
+                    raise
+                elapsed = time.perf_counter() - started
+                bound = query if 'password' in query.lower() else f"{query} -- params: {params!r}"
+                metrics.record_query(query, elapsed, len(rows) if rows else rowcount, bound_sql=bound)
+                metrics.record_bytes(query, sum(row_bytes(row) for row in rows))
+                with self._lock:
+                    stats = self._stats[name]
+                    stats['executions'] += 1
+                    stats['total_time'] += elapsed
+                return rows, rowcount
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-statement execution counts, prepares and cumulative latency"""
+        with self._lock:
+            report = {}
+            for name, stats in self._stats.items():
+                entry = dict(stats)
+                entry['avg_ms'] = (stats['total_time'] / stats['executions'] * 1000
+                                   if stats['executions'] else 0.0)
+                report[name] = entry
+        return report
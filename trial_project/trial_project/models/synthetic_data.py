@@ -0,0 +1,318 @@
+import random
+import time
+from array import array
+from bisect import bisect
+from datetime import date, datetime, timedelta
+from itertools import accumulate, islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Rows per executemany; each batch is committed on its own so memory stays flat
+BATCH_SIZE = 5000
+
+# Every synthetic account logs in with this password
+SYNTHETIC_PASSWORD = "synthetic-password"
+EMAIL_DOMAIN = "synthetic.example"
+
+# Row counts per table; quotas.department and every role table draw from `departments`
+PRESETS: Dict[str, Dict[str, int]] = {
+    'small': {'departments': 5, 'admins': 2, 'companies': 200, 'faculty': 100, 'secretaries': 10,
+              'students': 2_000, 'quotas': 1_000, 'applications': 10_000},
+    'medium': {'departments': 10, 'admins': 5, 'companies': 5_000, 'faculty': 2_000, 'secretaries': 100,
+               'students': 50_000, 'quotas': 20_000, 'applications': 200_000},
+    'large': {'departments': 20, 'admins': 10, 'companies': 20_000, 'faculty': 10_000, 'secretaries': 400,
+              'students': 250_000, 'quotas': 100_000, 'applications': 1_000_000},
+    'xlarge': {'departments': 40, 'admins': 20, 'companies': 100_000, 'faculty': 50_000, 'secretaries': 1_000,
+               'students': 2_000_000, 'quotas': 500_000, 'applications': 10_000_000},
+}
+
+# Share of applications to companies found by the student, outside any quota
+SELF_FOUND_RATE = 0.15
+# Company popularity follows a Zipf law with this exponent
+COMPANY_SKEW = 1.1
+# Deadlines cluster around intake dates, as days from the anchor date, with this spread
+DEADLINE_CLUSTERS = (-75, -20, 30, 90, 150)
+DEADLINE_SPREAD_DAYS = 6
+
+
+def zipf_weights(n: int, exponent: float) -> List[float]:
+    return [1.0 / (rank ** exponent) for rank in range(1, n + 1)]
+
+
+class SyntheticDataGenerator:
+    """Deterministic, seedable load data for every table, written with streaming bulk inserts"""
+
+    # Ids are assigned here, following each table's current maximum, so foreign keys
+    # never need reading back and the same seed on an empty database gives the same rows.
+
+    def __init__(self, model, volumes: Dict[str, int], seed: int = 1, batch_size: int = BATCH_SIZE,
+                 anchor: Optional[date] = None):
+        missing = set(PRESETS['small']) - set(volumes)
+        if missing:
+            raise ValueError(f"Missing volumes: {', '.join(sorted(missing))}")
+        self.model = model
+        self.volumes = dict(volumes)
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        # Dates are relative to the anchor, so pin it to reproduce a dataset exactly
+        self.anchor = anchor or date.today()
+        self.now = datetime.combine(self.anchor, datetime.min.time()) + timedelta(hours=12)
+        self.counts: Dict[str, int] = {}
+
+    def generate(self, on_progress: Callable[[str, int], None] = None) -> Dict:
+        """Populate every table, returning rows written per table and the elapsed seconds"""
+        started = time.perf_counter()
+        self.on_progress = on_progress
+        self.password_hash = self.model.hash_password(SYNTHETIC_PASSWORD)
+        with self.model.pool.connection() as connection:
+            self.connection = connection
+            self.cursor = connection.cursor()
+            try:
+                self._departments()
+                self._admins()
+                self._companies()
+                self._faculty()
+                self._secretaries()
+                self._students()
+                self._quotas()
+                self._applications()
+            finally:
+                self.cursor.close()
+        return {'rows': dict(self.counts), 'seconds': time.perf_counter() - started}
+
+    # Helpers
+
+    def _next_id(self, table: str, column: str) -> int:
+        self.cursor.execute(f"SELECT COALESCE(MAX({column}), 0) FROM {table}")
+        return self.cursor.fetchone()[0] + 1
+
+    def _insert(self, table: str, columns: Iterable[str], rows: Iterable[tuple]):
+        """Stream rows into table in committed batches"""
+        columns = list(columns)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                break
+            self._write(table, sql, batch)
+
+    def _write(self, table: str, sql: str, batch: List[tuple]):
+        self.cursor.executemany(sql, batch)
+        self.connection.commit()
+        self.counts[table] = self.counts.get(table, 0) + len(batch)
+        if self.on_progress:
+            self.on_progress(table, self.counts[table])
+
+    def _pick(self, cum_weights: List[float]) -> int:
+        """Index drawn in proportion to the weights behind cum_weights"""
+        return bisect(cum_weights, self.rng.random() * cum_weights[-1])
+
+    def _email(self, role: str, user_id: int) -> str:
+        return f"{role}{user_id}@{EMAIL_DOMAIN}"
+
+    # Tables, in foreign key order
+
+    def _departments(self):
+        self.cursor.execute("SELECT department_id, name FROM department ORDER BY department_id")
+        existing = self.cursor.fetchall()
+        wanted = self.volumes['departments']
+        names = {name for _, name in existing}
+        new = []
+        i = len(existing)
+        while len(existing) + len(new) < wanted:
+            i += 1
+            if f"Department {i}" not in names:
+                new.append((f"Department {i}",))
+        if new:
+            self._insert('department', ['name'], new)
+            self.cursor.execute("SELECT department_id, name FROM department ORDER BY department_id")
+            existing = self.cursor.fetchall()
+        self.departments = existing[:wanted]
+        # A few large departments and a long tail of small ones
+        self.department_cum = list(accumulate(zipf_weights(len(self.departments), 0.6)))
+
+    def _admins(self):
+        first = self._next_id('admins', 'admin_id')
+        self._insert('admins', ['admin_id', 'name', 'email', 'password_hash'], (
+            (i, f"Admin {i}", self._email('admin', i), self.password_hash)
+            for i in range(first, first + self.volumes['admins'])))
+
+    def _companies(self):
+        n = self.volumes['companies']
+        self.first_company = first = self._next_id('companies', 'company_id')
+        # Popularity rank is shuffled so it does not follow company ids
+        ranks = list(range(1, n + 1))
+        self.rng.shuffle(ranks)
+        self.company_cum = list(accumulate(1.0 / (rank ** COMPANY_SKEW) for rank in ranks))
+        rng = self.rng
+        self._insert('companies', ['company_id', 'name', 'contact_person', 'email', 'password_hash',
+                                   'phone', 'address', 'registered'], (
+            (first + i, f"Company {first + i}", f"Contact {first + i}", self._email('company', first + i),
+             self.password_hash, f"+1-555-{rng.randrange(10 ** 7):07d}", f"{rng.randint(1, 999)} Market Street",
+             rng.random() < 0.85)
+            for i in range(n)))
+
+    def _faculty(self):
+        n = self.volumes['faculty']
+        first = self._next_id('faculties', 'faculty_id')
+        self.faculty_by_department: List[List[int]] = [[] for _ in self.departments]
+
+        def rows():
+            for faculty_id in range(first, first + n):
+                d = self._pick(self.department_cum)
+                self.faculty_by_department[d].append(faculty_id)
+                yield (faculty_id, f"Faculty {faculty_id}", self.departments[d][0],
+                       self._email('faculty', faculty_id), self.password_hash)
+        self._insert('faculties', ['faculty_id', 'name', 'department_id', 'email', 'password_hash'], rows())
+
+    def _secretaries(self):
+        first = self._next_id('secretaries', 'secretary_id')
+
+        def rows():
+            for i in range(self.volumes['secretaries']):
+                d = i % len(self.departments)  # Every department gets one before any gets two
+                faculty = self.faculty_by_department[d]
+                secretary_id = first + i
+                yield (secretary_id, f"Secretary {secretary_id}", self.rng.choice(faculty) if faculty else None,
+                       self.departments[d][0], self._email('secretary', secretary_id), self.password_hash)
+        self._insert('secretaries', ['secretary_id', 'name', 'faculty_id', 'department_id', 'email',
+                                     'password_hash'], rows())
+
+    def _students(self):
+        n = self.volumes['students']
+        self.first_student = first = self._next_id('students', 'student_id')
+        self.student_department = array('H')
+        self.students_by_department: List[array] = [array('I') for _ in self.departments]
+
+        def rows():
+            for student_id in range(first, first + n):
+                d = self._pick(self.department_cum)
+                self.student_department.append(d)
+                self.students_by_department[d].append(student_id)
+                cgpa = round(min(4.0, max(2.0, self.rng.gauss(3.1, 0.45))), 2)
+                yield (student_id, f"Student {student_id}", cgpa, self.departments[d][0],
+                       self._email('student', student_id), self.password_hash)
+        self._insert('students', ['student_id', 'name', 'cgpa', 'department_id', 'email', 'password_hash'], rows())
+
+    def _quotas(self):
+        n = self.volumes['quotas']
+        self.first_quota = first = self._next_id('quotas', 'quota_id')
+        # Per quota: slots left for approvals, and the deadline as a day ordinal
+        self.quota_slots = array('H')
+        self.quota_deadline = array('I')
+        self.quota_company = array('I')
+        self.quotas_by_department: List[array] = [array('I') for _ in self.departments]
+        anchor = self.anchor.toordinal()
+        rng = self.rng
+
+        def rows():
+            for quota_id in range(first, first + n):
+                # Popular companies post more quotas, and so draw more applicants
+                c = self._pick(self.company_cum)
+                d = self._pick(self.department_cum)
+                slots = min(50, 1 + int(rng.expovariate(1 / 4)))
+                deadline = anchor + rng.choice(DEADLINE_CLUSTERS) + int(rng.gauss(0, DEADLINE_SPREAD_DAYS))
+                self.quota_slots.append(slots)
+                self.quota_deadline.append(deadline)
+                self.quota_company.append(self.first_company + c)
+                self.quotas_by_department[d].append(quota_id)
+                yield (quota_id, self.first_company + c, self.departments[d][1], slots, slots,
+                       date.fromordinal(deadline), f"Internship {quota_id} for {self.departments[d][1]} students")
+        self._insert('quotas', ['quota_id', 'company_id', 'department', 'total_slots', 'available_slots',
+                                'deadline', 'description'], rows())
+
+    def _applications(self):
+        """Applications, plus the faculty assignments, reports and feedback that follow from them"""
+        n = self.volumes['applications']
+        first = self._next_id('applications', 'app_id')
+        assignment_id = self._next_id('faculty_assignments', 'assignment_id')
+        report_id = self._next_id('reports', 'report_id')
+        feedback_id = self._next_id('feedback', 'feedback_id')
+        students = self.volumes['students']
+        if not students or not self.volumes['companies']:
+            return
+        student_faculty = array('I', [0]) * students  # 0 = not assigned yet
+        rng = self.rng
+        anchor = self.anchor.toordinal()
+        sql = {
+            'applications': "INSERT INTO applications (app_id, student_id, company_id, quota_id, status, "
+                            "application_date, self_found) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            'faculty_assignments': "INSERT INTO faculty_assignments (assignment_id, faculty_id, student_id, "
+                                   "assigned_at) VALUES (%s, %s, %s, %s)",
+            'reports': "INSERT INTO reports (report_id, student_id, faculty_id, app_id, grade, comments, "
+                       "submitted_at) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            'feedback': "INSERT INTO feedback (feedback_id, company_id, student_id, app_id, rating, remarks, "
+                        "submitted_at) VALUES (%s, %s, %s, %s, %s, %s, %s)",
+        }
+        batches = {table: [] for table in sql}
+
+        def flush():
+            # Parents first, so every batch satisfies its foreign keys on its own
+            for table in sql:
+                if batches[table]:
+                    self._write(table, sql[table], batches[table])
+                    batches[table] = []
+
+        for app_id in range(first, first + n):
+            s = rng.randrange(students)
+            student_id = self.first_student + s
+            d = self.student_department[s]
+            quota_ids = self.quotas_by_department[d]
+            if not quota_ids or rng.random() < SELF_FOUND_RATE:
+                quota_id = None
+                company_id = self.first_company + self._pick(self.company_cum)
+                applied = self.now - timedelta(days=rng.randint(0, 180), seconds=rng.randrange(86400))
+                closed = applied < self.now - timedelta(days=30)
+            else:
+                quota_id = rng.choice(quota_ids)
+                q = quota_id - self.first_quota
+                company_id = self.quota_company[q]
+                deadline = self.quota_deadline[q]
+                # Applications arrive in the weeks before a deadline, never after the anchor
+                day = min(deadline - int(rng.expovariate(1 / 12)), anchor)
+                applied = datetime.fromordinal(day) + timedelta(seconds=rng.randrange(86400))
+                closed = deadline < anchor
+
+            if not closed:
+                status = 'pending' if rng.random() < 0.85 else 'rejected'
+            else:
+                status = rng.choices(('approved', 'completed', 'rejected'), (3, 2, 5))[0]
+            if status in ('approved', 'completed') and quota_id is not None:
+                if self.quota_slots[quota_id - self.first_quota] == 0:
+                    status = 'rejected'
+                else:
+                    self.quota_slots[quota_id - self.first_quota] -= 1
+            batches['applications'].append((app_id, student_id, company_id, quota_id, status, applied,
+                                            quota_id is None))
+
+            if status in ('approved', 'completed'):
+                faculty = self.faculty_by_department[d]
+                if not student_faculty[s] and faculty and rng.random() < 0.9:
+                    student_faculty[s] = rng.choice(faculty)
+                    batches['faculty_assignments'].append(
+                        (assignment_id, student_faculty[s], student_id, applied + timedelta(days=rng.randint(1, 14))))
+                    assignment_id += 1
+            if status == 'completed':
+                submitted = min(self.now, applied + timedelta(days=rng.randint(60, 120)))
+                if student_faculty[s]:
+                    grade = rng.choice(('A', 'A', 'B', 'B', 'B', 'C', None))
+                    batches['reports'].append((report_id, student_id, student_faculty[s], app_id, grade,
+                                               "Final internship report" if grade else None, submitted))
+                    report_id += 1
+                if rng.random() < 0.6:
+                    rating = rng.choices((1, 2, 3, 4, 5), (1, 2, 5, 8, 6))[0]
+                    batches['feedback'].append((feedback_id, company_id, student_id, app_id, rating,
+                                                f"Rated {rating}/5", submitted))
+                    feedback_id += 1
+
+            if len(batches['applications']) >= self.batch_size:
+                flush()
+        flush()
+
+        # One set-based pass instead of an update per quota; approvals never exceed the slots
+        self.cursor.execute(
+            "UPDATE quotas SET available_slots = total_slots - ("
+            " SELECT COUNT(*) FROM applications a"
+            " WHERE a.quota_id = quotas.quota_id AND a.status IN ('approved', 'completed')"
+            ") WHERE quota_id >= %s", (self.first_quota,))
+        self.connection.commit()
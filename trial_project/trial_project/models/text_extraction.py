@@ -0,0 +1,174 @@
+import mmap
+import re
+import zipfile
+import zlib
+from typing import List, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+# Plain-text extraction for uploaded reports using only the standard library.
+# Everything here runs in ReportIndexer's worker processes, so it must stay
+# importable without Tk or a database driver.
+
+DOCX_TYPES = {
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'application/zip',  # a .docx saved without its extension
+}
+
+# Index terms: runs of letters/digits, lower-cased, at most 64 characters
+_TERM = re.compile(r"[^\W_]{2,64}")
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+_PDF_STREAM = re.compile(rb'stream\r?\n(.*?)endstream', re.S)
+_PDF_TEXT_BLOCK = re.compile(rb'BT\b(.*?)\bET\b', re.S)
+# Literal strings (one level of nested parentheses), hex strings, numbers, operators
+_PDF_TOKEN = re.compile(rb"""
+    \((?:\\.|[^\\()]|\((?:\\.|[^\\()])*\))*\)
+  | <[0-9A-Fa-f\s]*>
+  | -?(?:\d+\.?\d*|\.\d+)
+  | [A-Za-z'"*]+
+  | [\[\]]
+""", re.S | re.X)
+_PDF_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f'}
+# TJ kerning wider than this (thousandths of an em) is taken as a word gap
+_PDF_WORD_GAP = -150
+
+
+def terms(text: str) -> Set[str]:
+    """Distinct index terms in text"""
+    return {term for term in _TERM.findall(text.lower())}
+
+
+def query_terms(keywords: str) -> List[str]:
+    """Terms a keyword search has to match, in the order typed"""
+    return list(dict.fromkeys(_TERM.findall(keywords.lower())))
+
+
+def extract_text(path: str, mime_type: str, max_chars: int) -> str:
+    """Text of a PDF, DOCX or plain-text report, cut off at max_chars"""
+    if mime_type == 'application/pdf':
+        return _pdf_text(path, max_chars)
+    if mime_type in DOCX_TYPES:
+        return _docx_text(path, max_chars)
+    if mime_type.startswith('text/'):
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read(max_chars)
+    raise ValueError(f"Cannot extract text from {mime_type} files")
+
+
+def extract_report(path: str, mime_type: str, max_chars: int) -> Tuple[str, Set[str], Optional[str]]:
+    """(text, index terms, error) for one report; errors are returned, not raised, so the file is not retried"""
+    try:
+        text = extract_text(path, mime_type, max_chars)
+    except (OSError, ValueError, zipfile.BadZipFile, ElementTree.ParseError, zlib.error) as e:
+        return '', set(), str(e)[:255]
+    return text, terms(text), None
+
+
+def _docx_text(path: str, max_chars: int) -> str:
+    """Paragraph text of word/document.xml, parsed incrementally"""
+    parts, size = [], 0
+    with zipfile.ZipFile(path) as archive:
+        with archive.open('word/document.xml') as document:
+            for event, element in ElementTree.iterparse(document, events=('end',)):
+                tag = element.tag
+                if tag == _WORD_NS + 't' and element.text:
+                    parts.append(element.text)
+                    size += len(element.text)
+                elif tag == _WORD_NS + 'tab':
+                    parts.append('\t')
+                elif tag in (_WORD_NS + 'br', _WORD_NS + 'p'):
+                    parts.append('\n')
+                if tag == _WORD_NS + 'p':
+                    # Drop finished paragraphs so memory stays bounded on long documents
+                    element.clear()
+                if size >= max_chars:
+                    break
+    return ''.join(parts)[:max_chars]
+
+
+def _pdf_text(path: str, max_chars: int) -> str:
+    """Text shown by the Tj/TJ/'/" operators of a PDF's content streams"""
+    # Handles text PDFs with simple (single-byte or UTF-16) string encodings;
+    # scanned pages and CID-keyed fonts yield little or nothing
+    parts, size = [], 0
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for stream in _PDF_STREAM.finditer(data):
+            content = stream.group(1)
+            try:
+                # decompressobj tolerates the end-of-line left before endstream
+                content = zlib.decompressobj().decompress(content)
+            except zlib.error:
+                # Uncompressed, or a filter other than FlateDecode
+                pass
+            for block in _PDF_TEXT_BLOCK.finditer(content):
+                text = _pdf_block_text(block.group(1))
+                if text:
+                    parts.append(text)
+                    size += len(text)
+                if size >= max_chars:
+                    return '\n'.join(parts)[:max_chars]
+    return '\n'.join(parts)
+
+
+def _pdf_block_text(block: bytes) -> str:
+    """Text of one BT ... ET block"""
+    out, operands = [], []
+    for match in _PDF_TOKEN.finditer(block):
+        token = match.group(0)
+        first = token[:1]
+        if first == b'(' or first == b'<':
+            operands.append(_pdf_string(token))
+        elif first in b'-.0123456789':
+            operands.append(float(token))
+        elif token in (b'[', b']'):
+            continue
+        else:
+            if token in (b'Tj', b'TJ', b"'", b'"'):
+                if token in (b"'", b'"'):
+                    out.append('\n')
+                for operand in operands:
+                    if isinstance(operand, str):
+                        out.append(operand)
+                    elif token == b'TJ' and operand < _PDF_WORD_GAP:
+                        out.append(' ')
+            elif token in (b'Td', b'TD', b'T*', b'Tm'):
+                out.append('\n')
+            operands = []
+    return ''.join(out).strip()
+
+
+def _pdf_string(token: bytes) -> str:
+    if token[:1] == b'<':
+        raw = bytes.fromhex(re.sub(rb'\s', b'', token[1:-1]).decode('ascii'))
+    else:
+        raw = _pdf_unescape(token[1:-1])
+    if raw.startswith(b'\xfe\xff'):
+        return raw[2:].decode('utf-16-be', errors='replace')
+    return raw.decode('latin-1')
+
+
+def _pdf_unescape(body: bytes) -> bytes:
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        byte = body[i:i + 1]
+        if byte != b'\\':
+            out += byte
+            i += 1
+            continue
+        following = body[i + 1:i + 2]
+        if following in _PDF_ESCAPES:
+            out += _PDF_ESCAPES[following]
+            i += 2
+        elif following and following in b'01234567':
+            octal = re.match(rb'[0-7]{1,3}', body[i + 1:i + 4]).group(0)
+            out.append(int(octal, 8) & 0xFF)
+            i += 1 + len(octal)
+        elif following in (b'\r', b'\n'):
+            # Line continuation
+            i += 2
+        else:
+            out += following
+            i += 2
+    return bytes(out)
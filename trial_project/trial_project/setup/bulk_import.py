@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Bulk import students, faculty or companies from a CSV (with header) or JSONL file.
+
+Columns: name, email, password, plus department (student, faculty), cgpa
+(student) and contact_person, phone, address (company, optional).
+Rows that fail validation or insertion are reported and skipped; the rest
+are committed in batches.
+
+Running clients cache the faculty and company lists in memory, so they
+show imported faculty and companies only once that cache expires (its TTL
+is 300 s, set in InternshipController) or the client restarts.
+
+Usage: python setup/bulk_import.py student students.csv [--batch-size 1000] [--errors failed.csv]
+"""
+
+import sys
+import csv
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.bulk_import import BulkImporter, BATCH_SIZE, IMPORT_TABLES, read_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or JSONL")
+    parser.add_argument('role', choices=sorted(IMPORT_TABLES))
+    parser.add_argument('path', help="CSV file with a header row, or .jsonl file")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--errors', help="write rejected rows to this CSV file")
+    args = parser.parse_args()
+
+    model = DatabaseModel()
+    try:
+        importer = BulkImporter(model, args.role, args.batch_size)
+        result = importer.run(
+            read_records(args.path),
+            on_progress=lambda inserted, failed: print(f"\r{inserted} imported, {failed} failed", end='')
+        )
+    finally:
+        model.close_connection()
+
+    rate = result['inserted'] / result['seconds'] if result['seconds'] else 0
+    print(f"\nImported {result['inserted']} {args.role} rows in {result['seconds']:.1f}s ({rate:.0f} rows/s)")
+    if result['inserted'] and args.role in ('faculty', 'company'):
+        print("Open dashboards list the new rows within 5 minutes, when their reference cache expires")
+    if result['failed']:
+        print(f"{len(result['failed'])} rows failed:")
+        for line_no, email, reason in result['failed'][:20]:
+            print(f"  line {line_no} ({email}): {reason}")
+        if len(result['failed']) > 20:
+            print(f"  ... and {len(result['failed']) - 20} more")
+        if args.errors:
+            with open(args.errors, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(['line', 'email', 'reason'])
+                writer.writerows(result['failed'])
+            print(f"Failures written to {args.errors}")
+
+
+if __name__ == "__main__":
+    main()
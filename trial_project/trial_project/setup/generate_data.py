@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Fill the database with synthetic load data: skewed application counts per
+company, deadlines clustered around intake dates and per-department quotas.
+
+The same --seed and --anchor on an empty database produce the same rows.
+Every account's password is the SYNTHETIC_PASSWORD in models/synthetic_data.py.
+
+Usage: python setup/generate_data.py [--preset small|medium|large|xlarge] [--seed 1]
+           [--anchor 2025-01-15] [--applications N ...] [--database NAME]
+"""
+
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.config.db_config import DB_CONFIG
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.synthetic_data import SyntheticDataGenerator, PRESETS, BATCH_SIZE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic load data")
+    parser.add_argument('--preset', choices=list(PRESETS), default='small')
+    for table in PRESETS['small']:
+        parser.add_argument(f'--{table}', type=int, help=f"override the preset's {table} count")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--anchor', type=date.fromisoformat, help="date the data is relative to (default today)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--database', default=DB_CONFIG['database'])
+    args = parser.parse_args()
+
+    volumes = {table: getattr(args, table) if getattr(args, table) is not None else count
+               for table, count in PRESETS[args.preset].items()}
+    model = DatabaseModel(db_config={**DB_CONFIG, 'database': args.database})
+    try:
+        generator = SyntheticDataGenerator(model, volumes, args.seed, args.batch_size, args.anchor)
+        result = generator.generate(
+            on_progress=lambda table, rows: print(f"\r{table}: {rows}".ljust(40), end='')
+        )
+    finally:
+        model.close_connection()
+
+    total = sum(result['rows'].values())
+    print(f"\nWrote {total} rows in {result['seconds']:.1f}s ({total / result['seconds']:.0f} rows/s)")
+    for table, rows in result['rows'].items():
+        print(f"  {table:<20}{rows:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Rebuild the quota search index from every quota's description and company.
+
+New quotas are indexed as they are created; run this after upgrading to
+schema version 8, or after loading quotas directly (setup/generate_data.py).
+
+Usage: python setup/index_quotas.py [--backend mysql|sqlite] [--batch 1000]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.config.db_config import DB_BACKEND
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index quotas for search")
+    parser.add_argument('--backend', choices=BACKENDS, default=DB_BACKEND)
+    parser.add_argument('--batch', type=int, default=1000, help="quotas indexed per transaction")
+    args = parser.parse_args()
+
+    model = DatabaseModel(backend_name=args.backend)
+    started = time.perf_counter()
+    last = 0
+    try:
+        while True:
+            indexed = model.index_quota_terms(last, args.batch)
+            if indexed is None:
+                break
+            last = indexed
+            print(f"\rIndexed quotas up to #{last}".ljust(40), end='')
+    finally:
+        model.close_connection()
+
+    print(f"\nIndexed quotas up to #{last} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
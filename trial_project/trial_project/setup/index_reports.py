@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Extract and index the text of every stored report that is not indexed yet.
+
+The app indexes each report as it is uploaded; run this after upgrading to
+schema version 6, or to pick up files whose indexing was interrupted.
+
+Usage: python setup/index_reports.py [--backend mysql|sqlite] [--workers 4] [--batch 1000]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.config.db_config import DB_BACKEND
+from trial_project.config.storage_config import REPORT_INDEX_WORKERS
+from trial_project.models.backend import BACKENDS
+from trial_project.models.database_model import DatabaseModel
+from trial_project.models.report_indexer import ReportIndexer
+from trial_project.models.report_store import ReportStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index the text of stored reports")
+    parser.add_argument('--backend', choices=BACKENDS, default=DB_BACKEND)
+    parser.add_argument('--workers', type=int, default=REPORT_INDEX_WORKERS)
+    parser.add_argument('--batch', type=int, default=1000, help="files queued per round")
+    args = parser.parse_args()
+
+    model = DatabaseModel(backend_name=args.backend)
+    indexer = ReportIndexer(model, ReportStore(), workers=args.workers)
+    started = time.perf_counter()
+    total = 0
+    previous = set()
+    try:
+        while True:
+            pending = model.get_unindexed_report_files(args.batch)
+            batch = {report['sha256'] for report in pending}
+            # Files a worker crashed on stay unindexed; stop rather than retry them forever
+            if not batch or batch <= previous:
+                break
+            for report in pending:
+                indexer.submit(report['sha256'], report['mime_type'])
+            indexer.wait()
+            previous = batch
+            total += len(batch)
+            print(f"\rIndexed {total} reports".ljust(40), end='')
+    finally:
+        indexer.shutdown()
+        model.close_connection()
+
+    seconds = time.perf_counter() - started
+    print(f"\nIndexed {total} reports in {seconds:.1f}s ({total / seconds if seconds else 0:.1f} files/s)")
+
+
+if __name__ == "__main__":
+    main()
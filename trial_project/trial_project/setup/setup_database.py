@@ -1,24 +1,67 @@
-import mysql.connector
-from mysql.connector import Error
+#!/usr/bin/env python3
+"""
+Create the database if it does not exist and apply pending schema migrations.
 
+Run this after installing or upgrading. The app then only confirms the schema
+is current while its login window is up, or skips even that with
+main.py --skip-schema-check.
+
+Usage: python setup/setup_database.py [--backend mysql|sqlite] [--database NAME]
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add the project root to Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from trial_project.config.db_config import DB_BACKEND
+from trial_project.models import backend
+from trial_project.models.backend import BACKENDS, default_config, migration_runner
 from trial_project.models.database_model import DatabaseModel
 
-def setup_database():
-    """Setup database and create initial admin user"""
+
+def create_database(db_config: dict):
+    """Create the MySQL database named in db_config if it does not exist"""
+    import mysql.connector
+    server_config = {k: v for k, v in db_config.items() if k != 'database'}
+    connection = mysql.connector.connect(**server_config)
     try:
-        connection = mysql.connector.connect(
-            host='localhost',
-            user='root',
-            password='password'
-        )
-        cursor = connection.cursor()
-        
-        
-        cursor.execute("CREATE DATABASE IF NOT EXISTS internship_system")
-        cursor.execute("USE internship_system")
-        
-        #print("Database created successfully")
-
-    except Error as e:
+        connection.cursor().execute(f"CREATE DATABASE IF NOT EXISTS `{db_config['database']}`")
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create the database and apply schema migrations")
+    parser.add_argument('--backend', choices=BACKENDS, default=DB_BACKEND)
+    parser.add_argument('--database', help="database name, or file path for sqlite (default from config)")
+    args = parser.parse_args()
+
+    db_config = dict(default_config(args.backend))
+    if args.database:
+        db_config['database'] = args.database
+
+    model = DatabaseModel(db_config=db_config, backend_name=args.backend, connect=False)
+    try:
+        # SQLite creates its file on first connect
+        if args.backend == 'mysql':
+            create_database(db_config)
+        model.start(check_schema=False)
+        applied = migration_runner(args.backend, model.pool).migrate()
+    except backend.Error as e:
         print(f"Database setup error: {e}")
-       
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        model.close_connection()
+
+    if applied:
+        print(f"Applied schema versions {', '.join(map(str, applied))} to {db_config['database']}")
+    else:
+        print(f"Schema of {db_config['database']} is already current")
+
+
+if __name__ == "__main__":
+    main()
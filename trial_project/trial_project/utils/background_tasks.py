@@ -0,0 +1,108 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class BackgroundTaskRunner:
+    """Runs controller calls off the Tk main loop and hands results back to it"""
+
+    # Tk widgets may only be touched from the main thread, so workers put their
+    # results on a queue that the main loop drains with root.after(). Requests
+    # are keyed (usually by tab); a new request for a key supersedes the
+    # previous one, whose result is then dropped.
+
+    def __init__(self, root, max_workers: int = 4, poll_interval_ms: int = 30):
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._futures = {}
+        self._closed = False
+        self.root.after(self.poll_interval_ms, self._drain)
+
+    def submit(self, key: str, func: Callable, *args,
+               on_success: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, **kwargs):
+        """Run func(*args, **kwargs) on a worker, cancelling any pending request for key"""
+        if self._closed:
+            return None
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            previous = self._futures.get(key)
+            if previous:
+                # Only stops requests that have not started; running ones finish
+                # but their stale result is discarded in _drain
+                previous.cancel()
+
+            future = self._executor.submit(self._run, key, generation, func, args, kwargs,
+                                           on_success, on_error)
+            self._futures[key] = future
+        return future
+
+    def cancel(self, key: str):
+        """Drop the result of any in-flight request for key"""
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            future = self._futures.pop(key, None)
+        if future:
+            future.cancel()
+
+    def is_busy(self, key: str) -> bool:
+        future = self._futures.get(key)
+        return bool(future and not future.done())
+
+    def pending(self) -> int:
+        """Number of requests whose results have not been delivered yet"""
+        with self._lock:
+            return len(self._futures)
+
+    def _run(self, key, generation, func, args, kwargs, on_success, on_error):
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            self._results.put((key, generation, on_error, e, True))
+        else:
+            self._results.put((key, generation, on_success, result, False))
+
+    def _drain(self):
+        """Deliver finished results on the main thread"""
+        if self._closed:
+            return
+        while True:
+            try:
+                key, generation, callback, value, failed = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                current = self._generations.get(key) == generation
+                if current:
+                    self._futures.pop(key, None)
+            if not current:
+                continue
+
+            if failed and callback is None:
+                print(f"Background task '{key}' failed: {value}")
+            elif callback:
+                try:
+                    callback(value)
+                except Exception as e:
+                    print(f"Error handling result of '{key}': {e}")
+        try:
+            self.root.after(self.poll_interval_ms, self._drain)
+        except Exception:
+            # Window already destroyed
+            self._closed = True
+
+    def shutdown(self):
+        """Stop delivering results and release the worker threads"""
+        self._closed = True
+        with self._lock:
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+        self._executor.shutdown(wait=False)
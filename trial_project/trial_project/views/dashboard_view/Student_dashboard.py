@@ -3,7 +3,18 @@ from tkinter import ttk, messagebox, filedialog
 from datetime import datetime
 import os
 
+from trial_project.utils.background_tasks import BackgroundTaskRunner
+from trial_project.views.widgets.lazy_notebook import LazyNotebook
+from trial_project.views.widgets.paged_treeview import PagedTreeview
+from trial_project.views.widgets.quota_facets import QuotaFacetPanel, quota_matches
+
+# Quota search waits for a pause in typing
+QUOTA_SEARCH_DELAY_MS = 250
+
 class StudentDashboard:
+    # Tabs are built, and their data fetched, when first selected
+    lazy_tabs = True
+    
     def __init__(self, controller, user):
         self.controller = controller
         self.user = user
@@ -16,8 +27,10 @@ class StudentDashboard:
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
+        # Database calls run on worker threads so slow queries never freeze the window
+        self.tasks = BackgroundTaskRunner(self.root)
+        
         self.setup_ui()
-        self.load_dashboard_data()
     
     def setup_ui(self):
         """Setup the main UI components"""
@@ -37,11 +50,11 @@ class StudentDashboard:
         # Sidebar
         self.create_sidebar(main_frame)
         
+        # Footer first: tab builders report progress in its status label
+        self.create_footer(main_frame)
+        
         # Content area
         self.create_content_area(main_frame)
-        
-        # Footer
-        self.create_footer(main_frame)
     
     def create_header(self, parent):
         """Create header with user info and logout"""
@@ -103,16 +116,15 @@ class StudentDashboard:
         self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
         
         # Create tabs
-        self.create_profile_tab()
-        self.create_applications_tab()
-        self.create_quotas_tab()
-        self.create_apply_tab()
-        self.create_reports_tab()
+        self.tabs = LazyNotebook(self.notebook, lazy=self.lazy_tabs)
+        self.tabs.add("Profile", self.create_profile_tab)
+        self.tabs.add("My Applications", self.create_applications_tab)
+        self.tabs.add("Available Quotas", self.create_quotas_tab)
+        self.tabs.add("Apply for Internship", self.create_apply_tab)
+        self.tabs.add("Reports", self.create_reports_tab)
     
-    def create_profile_tab(self):
+    def create_profile_tab(self, profile_frame):
         """Create profile information tab"""
-        profile_frame = ttk.Frame(self.notebook)
-        self.notebook.add(profile_frame, text="Profile")
         
         # Create scrollable frame
         canvas = tk.Canvas(profile_frame)
@@ -164,10 +176,8 @@ class StudentDashboard:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def create_applications_tab(self):
+    def create_applications_tab(self, app_frame):
         """Create applications tab"""
-        app_frame = ttk.Frame(self.notebook)
-        self.notebook.add(app_frame, text="My Applications")
         
         # Header
         header_frame = ttk.Frame(app_frame)
@@ -205,18 +215,29 @@ class StudentDashboard:
         
         # Add scrollbar
         app_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.app_tree.yview)
-        self.app_tree.configure(yscrollcommand=app_scrollbar.set)
+        
+        # Rows are fetched a page at a time as the user scrolls
+        self.app_pager = PagedTreeview(self.app_tree, self.tasks, 'applications',
+                                       row_id=lambda app: app['app_id'],
+                                       row_values=self.application_row_values,
+                                       scrollbar=app_scrollbar,
+                                       on_loaded=lambda count, more: self.show_loaded_count(count, more, "applications"),
+                                       on_error=lambda e: self.show_load_error("applications", e))
+        # Status changes made by the secretary show up without a manual refresh
+        self.app_pager.watch(
+            lambda since: self.controller.get_student_application_changes(self.controller.get_user_id(), since),
+            matches=lambda app: True)
         
         self.app_tree.pack(side="left", fill="both", expand=True)
         app_scrollbar.pack(side="right", fill="y")
         
         # Context menu for applications
         self.app_tree.bind("<Button-3>", self.show_application_context_menu)
+        
+        self.refresh_applications()
     
-    def create_quotas_tab(self):
+    def create_quotas_tab(self, quota_frame):
         """Create available quotas tab"""
-        quota_frame = ttk.Frame(self.notebook)
-        self.notebook.add(quota_frame, text="Available Quotas")
         
         # Header
         header_frame = ttk.Frame(quota_frame)
@@ -228,18 +249,18 @@ class StudentDashboard:
         ttk.Button(header_frame, text="Refresh", 
                   command=self.refresh_quotas).pack(side=tk.RIGHT)
         
-        # Filter frame
+        # Facet filters; each option shows how many quotas it leaves
+        self.quota_facets = QuotaFacetPanel(quota_frame, on_change=self.refresh_quotas)
+        self.quota_facets.pack(fill=tk.X, padx=10, pady=(0, 5))
+        
+        # Search as you type, ranked by relevance
         filter_frame = ttk.Frame(quota_frame)
         filter_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
-        
-        ttk.Label(filter_frame, text="Filter by Department:").pack(side=tk.LEFT, padx=(0, 10))
-        
-        self.dept_filter_var = tk.StringVar(value="All")
-        dept_values = ["All"] + self.controller.get_department_names()
-        dept_combo = ttk.Combobox(filter_frame, textvariable=self.dept_filter_var,
-                                 values=dept_values, state="readonly", width=20)
-        dept_combo.pack(side=tk.LEFT, padx=(0, 10))
-        dept_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_quotas())
+        ttk.Label(filter_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 10))
+        self.quota_search_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.quota_search_var, width=30).pack(side=tk.LEFT)
+        self.quota_search_job = None
+        self.quota_search_var.trace_add("write", lambda *args: self.schedule_quota_search())
         
         # Quotas treeview
         quota_tree_frame = ttk.Frame(quota_frame)
@@ -264,18 +285,27 @@ class StudentDashboard:
         
         # Add scrollbar
         quota_scrollbar = ttk.Scrollbar(quota_tree_frame, orient="vertical", command=self.quota_tree.yview)
-        self.quota_tree.configure(yscrollcommand=quota_scrollbar.set)
+        
+        self.quota_pager = PagedTreeview(self.quota_tree, self.tasks, 'quotas',
+                                         row_id=lambda quota: quota['quota_id'],
+                                         row_values=self.quota_row_values,
+                                         scrollbar=quota_scrollbar,
+                                         on_loaded=lambda count, more: self.show_loaded_count(count, more, "available quotas"),
+                                         on_error=lambda e: self.show_load_error("quotas", e),
+                                         on_extra=self.quota_facets.update_counts)
+        self.quota_filters = {}
+        self.quota_pager.watch(self.fetch_quota_changes, matches=self.quota_is_open)
         
         self.quota_tree.pack(side="left", fill="both", expand=True)
         quota_scrollbar.pack(side="right", fill="y")
         
         # Double-click to apply
         self.quota_tree.bind("<Double-1>", self.apply_to_quota)
+        
+        self.refresh_quotas()
     
-    def create_apply_tab(self):
+    def create_apply_tab(self, apply_frame):
         """Create application form tab"""
-        apply_frame = ttk.Frame(self.notebook)
-        self.notebook.add(apply_frame, text="Apply for Internship")
         
         # Create scrollable frame
         canvas = tk.Canvas(apply_frame)
@@ -340,10 +370,8 @@ class StudentDashboard:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def create_reports_tab(self):
+    def create_reports_tab(self, reports_frame):
         """Create reports tab"""
-        reports_frame = ttk.Frame(self.notebook)
-        self.notebook.add(reports_frame, text="Reports")
         
         ttk.Label(reports_frame, text="Internship Reports", 
                  font=("Arial", 14, "bold")).pack(pady=20)
@@ -374,15 +402,18 @@ class StudentDashboard:
         self.root.after(1000, self.update_time)  # Update every second
     
     def load_dashboard_data(self):
-        """Load initial dashboard data"""
+        """Reload the data of the tabs built so far"""
         self.refresh_applications()
         self.refresh_quotas()
     
     def load_student_statistics(self, parent):
         """Load and display student statistics"""
         student_id = self.controller.get_user_id()
-        applications = self.controller.get_student_applications(student_id)
-        
+        self.tasks.submit('statistics', self.controller.get_student_applications, student_id,
+                          on_success=lambda applications: self.show_student_statistics(parent, applications))
+    
+    def show_student_statistics(self, parent, applications):
+        """Display statistics computed from the student's applications"""
         # Calculate statistics
         total_apps = len(applications)
         pending_apps = len([app for app in applications if app.get('status') == 'pending'])
@@ -406,56 +437,103 @@ class StudentDashboard:
     
     def refresh_applications(self):
         """Refresh applications list"""
-        # Clear existing items
-        for item in self.app_tree.get_children():
-            self.app_tree.delete(item)
-        
-        # Load applications
+        # An unopened tab loads fresh data when it is first shown
+        if not self.tabs.is_built("My Applications"):
+            return
         student_id = self.controller.get_user_id()
-        applications = self.controller.get_student_applications(student_id)
-        
-        for app in applications:
-            app_type = "Self-Found" if app.get('self_found') else "Quota-Based"
-            app_date = app.get('application_date', '')
-            if app_date:
-                app_date = str(app_date).split()[0]  # Get date part only
-            
-            self.app_tree.insert("", tk.END, values=(
-                app.get('app_id', ''),
-                app.get('company_name', ''),
-                app.get('department', ''),
-                app.get('status', '').title(),
-                app_date,
-                app_type
-            ))
-        
-        self.status_label.config(text=f"Loaded {len(applications)} applications")
+        self.status_label.config(text="Loading applications...")
+        self.app_pager.load(
+            lambda after, limit: self.controller.get_student_applications_page(student_id, after, limit),
+            query=('applications', student_id))
+    
+    def application_row_values(self, app):
+        """Treeview values for one application"""
+        app_type = "Self-Found" if app.get('self_found') else "Quota-Based"
+        app_date = app.get('application_date', '')
+        if app_date:
+            app_date = str(app_date).split()[0]  # Get date part only
+        
+        return (
+            app.get('app_id', ''),
+            app.get('company_name', ''),
+            app.get('department', ''),
+            app.get('status', '').title(),
+            app_date,
+            app_type
+        )
     
     def refresh_quotas(self):
         """Refresh available quotas"""
-        # Clear existing items
-        for item in self.quota_tree.get_children():
-            self.quota_tree.delete(item)
-        
-        # Get department filter
-        dept_filter = self.dept_filter_var.get()
-        department = None if dept_filter == "All" else dept_filter
-        
-        # Load quotas
-        quotas = self.controller.get_available_quotas(department)
-        
-        for quota in quotas:
-            self.quota_tree.insert("", tk.END, values=(
-                quota.get('quota_id', ''),
-                quota.get('company_name', ''),
-                quota.get('department', ''),
-                quota.get('total_slots', ''),
-                quota.get('available_slots', ''),
-                quota.get('deadline', ''),
-                quota.get('description', '')[:50] + "..." if len(quota.get('description', '')) > 50 else quota.get('description', '')
-            ))
-        
-        self.status_label.config(text=f"Loaded {len(quotas)} available quotas")
+        if not self.tabs.is_built("Available Quotas"):
+            return
+        filters = self.quota_facets.filters()
+        self.quota_filters = filters
+        keywords = self.quota_search_var.get().strip()
+        
+        # A newer filter selection cancels a load still in flight
+        self.status_label.config(text="Loading quotas...")
+        # Until a word of two letters or digits is typed, the list stays unfiltered
+        if self.controller.has_search_terms(keywords):
+            # Ranked results come back as a single page
+            self.quota_pager.load(
+                lambda after, limit: (self.controller.search_quotas(keywords, filters, limit), None),
+                query=('quotas', tuple(sorted(filters.items())), keywords))
+        else:
+            self.quota_pager.load(
+                lambda after, limit: self.fetch_quota_page(filters, after, limit),
+                query=('quotas', tuple(sorted(filters.items()))))
+    
+    def fetch_quota_page(self, filters, after, limit):
+        """One page of quotas under the facet filters, plus the facet counts with the first page"""
+        # Runs on a worker thread; the pager hands the counts to the facet panel
+        page = self.controller.browse_quotas(filters, after, limit)
+        return page['rows'], page['next'], page.get('facets')
+    
+    def schedule_quota_search(self):
+        """Search once typing pauses rather than on every keystroke"""
+        if self.quota_search_job is not None:
+            self.root.after_cancel(self.quota_search_job)
+        self.quota_search_job = self.root.after(QUOTA_SEARCH_DELAY_MS, self.run_quota_search)
+    
+    def run_quota_search(self):
+        self.quota_search_job = None
+        self.refresh_quotas()
+    
+    def fetch_quota_changes(self, since):
+        """Change-feed poll for the quota list under the current department filter"""
+        # Runs on a worker thread, so it reads the filters saved by refresh_quotas
+        # rather than the facet panel
+        return self.controller.get_quota_changes(self.quota_filters.get('department'), since)
+    
+    def quota_is_open(self, quota):
+        """Whether a changed quota still belongs in the available list"""
+        # Like the list query, a quota without a deadline is not open
+        return (quota['available_slots'] > 0
+                and quota['deadline'] is not None and quota['deadline'] >= datetime.now().date()
+                and quota_matches(quota, self.quota_filters))
+    
+    def quota_row_values(self, quota):
+        """Treeview values for one quota"""
+        description = quota.get('description') or ''
+        return (
+            quota.get('quota_id', ''),
+            quota.get('company_name', ''),
+            quota.get('department', ''),
+            quota.get('total_slots', ''),
+            quota.get('available_slots', ''),
+            quota.get('deadline', ''),
+            description[:50] + "..." if len(description) > 50 else description
+        )
+    
+    def show_loaded_count(self, count, has_more, what):
+        """Show how many rows of a paged list are loaded"""
+        more = " (scroll for more)" if has_more else ""
+        self.status_label.config(text=f"Loaded {count} {what}{more}")
+    
+    def show_load_error(self, what, error):
+        """Report a failed background load in the status bar"""
+        print(f"Error loading {what}: {error}")
+        self.status_label.config(text=f"Failed to load {what}")
     
     def toggle_application_type(self):
         """Toggle between quota-based and self-found application"""
@@ -470,13 +548,21 @@ class StudentDashboard:
         """Load data for application form"""
         # Load quotas
         student_dept = self.controller.get_user_department()
-        quotas = self.controller.get_available_quotas(student_dept)
+        self.tasks.submit('apply_quotas', self.controller.get_available_quotas, student_dept,
+                          on_success=self.set_quota_options)
+        
+        # Load companies
+        self.tasks.submit('apply_companies', self.controller.get_all_companies,
+                          on_success=self.set_company_options)
+    
+    def set_quota_options(self, quotas):
+        """Fill the quota dropdown of the application form"""
         quota_options = [f"{quota['quota_id']} - {quota['company_name']} ({quota['available_slots']} slots)" 
                         for quota in quotas]
         self.quota_combo['values'] = quota_options
-        
-        # Load companies
-        companies = self.controller.get_all_companies()
+    
+    def set_company_options(self, companies):
+        """Fill the company dropdown of the application form"""
         company_options = [f"{company['company_id']} - {company['name']}" 
                           for company in companies]
         self.company_combo['values'] = company_options
@@ -494,14 +580,7 @@ class StudentDashboard:
                     return
                 
                 quota_id = int(quota_selection.split(" - ")[0])
-                company_id = None  # Will be determined by quota
-                
-                # Get quota details to find company
-                quota_details = self.controller.get_quota_details(quota_id)
-                if quota_details:
-                    company_id = quota_details['company_id']
-                
-                success = self.controller.create_application(student_id, company_id, quota_id, False)
+                task = lambda: self.create_quota_application(student_id, quota_id)
                 
             else:
                 # Self-found application
@@ -511,23 +590,42 @@ class StudentDashboard:
                     return
                 
                 company_id = int(company_selection.split(" - ")[0])
-                success = self.controller.create_application(student_id, company_id, None, True)
+                task = lambda: self.controller.create_application(student_id, company_id, None, True)
             
-            if success:
-                messagebox.showinfo("Success", "Application submitted successfully!")
-                self.refresh_applications()
-                self.load_application_data()  # Refresh available quotas
-                # Clear form
-                self.quota_var.set("")
-                self.company_var.set("")
-            else:
-                messagebox.showerror("Error", "Failed to submit application")
+            self.status_label.config(text="Submitting application...")
+            self.tasks.submit('submit_application', task,
+                              on_success=self.on_application_submitted,
+                              on_error=self.on_application_error)
                 
         except ValueError:
             messagebox.showerror("Error", "Invalid selection")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
     
+    def create_quota_application(self, student_id, quota_id):
+        """Look up the quota's company and apply to it (runs on a worker thread)"""
+        # Get quota details to find company
+        quota_details = self.controller.get_quota_details(quota_id)
+        company_id = quota_details['company_id'] if quota_details else None
+        return self.controller.create_application(student_id, company_id, quota_id, False)
+    
+    def on_application_submitted(self, success):
+        """Handle the result of an application submitted from the form"""
+        if success:
+            messagebox.showinfo("Success", "Application submitted successfully!")
+            self.refresh_applications()
+            self.load_application_data()  # Refresh available quotas
+            # Clear form
+            self.quota_var.set("")
+            self.company_var.set("")
+        else:
+            self.status_label.config(text="Ready")
+            messagebox.showerror("Error", "Failed to submit application")
+    
+    def on_application_error(self, error):
+        self.status_label.config(text="Ready")
+        messagebox.showerror("Error", f"An error occurred: {str(error)}")
+    
     def apply_to_quota(self, event):
         """Apply to selected quota via double-click"""
         selection = self.quota_tree.selection()
@@ -547,26 +645,21 @@ class StudentDashboard:
                                    f"Apply to {company_name}?\n\nThis will submit your application.")
         
         if result:
-            try:
-                student_id = self.controller.get_user_id()
-                
-                # Get quota details to find company
-                quota_details = self.controller.get_quota_details(quota_id)
-                if quota_details:
-                    company_id = quota_details['company_id']
-                    success = self.controller.create_application(student_id, company_id, quota_id, False)
-                    
-                    if success:
-                        messagebox.showinfo("Success", "Application submitted successfully!")
-                        self.refresh_applications()
-                        self.refresh_quotas()
-                    else:
-                        messagebox.showerror("Error", "Failed to submit application")
-                else:
-                    messagebox.showerror("Error", "Could not find quota details")
-                    
-            except Exception as e:
-                messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            student_id = self.controller.get_user_id()
+            self.status_label.config(text="Submitting application...")
+            self.tasks.submit('apply_to_quota', self.create_quota_application, student_id, quota_id,
+                              on_success=self.on_quota_application_submitted,
+                              on_error=self.on_application_error)
+    
+    def on_quota_application_submitted(self, success):
+        """Handle the result of a double-click application"""
+        if success:
+            messagebox.showinfo("Success", "Application submitted successfully!")
+            self.refresh_applications()
+            self.refresh_quotas()
+        else:
+            self.status_label.config(text="Ready")
+            messagebox.showerror("Error", "Failed to submit application")
     
     def show_application_context_menu(self, event):
         """Show context menu for application"""
@@ -601,6 +694,7 @@ class StudentDashboard:
         """Handle logout"""
         result = messagebox.askyesno("Logout", "Are you sure you want to logout?")
         if result:
+            self.tasks.shutdown()
             self.controller.logout()
     
     def run(self):
@@ -2,14 +2,21 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Optional, List, Dict, Any
 import csv 
+import os
+from datetime import date
 from tkinter import filedialog, messagebox
 
-from trial_project.views.dialogs.application_dialog import ApplicationDialog
-from trial_project.views.dialogs.self_found_dialog import SelfFoundDialog
+from trial_project.utils.background_tasks import BackgroundTaskRunner
+from trial_project.views.widgets.lazy_notebook import LazyNotebook
+from trial_project.views.widgets.paged_treeview import PagedTreeview
+from trial_project.views.widgets.quota_facets import QuotaFacetPanel, quota_matches
 
 class DashboardView:
     """Main Dashboard Interface"""
     
+    # Tabs are built, and their data fetched, when first selected
+    lazy_tabs = True
+    
     def __init__(self, controller, user):
         self.controller = controller
         self.user = user
@@ -17,6 +24,9 @@ class DashboardView:
         self.root.title(f"Dashboard - {user['name']} ({user['role'].title()})")
         self.root.geometry("1000x700")
         
+        # Database calls run on worker threads so slow queries never freeze the window
+        self.tasks = BackgroundTaskRunner(self.root)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -39,6 +49,7 @@ class DashboardView:
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill=tk.BOTH, expand=True)
+        self.tabs = LazyNotebook(self.notebook, lazy=self.lazy_tabs)
         
         # Role-specific tabs
         if self.user['role'] == 'student':
@@ -54,81 +65,46 @@ class DashboardView:
     
     def setup_student_tabs(self):
         """Setup tabs for student role"""
-        # Applications tab
-        app_frame = ttk.Frame(self.notebook)
-        self.notebook.add(app_frame, text="My Applications")
-        self.setup_applications_tab(app_frame)
-        
-        # Available Quotas tab
-        quota_frame = ttk.Frame(self.notebook)
-        self.notebook.add(quota_frame, text="Available Quotas")
-        self.setup_quotas_tab(quota_frame)
-        
-        # Reports tab
-        report_frame = ttk.Frame(self.notebook)
-        self.notebook.add(report_frame, text="Reports")
-        self.setup_reports_tab(report_frame)
+        self.tabs.add("My Applications", self.setup_applications_tab)
+        self.tabs.add("Available Quotas", self.setup_quotas_tab)
+        self.tabs.add("Reports", self.setup_reports_tab)
     
     def setup_faculty_tabs(self):
         """Setup tabs for faculty role"""
-        # Students tab
-        students_frame = ttk.Frame(self.notebook)
-        self.notebook.add(students_frame, text="My Students")
-        self.setup_my_students_tab(students_frame)
-        
-        # Evaluations tab
-        eval_frame = ttk.Frame(self.notebook)
-        self.notebook.add(eval_frame, text="Evaluations")
-        self.setup_evaluations_tab(eval_frame)
+        self.tabs.add("My Students", self.setup_my_students_tab)
+        self.tabs.add("Evaluations", self.setup_evaluations_tab)
     
     def setup_secretary_tabs(self):
         """Setup tabs for admin role"""
-        # View All Faculty Tab
-        all_faculty_frame = ttk.Frame(self.notebook)
-        self.notebook.add(all_faculty_frame, text="View Faculty List")
-        self.setup_view_faculty_tab(all_faculty_frame)
-
-        # Pending Applications tab
-        pending_frame = ttk.Frame(self.notebook)
-        self.notebook.add(pending_frame, text="Pending Applications")
-        self.setup_pending_applications_tab(pending_frame)
-        
-        # Faculty Assignment tab
-        faculty_frame = ttk.Frame(self.notebook)
-        self.notebook.add(faculty_frame, text="Faculty Assignment")
-        self.setup_faculty_assignment_tab(faculty_frame)
-        
-        # Reports tab
-        reports_frame = ttk.Frame(self.notebook)
-        self.notebook.add(reports_frame, text="System Reports")
+        self.tabs.add("View Faculty List", self.setup_view_faculty_tab)
+        self.tabs.add("Pending Applications", self.setup_pending_applications_tab)
+        self.tabs.add("Faculty Assignment", self.setup_faculty_assignment_tab)
+        self.tabs.add("System Reports")
     
     def setup_company_tabs(self):
         """Setup tabs for company role"""
-        # Company Profile tab
-        profile_frame = ttk.Frame(self.notebook)
-        self.notebook.add(profile_frame, text="Company Profile")
-        
-        # Quota Management tab
-        quota_frame = ttk.Frame(self.notebook)
-        self.notebook.add(quota_frame, text="Manage Quotas")
-        self.setup_company_quota_tab(quota_frame)
+        self.tabs.add("Company Profile")
+        self.tabs.add("Manage Quotas", self.setup_company_quota_tab)
     
     def setup_admin_tabs(self):
         """Setup tabs for admin role"""
-        # View All Faculty Tab
-        all_faculty_frame = ttk.Frame(self.notebook)
-        self.notebook.add(all_faculty_frame, text="View Faculty List")
-        self.setup_view_faculty_tab(all_faculty_frame)
+        self.tabs.add("View Faculty List", self.setup_view_faculty_tab)
+        self.tabs.add("View Secretary List", self.setup_view_secretary_tab)
+        self.tabs.add("View Company List", self.setup_view_company_tab)
+
+    def run_action(self, key, buttons, func, *args, on_success, on_error):
+        """Run a controller write on a worker, keeping buttons disabled until its result arrives"""
+        for button in buttons:
+            button.config(state="disabled")
 
-        # View All Secretary Tab
-        all_secretary_frame = ttk.Frame(self.notebook)
-        self.notebook.add(all_secretary_frame, text="View Secretary List")
-        self.setup_view_secretary_tab(all_secretary_frame)
+        def finish(callback, value):
+            for button in buttons:
+                button.config(state="normal")
+            callback(value)
 
-        # View All Company Tab
-        all_company_frame = ttk.Frame(self.notebook)
-        self.notebook.add(all_company_frame, text="View Company List")
-        self.setup_view_company_tab(all_company_frame)
+        self.tasks.submit(key, func, *args,
+                          on_success=lambda result: finish(on_success, result),
+                          on_error=lambda error: finish(on_error, error))
 
     # RELATED TO FACULTY TAB
     def setup_my_students_tab(self, parent):
@@ -139,20 +115,41 @@ class DashboardView:
             self.my_students_tree.heading(col, text=col)
             self.my_students_tree.column(col, width=120)
         self.my_students_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.my_students_pager = PagedTreeview(
+            self.my_students_tree, self.tasks, 'my_students',
+            row_id=lambda s: s['student_id'],
+            row_values=lambda s: (s['student_id'], s['name'], s['email'], s['cgpa'], s['department']))
+        faculty_id = self.user['user_id']
+        self.my_students_pager.watch(
+            lambda since: self.controller.get_faculty_assignment_changes(faculty_id, since))
         self.refresh_my_students()
     
     def refresh_my_students(self):
-        students = self.controller.get_students_under_faculty(self.user['user_id'])
-        for row in self.my_students_tree.get_children():
-            self.my_students_tree.delete(row)
-        for s in students:
-            self.my_students_tree.insert("", "end", values=(s['student_id'], s['name'], s['email'], s['cgpa'], s['department']))
+        faculty_id = self.user['user_id']
+        self.my_students_pager.load(
+            lambda after, limit: self.controller.get_students_under_faculty_page(faculty_id, after, limit),
+            query=('students', faculty_id))
 
     def setup_evaluations_tab(self, parent):
         ttk.Label(parent, text="Evaluate Submitted Reports", font=("Arial", 14)).pack(
             pady=10
         )
 
+        # Keyword search over the extracted report text
+
+        search_frame = ttk.Frame(parent)
+        search_frame.pack(fill=tk.X, padx=10)
+
+        ttk.Label(search_frame, text="Report contains:").pack(side=tk.LEFT)
+        self.report_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.report_search_var, width=40)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", lambda e: self.refresh_faculty_reports())
+        ttk.Button(search_frame, text="Search", command=self.refresh_faculty_reports).pack(side=tk.LEFT)
+        ttk.Button(search_frame, text="Clear", command=self.clear_report_search).pack(side=tk.LEFT, padx=5)
+        self.similar_button = ttk.Button(search_frame, text="Find Similar", command=self.find_similar_reports)
+        self.similar_button.pack(side=tk.RIGHT)
+
         # Frame for Treeview
 
         tree_frame = ttk.Frame(parent)
@@ -170,8 +167,13 @@ class DashboardView:
         scrollbar = ttk.Scrollbar(
             tree_frame, orient=tk.VERTICAL, command=self.report_tree.yview
         )
-        self.report_tree.configure(yscrollcommand=scrollbar.set)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.report_pager = PagedTreeview(
+            self.report_tree, self.tasks, "faculty_reports",
+            row_id=lambda report: report["report_id"],
+            row_values=self.report_row_values,
+            scrollbar=scrollbar,
+        )
 
         # Load report data
 
@@ -195,32 +197,59 @@ class DashboardView:
         self.comments_text = tk.Text(form_frame, width=50, height=4)
         self.comments_text.grid(row=1, column=1, padx=5, pady=5)
 
-        submit_btn = ttk.Button(
+        self.evaluation_button = ttk.Button(
             form_frame, text="Submit Evaluation", command=self.submit_evaluation
         )
-        submit_btn.grid(row=2, column=0, columnspan=2, pady=10)
+        self.evaluation_button.grid(row=2, column=0, columnspan=2, pady=10)
 
     def refresh_faculty_reports(self):
-        """Load reports submitted to this faculty"""
+        """Load reports submitted to this faculty, only those matching the search keywords if any"""
         faculty_id = self.user["user_id"]
-        reports = self.controller.get_reports_for_faculty(faculty_id)
-
-        # Clear existing
-
-        for item in self.report_tree.get_children():
-            self.report_tree.delete(item)
-        for report in reports:
-            self.report_tree.insert(
-                "",
-                "end",
-                values=(
-                    report["report_id"],
-                    report["student_name"],
-                    report["submitted_at"].strftime("%Y-%m-%d"),
-                    report["grade"] or "Not Graded",
-                    (report["comments"][:30] + "...") if report["comments"] else "",
-                ),
-            )
+        keywords = self.report_search_var.get().strip()
+        self.report_pager.load(
+            lambda after, limit: self.controller.get_reports_for_faculty_page(faculty_id, after, limit, keywords),
+            query=('reports', faculty_id, keywords)
+        )
+
+    def clear_report_search(self):
+        self.report_search_var.set("")
+        self.refresh_faculty_reports()
+
+    def find_similar_reports(self):
+        """Look up reports whose text closely matches the selected one"""
+        selection = self.report_tree.selection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a report to compare")
+            return
+        report_id = self.report_tree.item(selection[0])["values"][0]
+        self.similar_button.config(state="disabled")
+        self.tasks.submit('similar_reports', self.controller.find_similar_reports, report_id,
+                          on_success=lambda similar: self.show_similar_reports(report_id, similar),
+                          on_error=self.on_similar_reports_error)
+
+    def show_similar_reports(self, report_id, similar):
+        self.similar_button.config(state="normal")
+        if not similar:
+            messagebox.showinfo("Similar Reports", f"No reports closely match report #{report_id}.")
+            return
+        lines = [f"#{report['report_id']}  {report['student_name']}  ({report['similarity']:.0%} similar)"
+                 for report in similar[:20]]
+        if len(similar) > 20:
+            lines.append(f"... and {len(similar) - 20} more")
+        messagebox.showinfo("Similar Reports", f"Reports similar to #{report_id}:\n\n" + "\n".join(lines))
+
+    def on_similar_reports_error(self, error):
+        self.similar_button.config(state="normal")
+        messagebox.showerror("Error", f"Could not compare reports: {error}")
+
+    def report_row_values(self, report):
+        return (
+            report["report_id"],
+            report["student_name"],
+            report["submitted_at"].strftime("%Y-%m-%d"),
+            report["grade"] or "Not Graded",
+            (report["comments"][:30] + "...") if report["comments"] else "",
+        )
 
     def submit_evaluation(self):
         """Submit evaluation (grade + comments) for selected report"""
@@ -235,7 +264,13 @@ class DashboardView:
         if not grade:
             messagebox.showwarning("Warning", "Please enter a grade")
             return
-        if self.controller.submit_report_grade(report_id, grade, comments):
+        self.run_action('submit_evaluation', (self.evaluation_button,),
+                        self.controller.submit_report_grade, report_id, grade, comments,
+                        on_success=self.on_evaluation_submitted,
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to submit evaluation: {e}"))
+
+    def on_evaluation_submitted(self, submitted):
+        if submitted:
             messagebox.showinfo("Success", "Evaluation submitted successfully")
             self.refresh_faculty_reports()
             self.grade_var.set("")
@@ -259,8 +294,12 @@ class DashboardView:
 
         ttk.Label(top_frame, text="Faculty Management", font=("Arial", 14, "bold")).pack(side=tk.LEFT)
         ttk.Button(top_frame, text="Refresh", command=self.refresh_faculty_list, style="Success.TButton").pack(side=tk.RIGHT)
-        ttk.Button(top_frame, text="Verify", command=self.verify_selected_faculty, style="Info.TButton").pack(side=tk.RIGHT, padx=(5, 5))
-        ttk.Button(top_frame, text="Remove", command=self.remove_selected_faculty, style="Danger.TButton").pack(side=tk.RIGHT, padx=(0, 10))
+        verify_button = ttk.Button(top_frame, text="Verify", command=self.verify_selected_faculty, style="Info.TButton")
+        verify_button.pack(side=tk.RIGHT, padx=(5, 5))
+        remove_button = ttk.Button(top_frame, text="Remove", command=self.remove_selected_faculty, style="Danger.TButton")
+        remove_button.pack(side=tk.RIGHT, padx=(0, 10))
+        # Both act on the selected row, so both stay disabled while either runs
+        self.faculty_action_buttons = (verify_button, remove_button)
     
         # Filter frame
         filter_frame = ttk.Frame(parent)
@@ -293,7 +332,12 @@ class DashboardView:
         # Scrollbars (correctly assigned to tree_frame)
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.faculty_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.faculty_tree.xview)
-        self.faculty_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.faculty_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.faculty_pager = PagedTreeview(self.faculty_tree, self.tasks, "faculty_list",
+                                           row_id=lambda faculty: faculty["faculty_id"],
+                                           row_values=self.faculty_row_values,
+                                           scrollbar=v_scrollbar,
+                                           on_error=lambda e: print("Failed to load faculty list:", e))
 
         # Grid layout inside tree_frame
         self.faculty_tree.grid(row=0, column=0, sticky="nsew")
@@ -309,13 +353,18 @@ class DashboardView:
         self.refresh_faculty_list()
 
     def load_faculty_departments(self):
-        try:
-            departments = self.controller.get_all_departments()
-            self.dept_name_to_id = {d["name"]: d["department_id"] for d in departments}
-            self.faculty_dept_filter["values"] = list(self.dept_name_to_id.keys())
-        except Exception as e:
-            print(f"Failed to load departments: {e}")
-            messagebox.showerror("Error", f"Failed to load departments: {str(e)}")
+        self.dept_name_to_id = {}
+        self.tasks.submit("faculty_departments", self.controller.get_all_departments,
+                          on_success=self.set_faculty_departments,
+                          on_error=self.on_faculty_departments_error)
+
+    def set_faculty_departments(self, departments):
+        self.dept_name_to_id = {d["name"]: d["department_id"] for d in departments}
+        self.faculty_dept_filter["values"] = list(self.dept_name_to_id.keys())
+
+    def on_faculty_departments_error(self, e):
+        print(f"Failed to load departments: {e}")
+        messagebox.showerror("Error", f"Failed to load departments: {str(e)}")
 
 
     def filter_faculty(self):
@@ -327,58 +376,32 @@ class DashboardView:
         if dept_id is None:
             return
 
-        try:
-            filtered_faculty = self.controller.get_faculties_by_department(dept_id)
-
-            # Clear existing rows
-            for row in self.faculty_tree.get_children():
-                self.faculty_tree.delete(row)
-
-            for faculty in filtered_faculty:
-                faculty_id = faculty.get("faculty_id") or faculty.get("id")
-                name = faculty.get("name")
-                email = faculty.get("email")
-                department = faculty.get("department")
-                created_at = faculty.get("created_at")
-                is_verified = faculty.get("verified", False)
-
-                total_students = self.controller.get_total_students_for_faculty(faculty_id)
-                verification_status = "Verified" if is_verified else "Pending"
-                self.faculty_tree.insert("", "end", values=(
-                    faculty_id, name, email, department, created_at, total_students, verification_status
-                ))
-        except Exception as e:
-            print("Failed to filter faculty list:", e)
+        # A filter replaces any refresh still loading
+        self.faculty_pager.load(
+            lambda after, limit: self.controller.get_faculty_page(dept_id, after, limit),
+            query=('faculty', dept_id))
+
+    def faculty_row_values(self, faculty):
+        faculty_id = faculty.get("faculty_id") or faculty.get("id")
+        name = faculty.get("name")
+        email = faculty.get("email")
+        department = faculty.get("department")
+        created_at = faculty.get("created_at")
+        is_verified = faculty.get("verified", False)
+
+        # Student counts come back with the faculty rows, no per-row query
+        total_students = faculty.get("total_students", 0)
+        verification_status = "Verified" if is_verified else "Pending"
+        return (faculty_id, name, email, department, created_at, total_students, verification_status)
 
     def clear_faculty_filter(self):
         self.faculty_dept_filter.set("")
         self.refresh_faculty_list()
 
     def refresh_faculty_list(self):
-        # Clear previous Treeview rows
-        for row in self.faculty_tree.get_children():
-            self.faculty_tree.delete(row)
-
-        try:
-            faculty_list = self.controller.get_faculty_users()
-
-            for faculty in faculty_list:
-                faculty_id = faculty.get("faculty_id") or faculty.get("id")  # Adjust based on actual DB schema
-                name = faculty.get("name")
-                email = faculty.get("email")
-                department = faculty.get("department")
-                created_at = faculty.get("created_at")
-                is_verified = faculty.get("verified", False)
-
-                # Optional: get total students under this faculty if required
-                total_students = self.controller.get_total_students_for_faculty(faculty_id)
-                verification_status = "Verified" if is_verified else "Pending"
-                self.faculty_tree.insert("", "end", values=(
-                    faculty_id, name, email, department, created_at, total_students, verification_status
-                ))
-
-        except Exception as e:
-            print("Failed to refresh faculty list:", e)
+        self.faculty_pager.load(
+            lambda after, limit: self.controller.get_faculty_page(None, after, limit),
+            query=('faculty', None))
 
     def verify_selected_faculty(self):
         selected_items = self.faculty_tree.selection()
@@ -407,16 +430,22 @@ class DashboardView:
             if not confirm:
                 return
 
-            # Call controller method to verify faculty
-            result = self.controller.verify_faculty(faculty_id)
-            if result:
-                self.refresh_faculty_list()
-                messagebox.showinfo("Success", f"Faculty {faculty_name} has been verified successfully.")
-            else:
-                messagebox.showerror("Error", "Failed to verify faculty. Please try again.")
+            self.run_action('faculty_action', self.faculty_action_buttons, self.controller.verify_faculty, faculty_id,
+                            on_success=lambda result: self.on_faculty_verified(faculty_name, result),
+                            on_error=self.on_faculty_verify_error)
         except Exception as e:
-            print("Failed to verify faculty:", e)
-            messagebox.showerror("Error", "Could not verify faculty.")
+            self.on_faculty_verify_error(e)
+
+    def on_faculty_verified(self, faculty_name, result):
+        if result:
+            self.refresh_faculty_list()
+            messagebox.showinfo("Success", f"Faculty {faculty_name} has been verified successfully.")
+        else:
+            messagebox.showerror("Error", "Failed to verify faculty. Please try again.")
+
+    def on_faculty_verify_error(self, e):
+        print("Failed to verify faculty:", e)
+        messagebox.showerror("Error", "Could not verify faculty.")
 
     def remove_selected_faculty(self):
         selected_item = self.faculty_tree.selection()
@@ -432,13 +461,17 @@ class DashboardView:
         if not confirm:
             return
 
-        try:
-            self.controller.delete_faculty_by_id(faculty_id)
-            self.refresh_faculty_list()
-            messagebox.showinfo("Success", f"Faculty {faculty_name} is removed.")
-        except Exception as e:
-            print("Failed to delete faculty:", e)
-            messagebox.showerror("Error", "Could not remove faculty. Please try again.")
+        self.run_action('faculty_action', self.faculty_action_buttons, self.controller.delete_faculty_by_id, faculty_id,
+                        on_success=lambda _: self.on_faculty_removed(faculty_name),
+                        on_error=self.on_faculty_remove_error)
+
+    def on_faculty_removed(self, faculty_name):
+        self.refresh_faculty_list()
+        messagebox.showinfo("Success", f"Faculty {faculty_name} is removed.")
+
+    def on_faculty_remove_error(self, e):
+        print("Failed to delete faculty:", e)
+        messagebox.showerror("Error", "Could not remove faculty. Please try again.")
 
     # TAB-02: Related To 'View Secretary' Tab
     def setup_view_secretary_tab(self, parent):
@@ -447,7 +480,8 @@ class DashboardView:
 
         ttk.Label(top_frame, text="Secretary Management", font=("Arial", 14, "bold")).pack(side=tk.LEFT)
         ttk.Button(top_frame, text="Refresh", command=self.refresh_secretary_list).pack(side=tk.RIGHT)
-        ttk.Button(top_frame, text="Remove", command=self.remove_selected_secretary).pack(side=tk.RIGHT, padx=(0, 10))
+        self.secretary_remove_button = ttk.Button(top_frame, text="Remove", command=self.remove_selected_secretary)
+        self.secretary_remove_button.pack(side=tk.RIGHT, padx=(0, 10))
 
         filter_frame = ttk.Frame(parent)
         filter_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -475,7 +509,13 @@ class DashboardView:
 
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.secretary_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.secretary_tree.xview)
-        self.secretary_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.secretary_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.secretary_pager = PagedTreeview(self.secretary_tree, self.tasks, "secretary_list",
+                                             row_id=lambda sec: sec["secretary_id"],
+                                             row_values=lambda sec: (sec["secretary_id"], sec["name"], sec["email"],
+                                                                     sec["department"], sec["created_at"]),
+                                             scrollbar=v_scrollbar,
+                                             on_error=lambda e: print("Failed to load secretary list:", e))
 
         self.secretary_tree.grid(row=0, column=0, sticky="nsew")
         v_scrollbar.grid(row=0, column=1, sticky="ns")
@@ -488,28 +528,19 @@ class DashboardView:
         self.refresh_secretary_list()
 
     def load_secretary_departments(self):
-        try:
-            departments = self.controller.get_all_departments()
-            self.sec_dept_name_to_id = {d["name"]: d["department_id"] for d in departments}
-            self.secretary_dept_filter["values"] = list(self.sec_dept_name_to_id.keys())
-        except Exception as e:
-            print("Failed to load departments:", e)
+        self.sec_dept_name_to_id = {}
+        self.tasks.submit("secretary_departments", self.controller.get_all_departments,
+                          on_success=self.set_secretary_departments,
+                          on_error=lambda e: print("Failed to load departments:", e))
+
+    def set_secretary_departments(self, departments):
+        self.sec_dept_name_to_id = {d["name"]: d["department_id"] for d in departments}
+        self.secretary_dept_filter["values"] = list(self.sec_dept_name_to_id.keys())
 
     def refresh_secretary_list(self):
-        for row in self.secretary_tree.get_children():
-            self.secretary_tree.delete(row)
-        try:
-            secretaries = self.controller.get_secretary_users()
-            for sec in secretaries:
-                self.secretary_tree.insert("", "end", values=(
-                sec["secretary_id"], 
-                sec["name"], 
-                sec["email"], 
-                sec["department"], 
-                sec["created_at"]
-            ))
-        except Exception as e:
-            print("Failed to refresh secretary list:", e)
+        self.secretary_pager.load(
+            lambda after, limit: self.controller.get_secretaries_page(None, after, limit),
+            query=('secretaries', None))
 
     def filter_secretary(self):
         selected = self.secretary_dept_filter.get()
@@ -520,21 +551,9 @@ class DashboardView:
         if dept_id is None:
             return
 
-        try:
-            secretaries = self.controller.get_secretaries_by_department(dept_id)
-            for row in self.secretary_tree.get_children():
-                self.secretary_tree.delete(row)
-
-            for sec in secretaries:
-                self.secretary_tree.insert("", "end", values=(
-                sec["secretary_id"], 
-                sec["name"], 
-                sec["email"], 
-                sec["department"], 
-                sec["created_at"]
-            ))
-        except Exception as e:
-            print("Failed to filter secretaries:", e)
+        self.secretary_pager.load(
+            lambda after, limit: self.controller.get_secretaries_page(dept_id, after, limit),
+            query=('secretaries', dept_id))
 
     def clear_secretary_filter(self):
         self.secretary_dept_filter.set("")
@@ -545,7 +564,7 @@ class DashboardView:
         if not selected_item:
             messagebox.showwarning("No Selection", "Please select a secretary to remove.")
             return
-        secretary_values = self.secretary_tree.item(selected_item[0], "values")[0]
+        secretary_values = self.secretary_tree.item(selected_item[0], "values")
         secretary_id = secretary_values[0]
         secretary_name = secretary_values[1]
 
@@ -553,13 +572,18 @@ class DashboardView:
         if not confirm:
             return
 
-        try:
-            self.controller.delete_secretary_by_id(secretary_id)
-            self.refresh_secretary_list()
-            messagebox.showinfo("Success", f"Secretary {secretary_name} is removed.")
-        except Exception as e:
-            print("Failed to delete secretary:", e)
-            messagebox.showerror("Error", "Could not delete secretary. Please try again.")
+        self.run_action('secretary_action', (self.secretary_remove_button,),
+                        self.controller.delete_secretary_by_id, secretary_id,
+                        on_success=lambda _: self.on_secretary_removed(secretary_name),
+                        on_error=self.on_secretary_remove_error)
+
+    def on_secretary_removed(self, secretary_name):
+        self.refresh_secretary_list()
+        messagebox.showinfo("Success", f"Secretary {secretary_name} is removed.")
+
+    def on_secretary_remove_error(self, e):
+        print("Failed to delete secretary:", e)
+        messagebox.showerror("Error", "Could not delete secretary. Please try again.")
     
     # TAB-03: Related To 'View Company' Tab
     def setup_view_company_tab(self, parent):
@@ -572,8 +596,11 @@ class DashboardView:
 
         ttk.Label(top_frame, text="Company Management", font=("Arial", 14, "bold")).pack(side=tk.LEFT)
         ttk.Button(top_frame, text="Refresh", command=self.refresh_company_list, style="Success.TButton").pack(side=tk.RIGHT)
-        ttk.Button(top_frame, text="Verify", command=self.verify_selected_company, style="Info.TButton").pack(side=tk.RIGHT, padx=(5, 5))
-        ttk.Button(top_frame, text="Remove", command=self.remove_selected_company, style="Danger.TButton").pack(side=tk.RIGHT, padx=(0, 10))
+        verify_button = ttk.Button(top_frame, text="Verify", command=self.verify_selected_company, style="Info.TButton")
+        verify_button.pack(side=tk.RIGHT, padx=(5, 5))
+        remove_button = ttk.Button(top_frame, text="Remove", command=self.remove_selected_company, style="Danger.TButton")
+        remove_button.pack(side=tk.RIGHT, padx=(0, 10))
+        self.company_action_buttons = (verify_button, remove_button)
 
         filter_frame = ttk.Frame(parent)
         filter_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -596,7 +623,12 @@ class DashboardView:
 
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.company_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.company_tree.xview)
-        self.company_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.company_tree.configure(xscrollcommand=h_scrollbar.set)
+        self.company_pager = PagedTreeview(self.company_tree, self.tasks, "company_list",
+                                           row_id=lambda comp: comp["company_id"],
+                                           row_values=self.company_row_values,
+                                           scrollbar=v_scrollbar,
+                                           on_error=lambda e: print("Failed to load company list:", e))
 
         self.company_tree.grid(row=0, column=0, sticky="nsew")
         v_scrollbar.grid(row=0, column=1, sticky="ns")
@@ -608,18 +640,15 @@ class DashboardView:
         self.refresh_company_list()
 
     def refresh_company_list(self):
-        for row in self.company_tree.get_children():
-            self.company_tree.delete(row)
-
-        try:
-            companies = self.controller.get_all_companies()
-            for comp in companies:
-                self.company_tree.insert("", "end", values=(
-                    comp["company_id"], comp["name"], comp["contact_person"], comp["phone"],
-                    comp["email"], comp["address"], "Yes" if comp["registered"] else "No"
-                ))
-        except Exception as e:
-            print("Failed to refresh company list:", e)
+        self.company_pager.load(
+            lambda after, limit: self.controller.get_companies_page(None, after, limit),
+            query=('companies', None))
+
+    def company_row_values(self, comp):
+        return (
+            comp["company_id"], comp["name"], comp["contact_person"], comp["phone"],
+            comp["email"], comp["address"], "Yes" if comp["registered"] else "No"
+        )
 
     def filter_company(self):
         selected = self.company_filter.get()
@@ -627,19 +656,9 @@ class DashboardView:
             return
 
         is_registered = selected == "Registered"
-
-        for row in self.company_tree.get_children():
-            self.company_tree.delete(row)
-
-        try:
-            companies = self.controller.get_companies_by_registration(is_registered)
-            for comp in companies:
-                self.company_tree.insert("", "end", values=(
-                    comp["company_id"], comp["name"], comp["contact_person"], comp["phone"],
-                    comp["email"], comp["address"], "Yes" if comp["registered"] else "No"
-                ))
-        except Exception as e:
-            print("Failed to filter companies:", e)
+        self.company_pager.load(
+            lambda after, limit: self.controller.get_companies_page(is_registered, after, limit),
+            query=('companies', is_registered))
 
     def clear_company_filter(self):
         self.company_filter.set("")
@@ -658,13 +677,17 @@ class DashboardView:
         if not confirm:
             return
 
-        try:
-            self.controller.delete_company_by_id(company_id)
-            self.refresh_company_list()
-            messagebox.showinfo("Success", f"{company_name} is removed.")
-        except Exception as e:
-            print("Failed to remove company:", e)
-            messagebox.showerror("Error", "Could not remove company. Please try again.")
+        self.run_action('company_action', self.company_action_buttons, self.controller.delete_company_by_id, company_id,
+                        on_success=lambda _: self.on_company_removed(company_name),
+                        on_error=self.on_company_remove_error)
+
+    def on_company_removed(self, company_name):
+        self.refresh_company_list()
+        messagebox.showinfo("Success", f"{company_name} is removed.")
+
+    def on_company_remove_error(self, e):
+        print("Failed to remove company:", e)
+        messagebox.showerror("Error", "Could not remove company. Please try again.")
 
     def verify_selected_company(self):
         selected_item = self.company_tree.selection()
@@ -674,13 +697,17 @@ class DashboardView:
 
         company_id = self.company_tree.item(selected_item[0], "values")[0]
 
-        try:
-            self.controller.verify_company(company_id)
-            self.refresh_company_list()
-            messagebox.showinfo("Success", f"Company ID {company_id} has been verified.")
-        except Exception as e:
-            print("Failed to verify company:", e)
-            messagebox.showerror("Error", "Could not verify company.")
+        self.run_action('company_action', self.company_action_buttons, self.controller.verify_company, company_id,
+                        on_success=lambda _: self.on_company_verified(company_id),
+                        on_error=self.on_company_verify_error)
+
+    def on_company_verified(self, company_id):
+        self.refresh_company_list()
+        messagebox.showinfo("Success", f"Company ID {company_id} has been verified.")
+
+    def on_company_verify_error(self, e):
+        print("Failed to verify company:", e)
+        messagebox.showerror("Error", "Could not verify company.")
 
 
     # RELATED TO STUDENT TAB
@@ -708,7 +735,15 @@ class DashboardView:
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.app_tree.yview)
-        self.app_tree.configure(yscrollcommand=scrollbar.set)
+        self.app_pager = PagedTreeview(self.app_tree, self.tasks, 'applications',
+                                       row_id=lambda app: app['app_id'],
+                                       row_values=self.application_row_values,
+                                       scrollbar=scrollbar)
+        if self.user['role'] == 'student':
+            student_id = self.user['user_id']
+            self.app_pager.watch(
+                lambda since: self.controller.get_student_application_changes(student_id, since),
+                matches=lambda app: True)
         
         # Pack treeview and scrollbar
         self.app_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -718,10 +753,13 @@ class DashboardView:
 
     def apply_for_internship(self):
         """Show application dialog"""
+        # Dialogs are imported when first opened rather than with the dashboard
+        from trial_project.views.dialogs.application_dialog import ApplicationDialog
         ApplicationDialog(self, self.controller, self.user)
     
     def apply_self_found(self):
         """Show self-found application dialog"""
+        from trial_project.views.dialogs.self_found_dialog import SelfFoundDialog
         SelfFoundDialog(self, self.controller, self.user)
     
     # TAB-02: related to "Available Quotas" tab
@@ -731,15 +769,13 @@ class DashboardView:
         top_frame = ttk.Frame(parent)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Label(top_frame, text="Filter by Department:").pack(side=tk.LEFT)
-        self.dept_filter = ttk.Combobox(top_frame, values=["All", "Computer Science", "Electrical Engineering", "Mechanical Engineering", "Civil Engineering", "Business Administration"])
-        self.dept_filter.set("All")
-        self.dept_filter.pack(side=tk.LEFT, padx=(10, 0))
+        # Facet filters; each option shows how many quotas it leaves
+        self.quota_facets = QuotaFacetPanel(top_frame, on_change=self.filter_quotas)
+        self.quota_facets.pack(side=tk.LEFT)
         
-        ttk.Button(top_frame, text="Apply Filter", 
-                  command=self.filter_quotas).pack(side=tk.LEFT, padx=(10, 0))
-        ttk.Button(top_frame, text="Apply to Selected", 
-                  command=self.apply_to_selected_quota).pack(side=tk.RIGHT)
+        self.apply_quota_button = ttk.Button(top_frame, text="Apply to Selected", 
+                                             command=self.apply_to_selected_quota)
+        self.apply_quota_button.pack(side=tk.RIGHT)
         
         # Treeview for quotas
         columns = ("ID", "Company", "Department", "Slots", "Deadline", "Description")
@@ -751,7 +787,21 @@ class DashboardView:
         
         # Scrollbar
         scrollbar2 = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.quota_tree.yview)
-        self.quota_tree.configure(yscrollcommand=scrollbar2.set)
+        self.quota_pager = PagedTreeview(self.quota_tree, self.tasks, 'quotas',
+                                         row_id=lambda quota: quota['quota_id'],
+                                         row_values=lambda quota: (
+                                             quota['quota_id'], quota['company_name'], quota['department'],
+                                             quota['available_slots'], quota['deadline'],
+                                             (quota['description'] or '')[:50]),
+                                         scrollbar=scrollbar2,
+                                         on_extra=self.quota_facets.update_counts)
+        # The poll runs on a worker thread, so it reads the filters saved by refresh_quotas
+        self.quota_filters = {}
+        self.quota_pager.watch(
+            lambda since: self.controller.get_quota_changes(self.quota_filters.get('department'), since),
+            matches=lambda quota: (quota['available_slots'] > 0
+                                   and quota['deadline'] is not None and quota['deadline'] >= date.today()
+                                   and quota_matches(quota, self.quota_filters)))
         
         # Pack treeview and scrollbar
         self.quota_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -761,22 +811,18 @@ class DashboardView:
 
     def refresh_quotas(self):
         """Refresh quotas list"""
-        department = None if self.dept_filter.get() == "All" else self.dept_filter.get()
-        quotas = self.controller.get_available_quotas(department)
-        
-        # Clear existing items
-        for item in self.quota_tree.get_children():
-            self.quota_tree.delete(item)
-        
-        # Add quotas
-        for quota in quotas:
-            self.quota_tree.insert("", "end", values=(
-                quota['quota_id'], quota['company_name'], quota['department'],
-                quota['available_slots'], quota['deadline'], quota['description'][:50]
-            ))
+        filters = self.quota_facets.filters()
+        self.quota_filters = filters
+        self.quota_pager.load(lambda after, limit: self.fetch_quota_page(filters, after, limit),
+                              query=('quotas', tuple(sorted(filters.items()))))
+    
+    def fetch_quota_page(self, filters, after, limit):
+        """One page of quotas under the facet filters, plus the facet counts with the first page"""
+        page = self.controller.browse_quotas(filters, after, limit)
+        return page['rows'], page['next'], page.get('facets')
     
     def filter_quotas(self):
-        """Filter quotas by department"""
+        """Filter quotas by the selected facets"""
         self.refresh_quotas()
     
     def apply_to_selected_quota(self):
@@ -788,34 +834,44 @@ class DashboardView:
         
         item = self.quota_tree.item(selection[0])
         quota_id = item['values'][0]
+        student_id = self.user['user_id']
         
-        # Get company_id from quota
-        quota_data = self.controller.get_quota_details(quota_id)
-        if quota_data:
-            if self.controller.create_application(self.user['user_id'], quota_data['company_id'], quota_id):
-                messagebox.showinfo("Success", "Application submitted successfully!")
-                self.refresh_applications()
-                self.refresh_quotas()
-            else:
-                messagebox.showerror("Error", "Failed to submit application")
+        def apply():
+            # Get company_id from quota
+            quota_data = self.controller.get_quota_details(quota_id)
+            return bool(quota_data) and self.controller.create_application(student_id, quota_data['company_id'], quota_id)
+        
+        self.run_action('apply_quota', (self.apply_quota_button,), apply,
+                        on_success=self.on_quota_applied,
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to submit application: {e}"))
+    
+    def on_quota_applied(self, applied):
+        if applied:
+            messagebox.showinfo("Success", "Application submitted successfully!")
+            self.refresh_applications()
+            self.refresh_quotas()
+        else:
+            messagebox.showerror("Error", "Failed to submit application")
 
     def refresh_applications(self):
         """Refresh applications list"""
+        # An unopened tab loads fresh data when it is first shown
+        if not self.tabs.is_built("My Applications"):
+            return
         if self.user['role'] == 'student':
-            applications = self.controller.get_student_applications(self.user['user_id'])
-            
-            # Clear existing items
-            for item in self.app_tree.get_children():
-                self.app_tree.delete(item)
-            
-            # Add applications
-            for app in applications:
-                app_type = "Self-Found" if app['self_found'] else "Quota-Based"
-                dept = app['department'] or "N/A"
-                self.app_tree.insert("", "end", values=(
-                    app['app_id'], app['company_name'], dept, 
-                    app['status'].title(), app['application_date'].strftime('%Y-%m-%d'), app_type
-                ))
+            student_id = self.user['user_id']
+            self.app_pager.load(
+                lambda after, limit: self.controller.get_student_applications_page(student_id, after, limit),
+                query=('applications', student_id))
+    
+    def application_row_values(self, app):
+        """Treeview values for one application"""
+        app_type = "Self-Found" if app['self_found'] else "Quota-Based"
+        dept = app['department'] or "N/A"
+        return (
+            app['app_id'], app['company_name'], dept, 
+            app['status'].title(), app['application_date'].strftime('%Y-%m-%d'), app_type
+        )
     
     # TAB-03: related to "Reports" tab
     def setup_reports_tab(self, parent):
@@ -829,8 +885,8 @@ class DashboardView:
         ttk.Entry(upload_frame, textvariable=self.report_path_var, width=50).grid(row=0, column=1, padx=5)
         ttk.Button(upload_frame, text="Browse", command=self.browse_report).grid(row=0, column=2)
         
-        ttk.Button(upload_frame, text="Upload Report", 
-                  command=self.upload_report).grid(row=1, column=0, columnspan=3, pady=10)
+        self.upload_button = ttk.Button(upload_frame, text="Upload Report", command=self.upload_report)
+        self.upload_button.grid(row=1, column=0, columnspan=3, pady=10)
         
     def browse_report(self):
         """Browse for report file"""
@@ -843,8 +899,27 @@ class DashboardView:
         
     def upload_report(self):
         """Upload internship report"""
-        # Implementation for report upload
-        messagebox.showinfo("Info", "Report upload functionality would be implemented here")
+        file_path = self.report_path_var.get().strip()
+        if not file_path or not os.path.isfile(file_path):
+            messagebox.showerror("Error", "Please choose an existing report file.")
+            return
+        
+        # Copying and hashing a large file takes a while, so it runs on a worker
+        self.upload_button.config(state="disabled", text="Uploading...")
+        self.tasks.submit('upload_report', self.controller.upload_report, self.user['user_id'], file_path,
+                          on_success=self.on_report_uploaded, on_error=self.on_report_upload_error)
+    
+    def on_report_uploaded(self, report):
+        self.upload_button.config(state="normal", text="Upload Report")
+        if report:
+            self.report_path_var.set("")
+            messagebox.showinfo("Success", f"Report uploaded ({report['size_bytes'] / 1024:.0f} KB).")
+        else:
+            messagebox.showerror("Error", "Failed to save the report.")
+    
+    def on_report_upload_error(self, error):
+        self.upload_button.config(state="normal", text="Upload Report")
+        messagebox.showerror("Error", f"Report upload failed: {error}")
        
     # RELATED TO SECRETARY TAB
     #TAB-1: related to "Pending Applications" tab
@@ -854,10 +929,13 @@ class DashboardView:
         top_frame = ttk.Frame(parent)
         top_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Button(top_frame, text="Approve Selected", 
-                  command=self.approve_application).pack(side=tk.LEFT)
-        ttk.Button(top_frame, text="Reject Selected", 
-                  command=self.reject_application).pack(side=tk.LEFT, padx=(10, 0))
+        approve_button = ttk.Button(top_frame, text="Approve Selected", 
+                                    command=self.approve_application)
+        approve_button.pack(side=tk.LEFT)
+        reject_button = ttk.Button(top_frame, text="Reject Selected", 
+                                   command=self.reject_application)
+        reject_button.pack(side=tk.LEFT, padx=(10, 0))
+        self.decision_buttons = (approve_button, reject_button)
         ttk.Button(top_frame, text="Refresh", 
                   command=self.refresh_pending_applications).pack(side=tk.RIGHT)
         
@@ -871,7 +949,13 @@ class DashboardView:
         
         # Scrollbar
         scrollbar3 = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self.pending_tree.yview)
-        self.pending_tree.configure(yscrollcommand=scrollbar3.set)
+        self.pending_pager = PagedTreeview(self.pending_tree, self.tasks, 'pending_applications',
+                                           row_id=lambda app: app['app_id'],
+                                           row_values=self.pending_row_values,
+                                           scrollbar=scrollbar3)
+        # New submissions appear and decided ones drop out without a full reload
+        self.pending_pager.watch(self.controller.get_application_changes,
+                                 matches=lambda app: app['status'] == 'pending')
         
         # Pack treeview and scrollbar
         self.pending_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -888,12 +972,7 @@ class DashboardView:
         
         item = self.pending_tree.item(selection[0])
         app_id = item['values'][0]
-        
-        if self.controller.update_application_status(app_id, 'approved'):
-            messagebox.showinfo("Success", "Application approved successfully!")
-            self.refresh_pending_applications()
-        else:
-            messagebox.showerror("Error", "Failed to approve application")
+        self.decide_application(app_id, 'approved')
     
     def reject_application(self):
         """Reject selected application"""
@@ -904,33 +983,37 @@ class DashboardView:
         
         item = self.pending_tree.item(selection[0])
         app_id = item['values'][0]
-        
-        if self.controller.update_application_status(app_id, 'rejected'):
-            messagebox.showinfo("Success", "Application rejected successfully!")
+        self.decide_application(app_id, 'rejected')
+    
+    def decide_application(self, app_id, status):
+        """Record an approval or rejection on a worker"""
+        action = "approve" if status == 'approved' else "reject"
+        self.run_action('application_decision', self.decision_buttons,
+                        self.controller.update_application_status, app_id, status,
+                        on_success=lambda updated: self.on_application_decided(status, updated),
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to {action} application: {e}"))
+    
+    def on_application_decided(self, status, updated):
+        if updated:
+            messagebox.showinfo("Success", f"Application {status} successfully!")
             self.refresh_pending_applications()
         else:
-            messagebox.showerror("Error", "Failed to reject application")
+            action = "approve" if status == 'approved' else "reject"
+            messagebox.showerror("Error", f"Failed to {action} application")
 
     def refresh_pending_applications(self):
         """Refresh pending applications for secretary"""
         if self.user['role'] == 'secretary':
-            applications = self.controller.get_pending_applications()
-            
-            # Clear existing items
-            for item in self.pending_tree.get_children():
-                self.pending_tree.delete(item)
-            
-            # Add applications
-            for app in applications:
-                app_type = "Self-Found" if app['self_found'] else "Quota-Based"
-                dept = app['department'] or "N/A"
-                try:
-                    self.pending_tree.insert("", "end", values=(
-                        app['app_id'], app['student_name'], app['student_email'],
-                        app['company_name'], dept, app['application_date'].strftime('%Y-%m-%d'), app_type
-                    ))
-                except Exception as e:
-                    print("Error inserting pending application row:", e)
+            self.pending_pager.load(self.controller.get_pending_applications_page, query=('pending',))
+
+    def pending_row_values(self, app):
+        """Treeview values for one pending application"""
+        app_type = "Self-Found" if app['self_found'] else "Quota-Based"
+        dept = app['department'] or "N/A"
+        return (
+            app['app_id'], app['student_name'], app['student_email'],
+            app['company_name'], dept, app['application_date'].strftime('%Y-%m-%d'), app_type
+        )
 
     #TAB-2: related to "Assign Faculty" tab
     def setup_faculty_assignment_tab(self, parent):
@@ -949,8 +1032,9 @@ class DashboardView:
         self.student_combo = ttk.Combobox(form_frame, textvariable=self.student_var, width=30)
         self.student_combo.grid(row=1, column=1, padx=5, pady=5)
         
-        ttk.Button(form_frame, text="Assign Faculty", 
-                  command=self.assign_faculty_to_student).grid(row=2, column=0, columnspan=2, pady=10)
+        self.assign_button = ttk.Button(form_frame, text="Assign Faculty", 
+                                        command=self.assign_faculty_to_student)
+        self.assign_button.grid(row=2, column=0, columnspan=2, pady=10)
         
         self.load_faculty_and_students()
 
@@ -966,7 +1050,12 @@ class DashboardView:
         faculty_id = int(faculty_selection.split(':')[0])
         student_id = int(student_selection.split(':')[0])
         
-        if self.controller.assign_faculty(faculty_id, student_id):
+        self.run_action('assign_faculty', (self.assign_button,), self.controller.assign_faculty, faculty_id, student_id,
+                        on_success=self.on_faculty_assigned,
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to assign faculty: {e}"))
+
+    def on_faculty_assigned(self, assigned):
+        if assigned:
             messagebox.showinfo("Success", "Faculty assigned successfully!")
         else:
             messagebox.showerror("Error", "Failed to assign faculty")
@@ -977,12 +1066,16 @@ class DashboardView:
         """Load faculty and students from secretary's department"""
         secretary_id = self.user['user_id']  # This is secretary_id based on login context
 
-        faculty_list = self.controller.get_faculty_by_secretary(secretary_id)
-        student_list = self.controller.get_approved_unassigned_students_by_secretary(secretary_id)
+        self.tasks.submit('assignment_faculty', self.controller.get_faculty_by_secretary, secretary_id,
+                          on_success=self.set_assignment_faculty)
+        self.tasks.submit('assignment_students', self.controller.get_approved_unassigned_students_by_secretary,
+                          secretary_id, on_success=self.set_assignment_students)
 
+    def set_assignment_faculty(self, faculty_list):
         faculty_values = [f"{f['faculty_id']}: {f['name']}" for f in faculty_list]
         self.faculty_combo['values'] = faculty_values
 
+    def set_assignment_students(self, student_list):
         student_values = [f"{s['student_id']}: {s['name']}" for s in student_list]
         self.student_combo['values'] = student_values
     
@@ -1012,8 +1105,9 @@ class DashboardView:
         self.desc_text = tk.Text(form_frame, width=25, height=3)
         self.desc_text.grid(row=3, column=1, padx=5, pady=5)
         
-        ttk.Button(form_frame, text="Create Quota", 
-                  command=self.create_company_quota).grid(row=4, column=0, columnspan=2, pady=10)
+        self.create_quota_button = ttk.Button(form_frame, text="Create Quota", 
+                                              command=self.create_company_quota)
+        self.create_quota_button.grid(row=4, column=0, columnspan=2, pady=10)
         
     def create_company_quota(self):
         """Create new quota for company"""
@@ -1035,7 +1129,13 @@ class DashboardView:
         # For company role, we need to get company_id (simplified here)
         company_id = 1  # This should be properly linked to the company user
         
-        if self.controller.create_quota(company_id, department, slots, deadline, description):
+        self.run_action('create_quota', (self.create_quota_button,),
+                        self.controller.create_quota, company_id, department, slots, deadline, description,
+                        on_success=self.on_quota_created,
+                        on_error=lambda e: messagebox.showerror("Error", f"Failed to create quota: {e}"))
+    
+    def on_quota_created(self, created):
+        if created:
             messagebox.showinfo("Success", "Quota created successfully!")
             # Clear form
             self.quota_dept_var.set("")
@@ -1052,6 +1152,7 @@ class DashboardView:
 
     def logout(self):
         """Logout and return to login screen"""
+        self.tasks.shutdown()
         self.root.destroy()
         self.controller.logout()
     
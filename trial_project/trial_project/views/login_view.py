@@ -5,6 +5,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from trial_project.utils.background_tasks import BackgroundTaskRunner
+
 class LoginView:
     def __init__(self, controller):
         self.controller = controller
@@ -12,6 +14,9 @@ class LoginView:
         self.root.title("Login - Student Internship System")
         self.root.geometry("400x350")
         self.root.resizable(False, False)
+        # Password verification is deliberately slow, so it runs off the UI thread
+        self.tasks = BackgroundTaskRunner(self.root, max_workers=2)
+        self.connecting = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -32,13 +37,15 @@ class LoginView:
 
         # Role
         ttk.Label(frame, text="Role:").pack(anchor=tk.W, pady=(10, 0))
-        self.role_var = tk.StringVar(value="Student")
+        # "Any" finds the account by email alone
+        self.role_var = tk.StringVar(value="Any")
         role_combo = ttk.Combobox(frame, textvariable=self.role_var,
-                                  values=["Student", "Faculty", "Secretary", "Company", "Admin"],
+                                  values=["Any", "Student", "Faculty", "Secretary", "Company", "Admin"],
                                   state="readonly", width=28)
         role_combo.pack()
 
-        ttk.Button(frame, text="Login", command=self.login).pack(pady=20)
+        self.login_button = ttk.Button(frame, text="Login", command=self.login)
+        self.login_button.pack(pady=20)
 
         # Register link
         reg_label = tk.Label(frame, text="Don't Have an Account? Register Here!", foreground="blue", cursor="hand2")
@@ -54,16 +61,37 @@ class LoginView:
             messagebox.showerror("Error", "Please fill in all fields.")
             return
 
+        self.login_button.config(state="disabled", text="Signing in...")
         self.controller.login(email, password, role)
 
+    def login_finished(self):
+        """Re-enable the form after a failed login"""
+        self.login_button.config(state="normal", text="Login")
+
+    def set_connecting(self, connecting):
+        """Hold the Login button while the database connects; the fields stay editable"""
+        self.connecting = connecting
+        if connecting:
+            self.login_button.config(state="disabled", text="Connecting...")
+        else:
+            self.login_finished()
+
+    def set_unavailable(self):
+        """Leave the form disabled after the database could not be reached"""
+        self.connecting = True
+        self.login_button.config(state="disabled", text="Database unavailable")
+
     def open_registration(self):
+        if self.connecting:
+            messagebox.showinfo("Please Wait", "Still connecting to the database.")
+            return
         RegistrationRoleSelector(self.controller)
 
     def clear_forms(self):
         """Clear login form fields"""
         self.email_entry.delete(0, tk.END)
         self.password_entry.delete(0, tk.END)
-        self.role_var.set("Student")
+        self.role_var.set("Any")
 
     def run(self):
         self.root.mainloop()
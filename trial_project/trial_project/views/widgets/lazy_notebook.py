@@ -0,0 +1,43 @@
+from tkinter import ttk
+from typing import Callable, Dict, Optional, Set, Tuple
+
+
+class LazyNotebook:
+    """Adds Notebook tabs whose contents, and so their queries, are built on first selection"""
+
+    # The notebook selects the first tab added, so that one is built right
+    # away; the rest wait for <<NotebookTabChanged>>. With lazy=False every tab
+    # is built as it is added, as the dashboards used to do.
+
+    def __init__(self, notebook: ttk.Notebook, lazy: bool = True):
+        self.notebook = notebook
+        self.lazy = lazy
+        self._pending: Dict[str, Tuple[str, Callable]] = {}
+        self._built: Set[str] = set()
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, text: str, build: Optional[Callable] = None) -> ttk.Frame:
+        """Add a tab; build(frame) fills it in when it is first shown"""
+        first = not self.notebook.tabs()
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=text)
+        if build is None or not self.lazy or first:
+            self._build(text, build, frame)
+        else:
+            self._pending[str(frame)] = (text, build)
+        return frame
+
+    def is_built(self, text: str) -> bool:
+        """Whether a tab's contents exist, so refreshing it is meaningful"""
+        return text in self._built
+
+    def _build(self, text: str, build: Optional[Callable], frame: ttk.Frame):
+        self._built.add(text)
+        if build:
+            build(frame)
+
+    def _on_tab_changed(self, event=None):
+        selected = self.notebook.select()
+        entry = self._pending.pop(selected, None)
+        if entry:
+            self._build(entry[0], entry[1], self.notebook.nametowidget(selected))
@@ -0,0 +1,208 @@
+import tkinter as tk
+from typing import Callable, Dict, Hashable, Optional
+
+from trial_project.views.widgets.tree_diff import apply_row_diff
+
+PAGE_SIZE = 200
+# Fetch the next page once the bottom of the view is this close to the last loaded row
+PREFETCH_THRESHOLD = 0.9
+# How often a watched view asks the change feed for updated rows
+CHANGE_POLL_INTERVAL_MS = 5000
+
+
+class PagedTreeview:
+    """Fills an existing Treeview one keyset page at a time as the user scrolls"""
+
+    def __init__(self, tree, tasks, key: str, row_id: Callable, row_values: Callable,
+                 scrollbar=None, page_size: int = PAGE_SIZE, on_loaded: Optional[Callable] = None,
+                 on_error: Optional[Callable] = None, on_extra: Optional[Callable] = None):
+        self.tree = tree
+        self.tasks = tasks
+        self.key = key
+        self.row_id = row_id
+        self.row_values = row_values
+        self.scrollbar = scrollbar
+        self.page_size = page_size
+        self.on_loaded = on_loaded
+        self.on_error = on_error
+        # fetch_page may return (rows, cursor, extra); extra goes to on_extra on the Tk thread
+        self.on_extra = on_extra
+
+        self.fetch_page = None
+        self.query = None
+        self.shown: Dict[str, tuple] = {}
+        self.cursor = None
+        self.has_more = False
+        self.loading = False
+        self.loaded = 0
+
+        self.fetch_changes = None
+        self.matches = None
+        self.since = None
+        self.poll_interval_ms = CHANGE_POLL_INTERVAL_MS
+
+        self.tree.configure(yscrollcommand=self._on_yscroll)
+
+    def load(self, fetch_page: Callable, query: Optional[Hashable] = None):
+        """Page through fetch_page(after, limit); a repeat of the query on screen is diffed in place"""
+        if query is not None and query == self.query and self.loaded:
+            self.refresh(fetch_page)
+            return
+
+        self.fetch_page = fetch_page
+        self.query = query
+        self.cursor = None
+        self.has_more = True
+        self.loading = False
+        self.loaded = 0
+        self.shown.clear()
+        self.tree.delete(*self.tree.get_children())
+        self.load_next_page()
+
+    def reload(self):
+        """Load the current query again from the first page"""
+        if self.fetch_page:
+            self.load(self.fetch_page)
+
+    def refresh(self, fetch_page: Optional[Callable] = None):
+        """Re-read the rows already loaded and apply only the differences"""
+        if fetch_page:
+            self.fetch_page = fetch_page
+        if not self.fetch_page:
+            return
+        self.loading = True
+        # One query for the whole loaded window so the diff sees every visible row;
+        # the shared task key also supersedes a page load still in flight
+        limit = max(self.loaded, self.page_size)
+        self.tasks.submit(self.key, self.fetch_page, None, limit,
+                          on_success=self._apply_refresh, on_error=self._on_error)
+
+    def load_next_page(self):
+        if self.loading or not self.has_more or not self.fetch_page:
+            return
+        self.loading = True
+        # Same task key for every page, so load() supersedes a page still in flight
+        self.tasks.submit(self.key, self.fetch_page, self.cursor, self.page_size,
+                          on_success=self._append_page, on_error=self._on_error)
+
+    def _append_page(self, page):
+        rows, next_cursor = self._unpack(page)
+        for row in rows:
+            iid = str(self.row_id(row))
+            if self.tree.exists(iid):
+                continue
+            try:
+                values = tuple(self.row_values(row))
+                self.tree.insert("", tk.END, iid=iid, values=values)
+                self.shown[iid] = values
+            except Exception as e:
+                print(f"Error inserting row {iid} into {self.key}: {e}")
+
+        self.loaded += len(rows)
+        self.cursor = next_cursor
+        self.has_more = next_cursor is not None
+        self.loading = False
+        if self.on_loaded:
+            self.on_loaded(self.loaded, self.has_more)
+
+        # A short first page may not fill the view, so no scroll event would follow
+        self.tree.after_idle(self._check_prefetch)
+
+    def watch(self, fetch_changes: Callable, matches: Optional[Callable] = None,
+              interval_ms: int = CHANGE_POLL_INTERVAL_MS):
+        """Poll fetch_changes(since) -> (rows, version) on a timer and apply the deltas"""
+        # matches(row) tells whether a changed row still belongs in this view;
+        # without it the feed is trusted to return only rows the view shows
+        self.fetch_changes = fetch_changes
+        self.matches = matches
+        self.poll_interval_ms = interval_ms
+        self._poll()
+
+    def apply_changes(self, rows):
+        """Update or drop changed rows in place, re-reading the window only when a new row appears"""
+        needs_refresh = False
+        for row in rows:
+            iid = str(self.row_id(row))
+            if self.matches and not self.matches(row):
+                if self.tree.exists(iid):
+                    self.tree.delete(iid)
+                    self.shown.pop(iid, None)
+                    self.loaded -= 1
+            elif self.tree.exists(iid):
+                values = tuple(self.row_values(row))
+                if self.shown.get(iid) != values:
+                    self.tree.item(iid, values=values)
+                    self.shown[iid] = values
+            else:
+                # Where a new row sorts is up to the page query
+                needs_refresh = True
+
+        if needs_refresh:
+            self.refresh()
+        elif self.on_loaded:
+            self.on_loaded(self.loaded, self.has_more)
+
+    def _poll(self):
+        # Skip a round while a page is loading; the overlap window re-delivers its changes
+        if self.fetch_changes and not self.loading and not self.tasks.is_busy(self.key + ':changes'):
+            self.tasks.submit(self.key + ':changes', self.fetch_changes, self.since,
+                              on_success=self._on_changes)
+        try:
+            self.tree.after(self.poll_interval_ms, self._poll)
+        except tk.TclError:
+            pass  # Widget destroyed
+
+    def _on_changes(self, result):
+        rows, version = result
+        if not rows:
+            self.since = version
+        elif not self.loading:
+            self.apply_changes(rows)
+            self.since = version
+        # Rows dropped while a page loads are fetched again from the old version next round
+
+    def _apply_refresh(self, page):
+        rows, next_cursor = self._unpack(page)
+        try:
+            counts = apply_row_diff(self.tree, rows, self.row_id, self.row_values, self.shown)
+        except Exception as e:
+            print(f"Error refreshing rows of {self.key}: {e}")
+            counts = None
+
+        self.loaded = len(rows)
+        self.cursor = next_cursor
+        self.has_more = next_cursor is not None
+        self.loading = False
+        if counts is None:
+            # Leave the tree consistent rather than half-diffed
+            self.load(self.fetch_page)
+            return
+        if self.on_loaded:
+            self.on_loaded(self.loaded, self.has_more)
+
+    def _unpack(self, page):
+        rows, next_cursor, *extra = page
+        if extra and extra[0] is not None and self.on_extra:
+            self.on_extra(extra[0])
+        return rows, next_cursor
+
+    def _on_error(self, error):
+        self.loading = False
+        if self.on_error:
+            self.on_error(error)
+        else:
+            print(f"Failed to load page for {self.key}: {error}")
+
+    def _on_yscroll(self, first, last):
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        if float(last) >= PREFETCH_THRESHOLD:
+            self.load_next_page()
+
+    def _check_prefetch(self):
+        try:
+            _, last = self.tree.yview()
+        except tk.TclError:
+            return  # Widget destroyed
+        if last >= PREFETCH_THRESHOLD:
+            self.load_next_page()
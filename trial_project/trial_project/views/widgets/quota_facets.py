@@ -0,0 +1,73 @@
+import tkinter as tk
+from datetime import date, timedelta
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Tuple
+
+FACET_LABELS = (
+    ('department', "Department:"),
+    ('company_id', "Company:"),
+    ('deadline_within', "Deadline:"),
+    ('min_slots', "Free slots:"),
+)
+
+
+class QuotaFacetPanel:
+    """Quota filters whose options show how many open quotas picking them leaves"""
+
+    # Options come from DatabaseModel.get_quota_facets; until the first counts
+    # arrive every facet offers only "All". Picking an option calls on_change.
+
+    def __init__(self, parent, on_change: Callable[[], None]):
+        self.frame = ttk.Frame(parent)
+        self.on_change = on_change
+        self.selected: Dict[str, Any] = {facet: None for facet, _ in FACET_LABELS}
+        self.options: Dict[str, Dict[str, Any]] = {}
+        self.boxes: Dict[str, ttk.Combobox] = {}
+        for facet, label in FACET_LABELS:
+            ttk.Label(self.frame, text=label).pack(side=tk.LEFT, padx=(0, 5))
+            box = ttk.Combobox(self.frame, state="readonly", width=22 if facet == 'company_id' else 16)
+            box.pack(side=tk.LEFT, padx=(0, 10))
+            box.bind("<<ComboboxSelected>>", lambda e, facet=facet: self._select(facet))
+            self.boxes[facet] = box
+            self._set_options(facet, [("All", None)])
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def filters(self) -> Dict[str, Any]:
+        """Selected value of every facet that is filtered"""
+        return {facet: value for facet, value in self.selected.items() if value is not None}
+
+    def update_counts(self, facets: Dict[str, Dict[str, Any]]):
+        """Show fresh counts, keeping each facet's selection"""
+        for facet, _ in FACET_LABELS:
+            counts = facets.get(facet)
+            if not counts:
+                continue
+            choices = [(f"All ({counts['all']})", None)]
+            choices += [(f"{option['label']} ({option['count']})", option['value']) for option in counts['options']]
+            selected = self.selected[facet]
+            if selected is not None and all(value != selected for _, value in choices):
+                # Outside the listed options now (e.g. not a top company); nothing left to count
+                choices.append((f"{selected} (0)", selected))
+            self._set_options(facet, choices)
+
+    def _set_options(self, facet: str, choices: List[Tuple[str, Any]]):
+        box = self.boxes[facet]
+        self.options[facet] = dict(choices)
+        box.configure(values=[text for text, _ in choices])
+        box.set(next(text for text, value in choices if value == self.selected[facet]))
+
+    def _select(self, facet: str):
+        self.selected[facet] = self.options[facet].get(self.boxes[facet].get())
+        self.on_change()
+
+
+def quota_matches(quota: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    """Whether an open quota satisfies the selected facet values, for rows arriving by change feed"""
+    within = filters.get('deadline_within')
+    return (filters.get('department') in (None, quota['department'])
+            and filters.get('company_id') in (None, quota['company_id'])
+            and (within is None or (quota['deadline'] is not None
+                                    and quota['deadline'] <= date.today() + timedelta(days=within)))
+            and quota['available_slots'] >= filters.get('min_slots', 1))
@@ -0,0 +1,52 @@
+from typing import Callable, Dict, Iterable
+
+
+def apply_row_diff(tree, rows: Iterable, row_id: Callable, row_values: Callable,
+                   shown: Dict[str, tuple]) -> Dict[str, int]:
+    """Bring a Treeview in line with rows, touching only rows that were added, changed, moved or removed"""
+    # shown maps iid -> values last written to the tree; Tk hands values back
+    # with converted types, so comparing against tree.item() is unreliable
+    wanted = []
+    wanted_ids = set()
+    for row in rows:
+        iid = str(row_id(row))
+        if iid in wanted_ids:
+            continue
+        wanted_ids.add(iid)
+        wanted.append((iid, tuple(row_values(row))))
+
+    counts = {'inserted': 0, 'updated': 0, 'moved': 0, 'deleted': 0}
+
+    # Remove vanished rows first so the remaining children keep their relative order
+    for iid in tree.get_children():
+        if iid not in wanted_ids:
+            tree.delete(iid)
+            shown.pop(iid, None)
+            counts['deleted'] += 1
+
+    # Walk the wanted order against the current order; after each step the
+    # first `index` children are already correct, so only out-of-place rows move
+    children = tree.get_children()
+    placed = set()
+    position = 0
+    for index, (iid, values) in enumerate(wanted):
+        while position < len(children) and children[position] in placed:
+            position += 1
+
+        if tree.exists(iid):
+            if shown.get(iid) != values:
+                tree.item(iid, values=values)
+                counts['updated'] += 1
+            if position < len(children) and children[position] == iid:
+                position += 1
+            else:
+                tree.move(iid, "", index)
+                counts['moved'] += 1
+        else:
+            tree.insert("", index, iid=iid, values=values)
+            counts['inserted'] += 1
+
+        shown[iid] = values
+        placed.add(iid)
+
+    return counts